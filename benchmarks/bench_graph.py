@@ -0,0 +1,99 @@
+"""
+Benchmark of task graph construction and process startup, networkx against the native Dag.
+
+Graph construction builds the message graph of a random layered application the way the schedulers used to
+(one ``nx.DiGraph`` per algorithm, five per request) and the way they do now (one ``Dag`` per request).
+Startup time is the wall time of a fresh interpreter importing the scheduling modules, with and without networkx.
+
+Usage:
+    python benchmarks/bench_graph.py [--tasks 1000 10000 50000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+from array import array
+
+script_dir = os.path.dirname(__file__)
+src_dir = os.path.abspath(os.path.join(script_dir, "..", "src"))
+sys.path.append(src_dir)
+from dag import Dag
+
+ALGORITHMS_PER_REQUEST = 5
+
+
+def random_edges(tasks, fan_in=3, seed=0):
+    """Return the edges of a random DAG where every task depends on up to ``fan_in`` earlier tasks."""
+    rng = random.Random(seed)
+    senders, receivers = array("q"), array("q")
+    for receiver in range(1, tasks):
+        for sender in rng.sample(range(receiver), min(fan_in, receiver)):
+            senders.append(sender)
+            receivers.append(receiver)
+    return senders, receivers
+
+
+def best_of(repeat, function, *args):
+    """Return the fastest wall time of ``repeat`` calls in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def build_networkx(tasks, senders, receivers):
+    import networkx as nx
+
+    for _ in range(ALGORITHMS_PER_REQUEST):
+        graph = nx.DiGraph()
+        graph.add_nodes_from(range(tasks))
+        graph.add_edges_from(zip(senders, receivers))
+
+
+def build_dag(tasks, senders, receivers):
+    Dag(tasks, senders, receivers).topological_order()
+
+
+def startup_time(statement, repeat):
+    """Return the fastest wall time of a fresh interpreter running ``statement``."""
+    command = [sys.executable, "-c", f"import sys; sys.path.insert(0, {src_dir!r}); {statement}"]
+    return best_of(repeat, subprocess.run, command)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    try:
+        import networkx  # noqa: F401
+        has_networkx = True
+    except ImportError:
+        has_networkx = False
+        print("networkx is not installed, only the Dag is measured\n")
+
+    print(f"Graph construction per request ({ALGORITHMS_PER_REQUEST} algorithms)")
+    print(f"{'tasks':>8} {'edges':>8} {'networkx [ms]':>14} {'Dag [ms]':>10}")
+    for tasks in args.tasks:
+        senders, receivers = random_edges(tasks)
+        before = best_of(args.repeat, build_networkx, tasks, senders, receivers) if has_networkx else float("nan")
+        after = best_of(args.repeat, build_dag, tasks, senders, receivers)
+        print(f"{tasks:>8} {len(senders):>8} {before * 1e3:>14.1f} {after * 1e3:>10.1f}")
+
+    print("\nProcess startup")
+    baseline = startup_time("pass", args.repeat)
+    if has_networkx:
+        before = startup_time("import networkx, model, algorithms", args.repeat)
+        print(f"  with networkx:    {(before - baseline) * 1e3:8.1f} ms")
+    after = startup_time("import model, algorithms", args.repeat)
+    print(f"  without networkx: {(after - baseline) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
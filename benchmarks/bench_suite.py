@@ -0,0 +1,203 @@
+"""
+Benchmark suite of the scheduling algorithms and the /schedule_jobs endpoint on synthetic models.
+
+Every case is an application generated by ``generators`` with a given task graph shape and number of tasks,
+scheduled on a generated mesh or tree platform. For every case the suite measures:
+
+- every registered algorithm on the compiled models, as run by the server for a request,
+- the full /schedule_jobs path through the ASGI app: the body is streamed in, parsed, validated, compiled and
+  scheduled with the same algorithms, and the response is encoded and validated. The response cache is disabled,
+  the platform cache is warm after the first call as it is for a server receiving the same platform.
+
+The time is the fastest of ``--repeat`` runs. The peak memory is measured with tracemalloc in one extra run, as
+the memory allocated on top of what was allocated before the run, since tracing slows the run down.
+
+Results are saved to a JSON file, by default ``benchmarks/results/<commit>.json``, together with the commit, the
+Python version and the settings of the run. ``--compare`` prints the results next to those of an earlier run and
+exits with status 1 if any case got slower or bigger than the threshold, e.g. to compare a branch against main.
+
+The largest cases take a long time with the defaults, mostly in the traced runs: ``--tasks`` and ``--shapes`` narrow
+the run down, ``--no-memory`` skips the traced runs.
+
+Usage:
+    python benchmarks/bench_suite.py [--tasks 100 1000 10000 100000 1000000] [--shapes layered fork_join chain random]
+        [--platform mesh:4x4x1] [--repeat 3] [--output results.json] [--compare benchmarks/results/abc123.json]
+"""
+
+import argparse
+import json
+import os
+import platform as host
+import subprocess
+import sys
+import time
+import tracemalloc
+
+script_dir = os.path.dirname(__file__)
+src_dir = os.path.abspath(os.path.join(script_dir, "..", "src"))
+sys.path.append(src_dir)
+import algorithms as alg
+import generators
+from bench_graph import best_of
+from topology import compile_platform
+
+ENDPOINT = "schedule_jobs"
+
+## Measurements compared by --compare, with their unit for the report
+METRICS = {"seconds": "s", "peak_bytes": "B"}
+
+
+def peak_memory(function, *args):
+    """Return the peak number of bytes allocated by a call on top of what was allocated before."""
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(function, args, repeat, memory):
+    """Return the fastest time of ``repeat`` calls and, if ``memory`` is set, the peak memory of one more."""
+    record = {"seconds": best_of(repeat, function, *args)}
+    if memory:
+        record["peak_bytes"] = peak_memory(function, *args)
+    return record
+
+
+def endpoint_client():
+    """Return a test client of the app with the response cache disabled."""
+    import backend
+    from fastapi.testclient import TestClient
+
+    backend.result_cache = None
+    return TestClient(backend.app)
+
+
+def post_schedule_jobs(client, chunks, algorithms, communication):
+    response = client.post("/schedule_jobs", content=iter(chunks),
+                           params={"algorithms": algorithms, "communication": communication},
+                           headers={"Content-Type": "application/json"})
+    if response.status_code != 200:
+        raise RuntimeError(f"/schedule_jobs answered {response.status_code}: {response.text[:200]}")
+
+
+def commit():
+    """Return the current commit of the repository, marked as dirty if there are uncommitted changes."""
+    try:
+        head = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=script_dir, capture_output=True,
+                              text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=script_dir,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return head + "-dirty" if status.strip() else head
+
+
+def run(args):
+    """Run every case and return the list of result records."""
+    platform_data = generators.platform(args.platform, seed=args.seed)
+    platform = compile_platform(platform_data)
+    client = endpoint_client() if args.endpoint else None
+    results = []
+
+    print(f"{'shape':>10} {'tasks':>8} {'edges':>8} {'target':>16} {'time [ms]':>11} {'peak [MiB]':>11}")
+    for shape in args.shapes:
+        for tasks in args.tasks:
+            application = generators.application(shape, tasks, args.density, args.seed)
+            application.graph.topological_order()
+            case = {"shape": shape, "tasks": tasks, "edges": len(application.size), "platform": args.platform}
+
+            targets = [(name, alg.run_algorithm, (name, application, platform, args.communication))
+                       for name in args.algorithms]
+            if client is not None:
+                chunks = list(generators.iter_request(application, platform_data))
+                targets.append((ENDPOINT, post_schedule_jobs, (client, chunks, args.algorithms, args.communication)))
+
+            for target, function, function_args in targets:
+                record = dict(case, target=target, **measure(function, function_args, args.repeat, args.memory))
+                results.append(record)
+                peak = f"{record['peak_bytes'] / 2 ** 20:>11.1f}" if "peak_bytes" in record else f"{'-':>11}"
+                print(f"{shape:>10} {tasks:>8} {case['edges']:>8} {target:>16} {record['seconds'] * 1e3:>11.1f} {peak}",
+                      flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the results next to those of an earlier run.
+
+    Args:
+        results (list of dict): Records of this run.
+        baseline (dict): Saved results of the earlier run.
+        threshold (float): Relative increase of a measurement that counts as a regression, e.g. 0.1 for 10 %.
+
+    Returns:
+        int: Number of regressions.
+    """
+    def key(record):
+        return record["shape"], record["tasks"], record["platform"], record["target"]
+
+    before = {key(record): record for record in baseline["results"]}
+    regressions = 0
+    print(f"\nCompared to {baseline['commit']}, regressions are more than {threshold:.0%} above the baseline")
+    print(f"{'shape':>10} {'tasks':>8} {'target':>16} {'metric':>11} {'before':>12} {'after':>12} {'ratio':>7}")
+    for record in results:
+        old = before.get(key(record))
+        if old is None:
+            continue
+        for metric, unit in METRICS.items():
+            if metric not in record or not old.get(metric):
+                continue
+            ratio = record[metric] / old[metric]
+            regressed = ratio > 1 + threshold
+            regressions += regressed
+            print(f"{record['shape']:>10} {record['tasks']:>8} {record['target']:>16} {metric:>11} "
+                  f"{old[metric]:>11.4g}{unit} {record[metric]:>11.4g}{unit} {ratio:>7.2f}"
+                  f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100, 1000, 10000, 100000, 1000000])
+    parser.add_argument("--shapes", nargs="+", choices=list(generators.SHAPES), default=list(generators.SHAPES))
+    parser.add_argument("--density", type=int,
+                        help="Fan-in of layered and random graphs, branches per fork-join stage, number of chains")
+    parser.add_argument("--platform", default="mesh:4x4x1", help="e.g. mesh:4x4x1 or tree:3x2x2")
+    parser.add_argument("--algorithms", nargs="+", choices=list(alg.ALGORITHMS), default=list(alg.ALGORITHMS))
+    parser.add_argument("--communication", action="store_true", help="Run the communication-aware schedules")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-endpoint", dest="endpoint", action="store_false", help="Skip /schedule_jobs")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="Skip the peak memory runs")
+    parser.add_argument("--output", help="Results file, benchmarks/results/<commit>.json by default")
+    parser.add_argument("--compare", help="Results file of an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Regression threshold of --compare")
+    args = parser.parse_args()
+    try:
+        generators.platform(args.platform)
+    except ValueError as err:
+        parser.error(str(err))
+
+    revision = commit()
+    results = run(args)
+
+    output = args.output or os.path.join(script_dir, "results", f"{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    settings = {name: value for name, value in vars(args).items() if name not in ("output", "compare", "threshold")}
+    with open(output, "w") as f:
+        json.dump({"commit": revision, "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "python": sys.version,
+                   "machine": host.platform(), "settings": settings, "results": results}, f, indent=1)
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"{regressions} regressions")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
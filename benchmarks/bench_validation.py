@@ -0,0 +1,76 @@
+"""
+Benchmark of input and output validation throughput.
+
+Compares three ways of validating a /schedule_jobs payload against the schemas in ``src``:
+``jsonschema.validate`` as called per request before (builds the validator and checks the schema on every call),
+a validator built once, and the SchemaValidator with its fast structural check.
+
+Usage:
+    python benchmarks/bench_validation.py [--tasks 10000 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+import jsonschema
+from jsonschema.validators import validator_for
+
+script_dir = os.path.dirname(__file__)
+src_dir = os.path.abspath(os.path.join(script_dir, "..", "src"))
+sys.path.append(src_dir)
+import algorithms as alg
+from bench_graph import best_of, random_edges
+from validation import SchemaValidator
+
+
+def random_request(tasks, nodes=16, seed=0):
+    """Return a /schedule_jobs payload with a random application of ``tasks`` tasks."""
+    rng = random.Random(seed)
+    senders, receivers = random_edges(tasks, seed=seed)
+    return {
+        "application": {
+            "tasks": [{"id": i, "wcet": rng.randint(1, 50), "mcet": rng.randint(1, 25),
+                       "deadline": rng.randint(100, 100 * tasks)} for i in range(tasks)],
+            "messages": [{"id": k, "sender": s, "receiver": r, "size": rng.randint(1, 100)}
+                         for k, (s, r) in enumerate(zip(senders, receivers))],
+        },
+        "platform": {
+            "nodes": [{"id": k, "type": "compute"} for k in range(nodes)],
+            "links": [{"id": k, "start_node": k, "end_node": k + 1, "link_delay": 1, "bandwidth": 100,
+                       "type": "ethernet"} for k in range(nodes - 1)],
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    schemas = {}
+    for name in ("input", "output"):
+        with open(os.path.join(src_dir, f"{name}_schema.json")) as f:
+            schemas[name] = json.load(f)
+
+    print(f"{'payload':>8} {'tasks':>8} {'validate() [ms]':>16} {'prebuilt [ms]':>14} "
+          f"{'fast [ms]':>10} {'fast [tasks/s]':>15}")
+    for tasks in args.tasks:
+        request = random_request(tasks)
+        schedule = alg.edf_multinode(request["application"], request["platform"])
+        for name, payload in (("input", request), ("output", schedule)):
+            schema = schemas[name]
+            prebuilt = validator_for(schema)(schema)
+            validator = SchemaValidator(schema)
+            before = best_of(args.repeat, lambda: jsonschema.validate(payload, schema))
+            built = best_of(args.repeat, prebuilt.validate, payload)
+            after = best_of(args.repeat, validator.validate, payload)
+            print(f"{name:>8} {tasks:>8} {before * 1e3:>16.1f} {built * 1e3:>14.1f} "
+                  f"{after * 1e3:>10.1f} {tasks / after:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
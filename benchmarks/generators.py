@@ -0,0 +1,306 @@
+"""
+Seeded generators of synthetic applications and platforms for the benchmarks.
+
+Every generator is deterministic for a given seed, so a benchmark case is reproduced exactly on every commit.
+Task graphs are returned as parallel sender/receiver arrays of task indices where every edge goes from a lower to
+a higher index, so the graphs are acyclic and the task order is a topological order. The applications are built as
+compiled ApplicationModels, a dict with a million tasks would dwarf what is being measured, and encoded to the JSON
+input format chunk by chunk for the benchmarks of the endpoints.
+
+Task graphs:
+- layered_edges: Tasks in layers, every task depends on tasks of the previous layer.
+- fork_join_edges: Stages of a fork task, parallel branches and a join task, one stage after the other.
+- chain_edges: Independent chains of tasks.
+- random_edges: Every task depends on random earlier tasks.
+
+Platforms:
+- mesh_platform: A grid of routers with compute nodes attached to every router.
+- tree_platform: A tree of routers with compute nodes attached to the leaves.
+"""
+
+import json
+import math
+import os
+import random
+import sys
+from array import array
+from itertools import islice
+
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from model import ApplicationModel
+
+
+def layered_edges(tasks, fan_in=3, width=None, seed=0):
+    """
+    Edges of a layered DAG.
+
+    Args:
+        tasks (int): Number of tasks.
+        fan_in (int): Number of predecessors of every task outside the first layer, at most the layer width.
+        width (int, optional): Tasks per layer, the square root of ``tasks`` if omitted.
+        seed (int): Seed of the random choice of the predecessors.
+
+    Returns:
+        tuple: The sender and receiver arrays.
+    """
+    rng = random.Random(seed)
+    width = width or max(1, math.isqrt(tasks))
+    senders, receivers = array("q"), array("q")
+    for start in range(width, tasks, width):
+        previous = range(start - width, start)
+        for receiver in range(start, min(start + width, tasks)):
+            for sender in rng.sample(previous, min(fan_in, width)):
+                senders.append(sender)
+                receivers.append(receiver)
+    return senders, receivers
+
+
+def fork_join_edges(tasks, width=8, depth=1, seed=0):
+    """
+    Edges of a sequence of fork-join stages.
+
+    A stage is a fork task, ``width`` parallel branches of ``depth`` tasks each and a join task, the join task is the
+    fork task of the next stage. The last stage is cut off at ``tasks`` tasks.
+
+    Args:
+        tasks (int): Number of tasks.
+        width (int): Number of parallel branches per stage.
+        depth (int): Number of tasks per branch.
+        seed (int): Unused, the shape is fixed by the other arguments.
+
+    Returns:
+        tuple: The sender and receiver arrays.
+    """
+    senders, receivers = array("q"), array("q")
+
+    def edge(sender, receiver):
+        if receiver < tasks:
+            senders.append(sender)
+            receivers.append(receiver)
+
+    fork = 0
+    while fork < tasks - 1:
+        join = fork + width * depth + 1
+        for branch in range(width):
+            first = fork + 1 + branch * depth
+            edge(fork, first)
+            for task in range(first, first + depth - 1):
+                edge(task, task + 1)
+            edge(first + depth - 1, join)
+        fork = join
+    return senders, receivers
+
+
+def chain_edges(tasks, chains=1, seed=0):
+    """
+    Edges of independent chains, task ``i`` belongs to chain ``i % chains``.
+
+    Args:
+        tasks (int): Number of tasks.
+        chains (int): Number of chains.
+        seed (int): Unused, the shape is fixed by the other arguments.
+
+    Returns:
+        tuple: The sender and receiver arrays.
+    """
+    return array("q", range(tasks - chains)), array("q", range(chains, tasks))
+
+
+def random_edges(tasks, fan_in=3, seed=0):
+    """
+    Edges of a random DAG where every task depends on up to ``fan_in`` earlier tasks.
+
+    Args:
+        tasks (int): Number of tasks.
+        fan_in (int): Number of predecessors of every task but the first ones.
+        seed (int): Seed of the random choice of the predecessors.
+
+    Returns:
+        tuple: The sender and receiver arrays.
+    """
+    rng = random.Random(seed)
+    senders, receivers = array("q"), array("q")
+    for receiver in range(1, tasks):
+        for sender in rng.sample(range(receiver), min(fan_in, receiver)):
+            senders.append(sender)
+            receivers.append(receiver)
+    return senders, receivers
+
+
+## Edge generators by the name of the shape, with the keyword taking the density of the graph
+SHAPES = {
+    "layered": (layered_edges, "fan_in"),
+    "fork_join": (fork_join_edges, "width"),
+    "chain": (chain_edges, "chains"),
+    "random": (random_edges, "fan_in"),
+}
+
+
+def application(shape, tasks, density=None, seed=0, slack=(1.0, 3.0)):
+    """
+    Generate an application with a task graph of the given shape.
+
+    Execution times and message sizes are drawn at random. The deadline of a task is the earliest time it can finish
+    when its predecessors run in parallel on free nodes, times a random slack factor.
+
+    Args:
+        shape (str): Name of the task graph in ``SHAPES``.
+        tasks (int): Number of tasks.
+        density (int, optional): Fan-in, branches per stage or number of chains, the default of the shape if omitted.
+        seed (int): Seed of the task graph and the task values.
+        slack (tuple): Range of the slack factor of the deadlines.
+
+    Returns:
+        ApplicationModel: The compiled application.
+    """
+    generate, keyword = SHAPES[shape]
+    kwargs = {keyword: density} if density is not None else {}
+    senders, receivers = generate(tasks, seed=seed, **kwargs)
+
+    rng = random.Random(seed + 1)
+    wcet = array("q", [rng.randint(1, 50) for _ in range(tasks)])
+    mcet = array("q", [rng.randint(1, w) for w in wcet])
+    size = array("q", [rng.randint(1, 100) for _ in senders])
+    model = ApplicationModel(list(range(tasks)), wcet, mcet, array("q"), senders, receivers, size)
+
+    ## Every edge goes to a higher index, so the predecessors of a task are finished when it is reached
+    graph = model.graph
+    finish = array("q", bytes(8 * tasks))
+    for i in range(tasks):
+        start = max((finish[graph.pred[e]] for e in range(graph.pred_offsets[i], graph.pred_offsets[i + 1])),
+                    default=0)
+        finish[i] = start + wcet[i]
+    low, high = slack
+    model.deadline = array("q", [int(f * rng.uniform(low, high)) + 1 for f in finish])
+    return model
+
+
+def mesh_platform(rows, columns, compute_per_router=1, seed=0):
+    """
+    Generate a grid of routers with compute nodes attached to every router.
+
+    Args:
+        rows (int): Number of router rows.
+        columns (int): Number of router columns.
+        compute_per_router (int): Number of compute nodes attached to every router.
+        seed (int): Seed of the link delays.
+
+    Returns:
+        dict: The platform section of a request.
+    """
+    rng = random.Random(seed)
+    routers = rows * columns
+    nodes = [{"id": k, "type": "router"} for k in range(routers)]
+    links = []
+
+    def link(start, end, bandwidth):
+        links.append({"id": len(links), "start_node": start, "end_node": end, "link_delay": rng.randint(1, 10),
+                      "bandwidth": bandwidth, "type": "ethernet"})
+
+    for r in range(rows):
+        for c in range(columns):
+            router = r * columns + c
+            if c + 1 < columns:
+                link(router, router + 1, 1000)
+            if r + 1 < rows:
+                link(router, router + columns, 1000)
+            for _ in range(compute_per_router):
+                nodes.append({"id": len(nodes), "type": "compute"})
+                link(len(nodes) - 1, router, 200)
+    return {"nodes": nodes, "links": links}
+
+
+def tree_platform(depth, fanout, compute_per_leaf=1, seed=0):
+    """
+    Generate a tree of routers with compute nodes attached to the leaf routers.
+
+    Args:
+        depth (int): Number of router levels, 1 is a single router.
+        fanout (int): Number of children of every inner router.
+        compute_per_leaf (int): Number of compute nodes attached to every leaf router.
+        seed (int): Seed of the link delays.
+
+    Returns:
+        dict: The platform section of a request.
+    """
+    rng = random.Random(seed)
+    nodes = [{"id": 0, "type": "router"}]
+    links = []
+
+    def attach(parent, node_type, bandwidth):
+        nodes.append({"id": len(nodes), "type": node_type})
+        links.append({"id": len(links), "start_node": len(nodes) - 1, "end_node": parent,
+                      "link_delay": rng.randint(1, 10), "bandwidth": bandwidth, "type": "ethernet"})
+        return len(nodes) - 1
+
+    level = [0]
+    for _ in range(depth - 1):
+        level = [attach(parent, "router", 1000) for parent in level for _ in range(fanout)]
+    for leaf in level:
+        for _ in range(compute_per_leaf):
+            attach(leaf, "compute", 200)
+    return {"nodes": nodes, "links": links}
+
+
+## Platform generators by name, see ``platform``
+TOPOLOGIES = {"mesh": mesh_platform, "tree": tree_platform}
+
+
+def platform(spec, seed=0):
+    """
+    Generate a platform from a spec like ``mesh:4x4x2`` (rows, columns, compute nodes per router) or ``tree:3x4x2``
+    (depth, fanout, compute nodes per leaf).
+
+    Args:
+        spec (str): Name of the topology and its dimensions.
+        seed (int): Seed of the link delays.
+
+    Raises:
+        ValueError: If the spec is malformed.
+
+    Returns:
+        dict: The platform section of a request.
+    """
+    name, _, dimensions = spec.partition(":")
+    try:
+        return TOPOLOGIES[name](*(int(d) for d in dimensions.split("x")), seed=seed)
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Invalid platform spec '{spec}', expected e.g. mesh:4x4x1 or tree:3x2x2.") from None
+
+
+def iter_request(application_model, platform_data, chunk_items=4096):
+    """
+    Encode an application and platform to the JSON input format, chunk by chunk.
+
+    Args:
+        application_model (ApplicationModel): The application, with integer task ids.
+        platform_data (dict): The platform section of the request.
+        chunk_items (int): Number of tasks or messages per chunk.
+
+    Yields:
+        bytes: The next part of the request body.
+    """
+    app = application_model
+    graph = app.graph
+    yield b'{"application":{"tasks":['
+    tasks = (f'{{"id":{i},"wcet":{app.wcet[i]},"mcet":{app.mcet[i]},"deadline":{app.deadline[i]}}}'
+             for i in range(len(app)))
+    yield from _join_chunks(tasks, chunk_items)
+    yield b'],"messages":['
+    messages = (f'{{"id":{edge},"sender":{graph.pred[e]},"receiver":{i},"size":{app.size[edge]}}}'
+                for i in range(len(app)) for e in range(graph.pred_offsets[i], graph.pred_offsets[i + 1])
+                for edge in (graph.pred_edge[e],))
+    yield from _join_chunks(messages, chunk_items)
+    yield b']},"platform":' + json.dumps(platform_data, separators=(",", ":")).encode() + b"}"
+
+
+def _join_chunks(items, chunk_items):
+    """Join JSON array items into chunks of ``chunk_items`` items, with the separators between them."""
+    separator = b""
+    while True:
+        chunk = ",".join(islice(items, chunk_items))
+        if not chunk:
+            return
+        yield separator + chunk.encode()
+        separator = b","
@@ -1,21 +1,40 @@
 """
 This module contains the scheduling algorithms used in the scheduling API.
 
-It provides implementations for both Least Deadline First (LDF) and Earliest Deadline First (EDF) scheduling strategies, applicable in single-core and multi-core processor environments. Functions within are designed to be called with specific application and platform data structures.
+It provides implementations of the Latest Deadline First (LDF), Earliest Deadline First (EDF) and Least Laxity (LL) scheduling strategies, applicable on a single node and on the compute nodes of a platform. Functions within are designed to be called with specific application and platform data structures.
 
 Functions:
-- ldf_singlecore: Schedules tasks on a single-core processor using LDF.
-- edf_singlecore: Schedules tasks on a single-core processor using EDF.
-- ll_singlecore: Schedules tasks on a single-core processor using LL.
-- ldf_multicore: Schedules tasks on multiple cores using LDF.
-- edf_multicore: Schedules tasks on multiple cores using EDF.
+- ldf_single_node: Schedules tasks on a single node using LDF.
+- edf_single_node: Schedules tasks on a single node using EDF.
+- ll_multinode: Schedules tasks on the compute nodes using LL.
+- ldf_multinode: Schedules tasks on the compute nodes using LDF.
+- edf_multinode: Schedules tasks on the compute nodes using EDF.
+- run_algorithm: Runs an algorithm of ``ALGORITHMS`` by name.
+- iter_algorithm: Runs the generator variant of an algorithm of ``ALGORITHMS`` by name.
+
+The algorithms are registered by name in ``ALGORITHMS`` together with their capabilities. Every algorithm has a
+generator variant, e.g. ``iter_edf_multinode``, that yields the schedule entries as the jobs are placed instead of
+returning the complete schedule.
+
+All algorithms share one list-scheduling core that tracks the number of unscheduled predecessors of every job
+and keeps the ready jobs in a priority queue. A policy is just a key function ranking the jobs, so a complete
+schedule costs O((V + E) log V) for V jobs and E messages. The core is split into ``start_schedule``, which sets up
+the scheduler state, and ``place_jobs``, which places the jobs and can leave checkpoints behind to resume from.
 """
 
 __author__ = "Umer Rauf, Afnan Arshad"
 __version__ = "2.0.0"
 
 
-import networkx as nx
+import heapq
+import pickle
+import time
+from collections import namedtuple
+from itertools import islice
+
+from metrics import Timings
+from model import compile_application
+from topology import compile_platform
 
 # Example schedule to check the frontend and backend connection
 example_schedule = [
@@ -50,73 +69,385 @@ example_schedule = [
 ]
 
 
+class NodeAvailability:
+    """
+    Indexed min-heap of the time at which each platform node becomes free.
+
+    Nodes are addressed by their position ``k`` in the platform node list and ordered by ``(free time, k)``, so
+    ties go to the node listed first. Selecting the earliest free node is O(1), changing the free time of a node
+    (in either direction) is O(log N).
+
+    Attributes:
+        node_ids (list): Node id for every node position.
+        free_at (list): Time at which each node becomes free.
+    """
+
+    __slots__ = ("node_ids", "free_at", "_heap", "_slot")
+
+    def __init__(self, node_ids, compute=None):
+        """
+        Start with every node free at time 0.
+
+        Args:
+            node_ids (list): Node id for every node position.
+            compute (iterable of int, optional): Positions of the nodes that can execute jobs, all nodes if omitted.
+                                                 Any other node is never offered for placement.
+        """
+        self.node_ids = node_ids
+        self.free_at = [0] * len(node_ids)
+        # All nodes are free at 0, so the positions in increasing order already form a heap
+        self._heap = sorted(compute) if compute is not None else list(range(len(node_ids)))
+        self._slot = [-1] * len(self.node_ids)
+        for slot, k in enumerate(self._heap):
+            self._slot[k] = slot
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, k):
+        return self._slot[k] >= 0
+
+    def copy(self):
+        """Return an independent copy, e.g. to resume a placement from a checkpoint."""
+        other = NodeAvailability.__new__(NodeAvailability)
+        other.node_ids = self.node_ids
+        other.free_at, other._heap, other._slot = self.free_at[:], self._heap[:], self._slot[:]
+        return other
+
+    def earliest(self):
+        """
+        Return the node that becomes free first.
+
+        Raises:
+            ValueError: If no node is left.
+
+        Returns:
+            tuple: ``(free time, node position)`` of the earliest free node.
+        """
+        if not self._heap:
+            raise ValueError("The platform has no compute nodes to schedule the jobs on.")
+        k = self._heap[0]
+        return self.free_at[k], k
+
+    def update(self, k, time):
+        """Set the time at which node ``k`` becomes free, moving it up or down the heap."""
+        earlier = time < self.free_at[k]
+        self.free_at[k] = time
+        if earlier:
+            self._sift_up(self._slot[k])
+        else:
+            self._sift_down(self._slot[k])
+
+    def _before(self, a, b):
+        return self.free_at[a] < self.free_at[b] or (self.free_at[a] == self.free_at[b] and a < b)
+
+    def _sift_up(self, slot):
+        heap, position = self._heap, self._slot
+        k = heap[slot]
+        while slot:
+            parent = (slot - 1) >> 1
+            if not self._before(k, heap[parent]):
+                break
+            heap[slot] = heap[parent]
+            position[heap[slot]] = slot
+            slot = parent
+        heap[slot] = k
+        position[k] = slot
+
+    def _sift_down(self, slot):
+        heap, position = self._heap, self._slot
+        size = len(heap)
+        k = heap[slot]
+        while True:
+            child = 2 * slot + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._before(heap[child + 1], heap[child]):
+                child += 1
+            if not self._before(heap[child], k):
+                break
+            heap[slot] = heap[child]
+            position[heap[slot]] = slot
+            slot = child
+        heap[slot] = k
+        position[k] = slot
+
+
+def earliest_deadline(model):
+    """Priority keys of the Earliest Deadline First (EDF) policy, one per task index."""
+    return model.deadline
+
+
+def latest_deadline(model):
+    """Priority keys of the Latest Deadline First (LDF) policy, one per task index."""
+    return [-deadline for deadline in model.deadline]
+
+
+def least_laxity(model):
+    """
+    Priority keys of the Least Laxity (LL) policy, one per task index.
+
+    The laxity of a job is ``deadline - (t + wcet)``. Every ready job is compared against the same time ``t``
+    (the earliest free node), so ordering by ``deadline - wcet`` gives the same ranking without knowing ``t``.
+    """
+    return [deadline - wcet for deadline, wcet in zip(model.deadline, model.wcet)]
+
+
+class ScheduleState:
+    """
+    State of the list-scheduling core between two placements, from which the placement can be resumed.
+
+    Attributes:
+        order (list of int): Task index of every rank.
+        rank (list of int): Rank of every task index.
+        unscheduled (list of int): Number of unplaced predecessors of every job.
+        ready (list of int): Heap of the ranks of the ready jobs of the current sweep.
+        next_sweep (list of int): Heap of the ranks of the ready jobs waiting for the next sweep.
+        available (NodeAvailability): Free times of the compute nodes, None on a single node.
+        end_times (list of int): End time of every placed job.
+        placed_on (list of int): Node position of every placed job.
+        placed (int): Number of placed jobs.
+    """
+
+    __slots__ = ("order", "rank", "unscheduled", "ready", "next_sweep", "available", "end_times", "placed_on",
+                 "placed")
+
+    def __init__(self, order, rank, unscheduled, ready, next_sweep, available, end_times, placed_on, placed=0):
+        self.order = order
+        self.rank = rank
+        self.unscheduled = unscheduled
+        self.ready = ready
+        self.next_sweep = next_sweep
+        self.available = available
+        self.end_times = end_times
+        self.placed_on = placed_on
+        self.placed = placed
+
+
+## Copy of the state before the placement of job number ``placed``, the ready jobs as task indices so that they can
+## be ranked again after the priority keys of other jobs have changed
+Checkpoint = namedtuple("Checkpoint", ["placed", "ready", "next_sweep", "available"])
+
+
+def rank_jobs(keys):
+    """
+    Rank the jobs by a stable sort on their priority keys, so ties keep the input order.
+
+    Args:
+        keys (sequence): Priority key of every task index.
+
+    Returns:
+        tuple: The task index of every rank and the rank of every task index.
+    """
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    rank = [0] * len(keys)
+    for position, i in enumerate(order):
+        rank[i] = position
+    return order, rank
+
+
+def start_schedule(model, priority, platform=None):
+    """
+    Set up the scheduler state before the first placement: rank the jobs, count their predecessors and queue
+    the jobs that are ready at once.
+
+    Args:
+        model (ApplicationModel): Compiled application model.
+        priority (callable): Returns the key of every task index, lower keys are scheduled first.
+        platform (PlatformModel, optional): Compiled platform, every job is placed on node 0 if omitted.
+
+    Returns:
+        ScheduleState: The state to pass to ``place_jobs``.
+    """
+    n = len(model.ids)
+    unscheduled = model.indegrees()
+    order, rank = rank_jobs(priority(model))
+    ready = [rank[i] for i, count in enumerate(unscheduled) if not count]
+    heapq.heapify(ready)
+    available = NodeAvailability(platform.node_ids, platform.compute) if platform is not None else None
+    return ScheduleState(order, rank, unscheduled, ready, [], available, [0] * n, [0] * n)
+
+
+def _iter_schedule(model, priority, platform=None, sweep=True, communication=False):
+    """
+    Place every job once all of its predecessors are placed, in the order given by a priority key, yielding the
+    schedule entries one by one.
+
+    Only the scheduler state is held while iterating, so a caller that consumes the entries as they are placed
+    never needs memory for the complete schedule.
+
+    Jobs are ranked by a stable sort on the keys returned by ``priority``, so ties keep the input order. The number
+    of unscheduled predecessors is tracked per job and a job enters the ready queue when that count drops to zero.
+
+    With ``sweep`` enabled the ready queue behaves like the original requeue loop: the ranked jobs are visited
+    cyclically, and a job that becomes ready behind the current position waits for the next sweep. The ready
+    jobs of the current and the next sweep are kept in two heaps keyed on rank. Without ``sweep`` the ready job
+    with the best rank is always placed next.
+
+    A job is placed on the compute node that becomes free first. In communication-aware mode a message to another
+    node arrives only after the route's link delay plus its transfer time, so the job may instead go to one of the
+    nodes its predecessors ran on if it can start earlier there.
+
+    Args:
+        model (ApplicationModel): Compiled application model.
+        priority (callable): Returns the key of every task index, lower keys are scheduled first.
+        platform (PlatformModel, optional): Compiled platform whose compute nodes the jobs are distributed over.
+                                            If omitted, every job is placed on node 0 as soon as its predecessors
+                                            have finished.
+        sweep (bool): Reproduce the cyclic visiting order of the requeue loop.
+        communication (bool): Delay jobs until the messages of their predecessors have crossed the network.
+
+    Raises:
+        ValueError: If some jobs can never become ready because of a cycle or a missing sender, or if a message
+                    has no route between two compute nodes. The entries placed before are yielded first.
+
+    Yields:
+        dict: Schedule entries in placement order.
+    """
+    state = start_schedule(model, priority, platform)
+    yield from place_jobs(model, state, platform, sweep, communication)
+
+
+def place_jobs(model, state, platform=None, sweep=True, communication=False, checkpoints=None, interval=0):
+    """
+    Place the remaining jobs of a scheduler state, see ``_iter_schedule``, yielding the schedule entries one by one.
+
+    The state is updated in place, once the generator is exhausted its ``end_times`` and ``placed_on`` hold the
+    placement of every job. With ``checkpoints`` a Checkpoint is appended before the first placement and then every
+    ``interval`` placements, or less often while many jobs are ready, so that copying the ready jobs costs O(1)
+    per placement on average. The placement can be resumed from any of them with a state rebuilt around it.
+
+    Args:
+        model (ApplicationModel): Compiled application model.
+        state (ScheduleState): State set up by ``start_schedule`` or rebuilt from a Checkpoint.
+        platform (PlatformModel, optional): Compiled platform, every job is placed on node 0 if omitted.
+        sweep (bool): Reproduce the cyclic visiting order of the requeue loop.
+        communication (bool): Delay jobs until the messages of their predecessors have crossed the network.
+        checkpoints (list, optional): Receives the checkpoints, none are taken if omitted.
+        interval (int): Minimum number of placements between two checkpoints.
+
+    Raises:
+        ValueError: If some jobs can never become ready because of a cycle or a missing sender, or if a message
+                    has no route between two compute nodes. The entries placed before are yielded first.
+
+    Yields:
+        dict: Schedule entries in placement order.
+    """
+    ids, wcet, deadline = model.ids, model.wcet, model.deadline
+    graph = model.graph
+    pred_offsets, pred, pred_edge = graph.pred_offsets, graph.pred, graph.pred_edge
+    succ_offsets, succ = graph.succ_offsets, graph.succ
+    order, rank, unscheduled = state.order, state.rank, state.unscheduled
+    ready, next_sweep, available = state.ready, state.next_sweep, state.available
+    end_times, placed_on = state.end_times, state.placed_on
+    communication = communication and available is not None
+
+    placed = state.placed
+    checkpoint = placed if checkpoints is not None else -1
+    while ready or next_sweep:
+        if placed == checkpoint:
+            checkpoints.append(Checkpoint(placed, [order[r] for r in ready], [order[r] for r in next_sweep],
+                                          available.copy() if available is not None else None))
+            checkpoint = placed + max(interval, len(ready) + len(next_sweep))
+        if not ready:
+            ready, next_sweep = next_sweep, ready
+        position = heapq.heappop(ready)
+        i = order[position]
+
+        # Ensure the job starts after all its dependencies have finished
+        job_start_time = 0
+        for k in range(pred_offsets[i], pred_offsets[i + 1]):
+            if end_times[pred[k]] > job_start_time:
+                job_start_time = end_times[pred[k]]
+        if available is None:
+            node_id = 0
+            job_end_time = job_start_time + wcet[i]
+        else:
+            node_free, k = available.earliest()
+            if communication:
+                k, job_start_time = _communication_aware_start(
+                    platform, available, k, end_times, placed_on, model.size,
+                    pred[pred_offsets[i]:pred_offsets[i + 1]], pred_edge[pred_offsets[i]:pred_offsets[i + 1]])
+            else:
+                job_start_time = max(node_free, job_start_time)
+            node_id = available.node_ids[k]
+            job_end_time = job_start_time + wcet[i]
+            available.update(k, job_end_time)
+            placed_on[i] = k
+        end_times[i] = job_end_time
+        placed += 1
+
+        yield {
+            'task_id': ids[i],
+            'node_id': node_id,
+            'start_time': job_start_time,
+            'end_time': job_end_time,
+            'deadline': deadline[i]
+        }
+
+        for k in range(succ_offsets[i], succ_offsets[i + 1]):
+            successor = succ[k]
+            unscheduled[successor] -= 1
+            if not unscheduled[successor]:
+                if sweep and rank[successor] < position:
+                    heapq.heappush(next_sweep, rank[successor])
+                else:
+                    heapq.heappush(ready, rank[successor])
+
+    state.ready, state.next_sweep, state.placed = ready, next_sweep, placed
+    if placed < len(ids):
+        blocked = next(ids[i] for i, count in enumerate(unscheduled) if count)
+        raise ValueError(
+            f"Cyclic dependency detected or missing dependencies for job {blocked}.")
+
+
+def _communication_aware_start(platform, available, earliest, end_times, placed_on, size, predecessors, edges):
+    """
+    Pick the node on which a job can start first once the messages of its predecessors have arrived.
+
+    The candidates are the earliest free node and the nodes the predecessors ran on, where some messages need
+    no transfer at all. Ties go to the earliest free node.
+
+    Args:
+        platform (PlatformModel): Compiled platform answering the message transfer times.
+        available (NodeAvailability): Free times of the compute nodes.
+        earliest (int): Position of the earliest free node.
+        end_times (list of int): End time of every placed job.
+        placed_on (list of int): Node position of every placed job.
+        size (array): Size of every message.
+        predecessors (array): Task indices of the job's predecessors.
+        edges (array): Message of every predecessor, as positions in ``size``.
+
+    Returns:
+        tuple: ``(node position, start time)`` of the chosen node.
+    """
+    best_node, best_start = None, None
+    for node in dict.fromkeys([earliest, *(placed_on[p] for p in predecessors)]):
+        start = available.free_at[node]
+        for p, edge in zip(predecessors, edges):
+            arrival = end_times[p] + platform.transfer_time(placed_on[p], node, size[edge])
+            if arrival > start:
+                start = arrival
+        if best_start is None or start < best_start:
+            best_node, best_start = node, start
+    return best_node, best_start
+
+
 def ldf_single_node(application_data):
     """
     Schedule jobs on a single node using the Latest Deadline First (LDF) strategy.
 
-    This function schedules jobs based on their latest deadlines after sorting them and considering dependencies through a directed graph representation.
+    This function schedules jobs based on their latest deadlines, a job becoming ready as soon as all of its
+    predecessors have been scheduled.
 
     Args:
-        application_data (dict): Contains jobs and messages that indicate dependencies among jobs.
+        application_data (dict or ApplicationModel): Contains jobs and messages that indicate dependencies among jobs.
 
     Returns:
         list of dict: Scheduling results with each job's details, including execution time, node assignment,
                       and start/end times relative to other jobs.
     """
-    jobs = application_data['tasks']
-    dependencies = application_data.get('messages', [])
-
-    # Convert dependencies into a graph representation
-    dependency_graph = nx.DiGraph()
-    for job in jobs:
-        dependency_graph.add_node(job['id'])
-    for dependency in dependencies:
-        dependency_graph.add_edge(dependency['sender'], dependency['receiver'])
-
-    # Sort jobs by latest deadline first
-    jobs_sorted = sorted(jobs, key=lambda x: x['deadline'], reverse=True)
-
-    # Initialize the schedule
-    schedule = []
-    job_start_times = {}
-    jobs_scheduled = set()
-
-    # Schedule jobs considering dependencies
-    while jobs_sorted:
-        job = jobs_sorted.pop(0)
-        job_id = job['id']
-
-        # Ensure all dependencies have been scheduled
-        unscheduled_dependencies = [
-            dep for dep in dependency_graph.predecessors(job_id) if dep not in jobs_scheduled]
-        if unscheduled_dependencies:
-            jobs_sorted.append(job)  # Reinsert job at the end of the list
-            # If only this job is left and still not schedulable, there's a cyclic dependency
-            if len(jobs_sorted) == 1:
-                raise ValueError(
-                    f"Cyclic dependency detected or missing dependencies for job {job_id}.")
-            continue
-
-        # All dependencies are scheduled, schedule this job
-        max_dependency_end_time = 0
-        for dependency in dependency_graph.predecessors(job_id):
-            max_dependency_end_time = max(max_dependency_end_time, job_start_times[dependency] + next(
-                j['wcet'] for j in jobs if j['id'] == dependency))
-
-        # Schedule the job
-        job_start_time = max_dependency_end_time
-        job_end_time = job_start_time + job['wcet']
-        job_start_times[job_id] = job_start_time
-        jobs_scheduled.add(job_id)
-
-        schedule.append({
-            'task_id': job_id,
-            'node_id': 0,
-            'start_time': job_start_time,
-            'end_time': job_end_time,
-            'deadline': job['deadline']
-        })
-
+    schedule = list(iter_ldf_single_node(application_data))
     return {"schedule": schedule, "name": "LDF Single Node"}
 
 
@@ -125,319 +456,251 @@ def edf_single_node(application_data):
     Schedule jobs on single node using the Earliest Deadline First (EDF) strategy.
 
     This function processes application data to schedule jobs based on the earliest
-    deadlines. It builds a dependency graph and schedules accordingly, ensuring that jobs with no predecessors are
-    scheduled first, and subsequent jobs are scheduled based on the minimum deadline of available nodes.
+    deadlines. Jobs with no predecessors are scheduled first, and subsequent jobs as soon as all of their
+    predecessors have been scheduled.
 
     Args:
-        application_data (dict): Job data including dependencies represented by messages between jobs.
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
 
     Returns:
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
     """
-    jobs = application_data['tasks']
-    dependencies = application_data.get('messages', [])
-
-    # Convert dependencies into a graph representation
-    dependency_graph = nx.DiGraph()
-    for job in jobs:
-        dependency_graph.add_node(job['id'])
-    for dependency in dependencies:
-        dependency_graph.add_edge(dependency['sender'], dependency['receiver'])
-
-    # Sort jobs by earliest deadline first
-    jobs_sorted = sorted(jobs, key=lambda x: x['deadline'])
-
-    # Initialize the schedule
-    schedule = []
-    job_start_times = {}
-    jobs_scheduled = set()
-
-    # Schedule jobs considering dependencies
-    while jobs_sorted:
-        job = jobs_sorted.pop(0)
-        job_id = job['id']
-
-        # Ensure all dependencies have been scheduled
-        unscheduled_dependencies = [
-            dep for dep in dependency_graph.predecessors(job_id) if dep not in jobs_scheduled]
-        if unscheduled_dependencies:
-            jobs_sorted.append(job)  # Reinsert job at the end of the list
-            # If only this job is left and still not schedulable, there's a cyclic dependency
-            if len(jobs_sorted) == 1:
-                raise ValueError(
-                    f"Cyclic dependency detected or missing dependencies for job {job_id}.")
-            continue
-
-        # All dependencies are scheduled, schedule this job
-        max_dependency_end_time = 0
-        for dependency in dependency_graph.predecessors(job_id):
-            max_dependency_end_time = max(max_dependency_end_time, job_start_times[dependency] + next(
-                j['wcet'] for j in jobs if j['id'] == dependency))
-
-        # Schedule the job
-        job_start_time = max_dependency_end_time
-        job_end_time = job_start_time + job['wcet']
-        job_start_times[job_id] = job_start_time
-        jobs_scheduled.add(job_id)
-
-        schedule.append({
-            'task_id': job_id,
-            'node_id': 0,
-            'start_time': job_start_time,
-            'end_time': job_end_time,
-            'deadline': job['deadline']
-        })
-
+    schedule = list(iter_edf_single_node(application_data))
     return {"schedule": schedule, "name": "EDF Single Node"}
 
 
-def ll_multinode(application_data, platform_data):
+def ll_multinode(application_data, platform_data, communication=False):
     """
     Schedule jobs on a distributed system with multiple compute nodes using the Least Laxity (LL) strategy.
     This function schedules jobs based on their laxity, with the job having the least laxity being scheduled first.
 
+    The ready jobs are kept in a heap that is updated incrementally as their predecessors finish, and the laxity is
+    taken against the earliest free node, read once per step from the node-availability heap.
+
     Args:
-        application_data (dict): Job data including dependencies represented by messages between jobs.
-        platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        communication (bool): Account for the link delay and bandwidth of the messages between different nodes.
 
     Returns:
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
     """
-    jobs = application_data['tasks']
-    dependencies = application_data.get('messages', [])
-    nodes = platform_data['nodes']
-
-    # Convert dependencies into a graph representation
-    dependency_graph = nx.DiGraph()
-    for job in jobs:
-        dependency_graph.add_node(job['id'])
-    for dependency in dependencies:
-        dependency_graph.add_edge(dependency['sender'], dependency['receiver'])
-
-    # Initialize the schedule
-    schedule = []
-    job_start_times = {}
-    job_end_times = {}
-    jobs_scheduled = set()
-    # Current time for each node
-    current_time = {node['id']: 0 for node in nodes}
-
-    def calculate_laxity(job, current_time):
-        return job['deadline'] - (current_time + job['wcet'])
-
-    # Helper function to find a node with the minimum current time
-    def find_available_node(current_time):
-        return min(current_time, key=current_time.get)
-
-    # Schedule jobs considering dependencies
-    while jobs:
-        # Filter out jobs that are ready to be scheduled (all dependencies met)
-        ready_jobs = [job for job in jobs if all(
-            dep in jobs_scheduled for dep in dependency_graph.predecessors(job['id']))]
-
-        if not ready_jobs:
-            raise ValueError(
-                "Cyclic dependency detected or missing dependencies among jobs.")
-
-        # Sort ready jobs by laxity
-        ready_jobs.sort(key=lambda x: calculate_laxity(
-            x, current_time[find_available_node(current_time)]))
-
-        # Get the job with the least laxity
-        job_to_schedule = ready_jobs[0]
-        job_id = job_to_schedule['id']
-
-        # Find an available node to schedule the job
-        node_id = find_available_node(current_time)
-
-        # Ensure the job starts after all its dependencies have finished
-        max_dependency_end_time = 0
-        for dependency in dependency_graph.predecessors(job_id):
-            max_dependency_end_time = max(
-                max_dependency_end_time, job_end_times.get(dependency, 0))
-
-        # Schedule the job
-        job_start_time = max(current_time[node_id], max_dependency_end_time)
-        job_end_time = job_start_time + job_to_schedule['wcet']
-        job_start_times[job_id] = job_start_time
-        job_end_times[job_id] = job_end_time
-        jobs_scheduled.add(job_id)
-        current_time[node_id] = job_end_time
-
-        schedule.append({
-            'task_id': job_id,
-            'node_id': node_id,
-            'start_time': job_start_time,
-            'end_time': job_end_time,
-            'deadline': job_to_schedule['deadline']
-        })
-
-        # Remove the scheduled job from the list of jobs
-        jobs = [job for job in jobs if job['id'] != job_id]
-
+    schedule = list(iter_ll_multinode(application_data, platform_data, communication))
     return {"schedule": schedule, "name": "LL Multi Node"}
 
 
-def ldf_multinode(application_data, platform_data):
+def ldf_multinode(application_data, platform_data, communication=False):
     """
     Schedule jobs on a distributed system with multiple compute nodes using the Latest Deadline First (LDF) strategy.
     This function schedules jobs based on their periods and deadlines, with the shortest period job being scheduled first.
 
     Args:
-        application_data (dict): Job data including dependencies represented by messages between jobs.
-        platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        communication (bool): Account for the link delay and bandwidth of the messages between different nodes.
 
     Returns:
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
     """
-    jobs = application_data['tasks']
-    dependencies = application_data.get('messages', [])
-    nodes = platform_data['nodes']
-
-    # Convert dependencies into a graph representation
-    dependency_graph = nx.DiGraph()
-    for job in jobs:
-        dependency_graph.add_node(job['id'])
-    for dependency in dependencies:
-        dependency_graph.add_edge(dependency['sender'], dependency['receiver'])
-
-    # Sort jobs by latest deadline first
-    jobs_sorted = sorted(jobs, key=lambda x: x['deadline'], reverse=True)
-
-    # Initialize the schedule
-    schedule = []
-    job_start_times = {}
-    jobs_scheduled = set()
-    # Current time for each node
-    current_time = {node['id']: 0 for node in nodes}
-
-    # Helper function to find a node with the minimum current time
-    def find_available_node(current_time):
-        return min(current_time, key=current_time.get)
-
-    # Schedule jobs considering dependencies
-    while jobs_sorted:
-        job = jobs_sorted.pop(0)
-        job_id = job['id']
-
-        # Ensure all dependencies have been scheduled
-        unscheduled_dependencies = [
-            dep for dep in dependency_graph.predecessors(job_id) if dep not in jobs_scheduled]
-        if unscheduled_dependencies:
-            jobs_sorted.append(job)  # Reinsert job at the end of the list
-            # If only this job is left and still not schedulable, there's a cyclic dependency
-            if len(jobs_sorted) == 1:
-                raise ValueError(
-                    f"Cyclic dependency detected or missing dependencies for job {job_id}.")
-            continue
-
-        # Find an available node to schedule the job
-        node_id = find_available_node(current_time)
-
-        # Ensure the job starts after all its dependencies have finished
-        max_dependency_end_time = 0
-        for dependency in dependency_graph.predecessors(job_id):
-            max_dependency_end_time = max(max_dependency_end_time, job_start_times[dependency] + next(
-                j['wcet'] for j in jobs if j['id'] == dependency))
-
-        # Schedule the job
-        job_start_time = max(current_time[node_id], max_dependency_end_time)
-        job_end_time = job_start_time + job['wcet']
-        job_start_times[job_id] = job_start_time
-        jobs_scheduled.add(job_id)
-        current_time[node_id] = job_end_time
-
-        schedule.append({
-            'task_id': job_id,
-            'node_id': node_id,
-            'start_time': job_start_time,
-            'end_time': job_end_time,
-            'deadline': job['deadline']
-        })
-
+    schedule = list(iter_ldf_multinode(application_data, platform_data, communication))
     return {"schedule": schedule, "name": "LDF Multi Node"}
 
 
-def edf_multinode(application_data, platform_data):
+def edf_multinode(application_data, platform_data, communication=False):
     """
     Schedule jobs on a distributed system with multiple compute nodes using the Earliest Deadline First (EDF) strategy.
     This function processes application data to schedule jobs based on the earliest
     deadlines.
 
     Args:
-        application_data (dict): Job data including dependencies represented by messages between jobs.
-        platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        communication (bool): Account for the link delay and bandwidth of the messages between different nodes.
 
     Returns:
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
     """
-    jobs = application_data['tasks']
-    dependencies = application_data.get('messages', [])
-    nodes = platform_data['nodes']
-
-    # Convert dependencies into a graph representation
-    dependency_graph = nx.DiGraph()
-    for job in jobs:
-        dependency_graph.add_node(job['id'])
-    for dependency in dependencies:
-        dependency_graph.add_edge(dependency['sender'], dependency['receiver'])
-
-    # Sort jobs by earliest deadline first
-    jobs_sorted = sorted(jobs, key=lambda x: x['deadline'])
-
-    # Initialize the schedule
-    schedule = []
-    job_start_times = {}
-    jobs_scheduled = set()
-    # Current time for each node
-    current_time = {node['id']: 0 for node in nodes}
-
-    # Helper function to find a node with the minimum current time
-    def find_available_node(current_time):
-        return min(current_time, key=current_time.get)
-
-    # Schedule jobs considering dependencies
-    while jobs_sorted:
-        job = jobs_sorted.pop(0)
-        job_id = job['id']
-
-        # Ensure all dependencies have been scheduled
-        unscheduled_dependencies = [
-            dep for dep in dependency_graph.predecessors(job_id) if dep not in jobs_scheduled]
-        if unscheduled_dependencies:
-            jobs_sorted.append(job)  # Reinsert job at the end of the list
-            # If only this job is left and still not schedulable, there's a cyclic dependency
-            if len(jobs_sorted) == 1:
-                raise ValueError(
-                    f"Cyclic dependency detected or missing dependencies for job {job_id}.")
-            continue
-
-        # Find an available node to schedule the job
-        node_id = find_available_node(current_time)
+    schedule = list(iter_edf_multinode(application_data, platform_data, communication))
+    return {"schedule": schedule, "name": "EDF Multi Node"}
 
-        # Ensure the job starts after all its dependencies have finished
-        max_dependency_end_time = 0
-        for dependency in dependency_graph.predecessors(job_id):
-            max_dependency_end_time = max(max_dependency_end_time, job_start_times[dependency] + next(
-                j['wcet'] for j in jobs if j['id'] == dependency))
-
-        # Schedule the job
-        job_start_time = max(current_time[node_id], max_dependency_end_time)
-        job_end_time = job_start_time + job['wcet']
-        job_start_times[job_id] = job_start_time
-        jobs_scheduled.add(job_id)
-        current_time[node_id] = job_end_time
-
-        schedule.append({
-            'task_id': job_id,
-            'node_id': node_id,
-            'start_time': job_start_time,
-            'end_time': job_end_time,
-            'deadline': job['deadline']
-        })
 
-    return {"schedule": schedule, "name": "EDF Multi Node"}
+## Generator variants of the algorithms, yielding the schedule entries as the jobs are placed. The models are
+## compiled when they are called, so invalid input is reported before the first entry.
+
+def iter_ldf_single_node(application_data):
+    """
+    Yield the entries of the ``ldf_single_node`` schedule one by one.
+
+    Args:
+        application_data (dict or ApplicationModel): Contains jobs and messages that indicate dependencies among jobs.
+
+    Returns:
+        iterator of dict: The schedule entries in placement order.
+    """
+    return _iter_schedule(compile_application(application_data), latest_deadline)
+
+
+def iter_edf_single_node(application_data):
+    """
+    Yield the entries of the ``edf_single_node`` schedule one by one.
+
+    Args:
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+
+    Returns:
+        iterator of dict: The schedule entries in placement order.
+    """
+    return _iter_schedule(compile_application(application_data), earliest_deadline)
+
+
+def iter_ll_multinode(application_data, platform_data, communication=False):
+    """
+    Yield the entries of the ``ll_multinode`` schedule one by one.
+
+    Args:
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        communication (bool): Account for the link delay and bandwidth of the messages between different nodes.
+
+    Returns:
+        iterator of dict: The schedule entries in placement order.
+    """
+    return _iter_schedule(compile_application(application_data), least_laxity,
+                          platform=compile_platform(platform_data), sweep=False, communication=communication)
+
+
+def iter_ldf_multinode(application_data, platform_data, communication=False):
+    """
+    Yield the entries of the ``ldf_multinode`` schedule one by one.
+
+    Args:
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        communication (bool): Account for the link delay and bandwidth of the messages between different nodes.
+
+    Returns:
+        iterator of dict: The schedule entries in placement order.
+    """
+    return _iter_schedule(compile_application(application_data), latest_deadline,
+                          platform=compile_platform(platform_data), communication=communication)
+
+
+def iter_edf_multinode(application_data, platform_data, communication=False):
+    """
+    Yield the entries of the ``edf_multinode`` schedule one by one.
+
+    Args:
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        communication (bool): Account for the link delay and bandwidth of the messages between different nodes.
+
+    Returns:
+        iterator of dict: The schedule entries in placement order.
+    """
+    return _iter_schedule(compile_application(application_data), earliest_deadline,
+                          platform=compile_platform(platform_data), communication=communication)
+
+
+## Capabilities of a scheduling algorithm: single-node algorithms only take the application, multi-node algorithms
+## also take the platform and, if communication aware, the flag to account for messages between nodes. The
+## generator variant takes the same arguments as the function. The priority key function and the sweep mode are
+## those the algorithm passes to the list-scheduling core, for callers resuming a placement with ``place_jobs``
+Algorithm = namedtuple("Algorithm", ["function", "name", "multinode", "communication_aware", "generator", "priority",
+                                     "sweep"])
+
+## Registry of the scheduling algorithms by name
+ALGORITHMS = {
+    "ldf_single_node": Algorithm(ldf_single_node, "LDF Single Node", False, False, iter_ldf_single_node,
+                                 latest_deadline, True),
+    "edf_single_node": Algorithm(edf_single_node, "EDF Single Node", False, False, iter_edf_single_node,
+                                 earliest_deadline, True),
+    "ll_multinode": Algorithm(ll_multinode, "LL Multi Node", True, True, iter_ll_multinode, least_laxity, False),
+    "ldf_multinode": Algorithm(ldf_multinode, "LDF Multi Node", True, True, iter_ldf_multinode, latest_deadline,
+                               True),
+    "edf_multinode": Algorithm(edf_multinode, "EDF Multi Node", True, True, iter_edf_multinode, earliest_deadline,
+                               True),
+}
+
+
+def run_algorithm(name, application_data, platform_data=None, communication=False, timings=None):
+    """
+    Run a registered scheduling algorithm with the arguments it supports.
+
+    With ``timings`` the generator variant is run instead, timing the setup of the scheduler state up to the first
+    placed job as the phase ``<name>.setup`` and the placement of the remaining jobs as ``<name>.loop``. The result
+    is the same either way.
+
+    Args:
+        name (str): Name of the algorithm in ``ALGORITHMS``.
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel, optional): The platform, required by multi-node algorithms.
+        communication (bool): Account for the messages between nodes, if the algorithm supports it.
+        timings (metrics.Timings, optional): Receives the durations of the phases of the algorithm.
+
+    Raises:
+        KeyError: If no algorithm is registered under ``name``.
+
+    Returns:
+        dict: The result of the algorithm.
+    """
+    if timings is None:
+        return _call(ALGORITHMS[name].function, name, application_data, platform_data, communication)
+    start = time.perf_counter()
+    entries = iter_algorithm(name, application_data, platform_data, communication)
+    schedule = list(islice(entries, 1))
+    setup = time.perf_counter()
+    schedule.extend(entries)
+    timings.add(f"{name}.setup", setup - start)
+    timings.add(f"{name}.loop", time.perf_counter() - setup)
+    return {"schedule": schedule, "name": ALGORITHMS[name].name}
+
+
+def iter_algorithm(name, application_data, platform_data=None, communication=False):
+    """
+    Run the generator variant of a registered scheduling algorithm with the arguments it supports.
+
+    Args:
+        name (str): Name of the algorithm in ``ALGORITHMS``.
+        application_data (dict or ApplicationModel): Job data including dependencies represented by messages between jobs.
+        platform_data (dict or PlatformModel, optional): The platform, required by multi-node algorithms.
+        communication (bool): Account for the messages between nodes, if the algorithm supports it.
+
+    Raises:
+        KeyError: If no algorithm is registered under ``name``.
+
+    Returns:
+        iterator of dict: The schedule entries in placement order.
+    """
+    return _call(ALGORITHMS[name].generator, name, application_data, platform_data, communication)
+
+
+def _call(function, name, application_data, platform_data, communication):
+    """Call a variant of the algorithm registered under ``name`` with the arguments it supports."""
+    algorithm = ALGORITHMS[name]
+    if not algorithm.multinode:
+        return function(application_data)
+    if algorithm.communication_aware:
+        return function(application_data, platform_data, communication)
+    return function(application_data, platform_data)
+
+
+def run_pickled(name, payload, timed=False):
+    """
+    Run a registered scheduling algorithm on models that were pickled once by the caller, e.g. in a worker process.
+
+    Args:
+        name (str): Name of the algorithm in ``ALGORITHMS``.
+        payload (bytes): Pickled ``(application_data, platform_data, communication)`` tuple.
+        timed (bool): Time the phases of the algorithm, see ``run_algorithm``.
+
+    Returns:
+        dict: The result of the algorithm. If ``timed``, a tuple of the result and the durations of its phases.
+    """
+    if not timed:
+        return run_algorithm(name, *pickle.loads(payload))
+    timings = Timings()
+    return run_algorithm(name, *pickle.loads(payload), timings=timings), timings.durations
@@ -0,0 +1,243 @@
+"""
+This module checks before scheduling whether an application can meet its deadlines at all.
+
+The schedulers place every job even if the deadlines are out of reach, so a hopeless model costs a full schedule and
+the response does not tell why its deadlines are missed. The pre-analysis computes bounds that hold for any
+schedule:
+
+- ASAP: the earliest start of every task, when each task starts as soon as its predecessors are done, with as many
+  nodes as needed and no communication delay.
+- ALAP: the latest start of every task that still lets the task and all of its successors meet their deadlines.
+- Slack: ALAP minus ASAP. A task with negative slack misses its deadline in every schedule.
+- Critical path: the length of the longest chain of execution times.
+- Utilization: the total execution time over the latest deadline. The peak load is the highest ratio of the execution
+  time due by a deadline to that deadline. The jobs due by a deadline can not need more nodes than the platform has,
+  so a peak load above the number of compute nodes rules the platform out. The single-node schedules start every
+  job once its predecessors are done without waiting for the node, so jobs may overlap there and the load does not
+  rule them out, only the deadlines of the chains do.
+
+Execution times are the WCETs, as used by the schedulers. A model that passes these necessary conditions may still
+miss deadlines, a model that fails one misses them for sure.
+
+ASAP and ALAP come from a level-synchronous topological sweep with NumPy when it is installed: the tasks are grouped
+into levels by Kahn's algorithm and each level is computed at once from the gathered predecessors or successors of
+its tasks, so the cost per task is a few vector operations. Deep graphs, whose levels hold only a few tasks, would
+spend their time in the per-level overhead, so their sweep falls back to the sequential one used without NumPy.
+
+Functions:
+- critical_times: ASAP and ALAP start of every task.
+- analyze: Schedulability report of an application on a platform.
+"""
+
+__version__ = "1.0.0"
+
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+## Average number of tasks per level below which the sweep is done task by task instead of level by level
+MIN_LEVEL_WIDTH = 64
+
+
+def critical_times(model):
+    """
+    Compute the earliest and latest start of every task.
+
+    Args:
+        model (ApplicationModel): The compiled application.
+
+    Raises:
+        ValueError: If the messages form a cycle.
+
+    Returns:
+        tuple: The ASAP and the ALAP start of every task index, NumPy arrays if NumPy is installed.
+    """
+    if np is None:
+        return _sweep_tasks(model)
+    times = _sweep_levels(model)
+    if times is None:
+        times = tuple(np.asarray(values, dtype=np.int64) for values in _sweep_tasks(model))
+    return times
+
+
+def analyze(model, platform=None, tasks=False):
+    """
+    Check the necessary conditions for an application to meet its deadlines, see the module docstring.
+
+    Args:
+        model (ApplicationModel): The compiled application.
+        platform (PlatformModel, optional): The platform of the multi-node schedules, only the single node is
+                                            checked if omitted.
+        tasks (bool): Add the ASAP and ALAP start and the slack of every task to the report.
+
+    The single-node verdict only rests on the slack of the tasks, the peak load only rules out the multi-node
+    schedules, see the module docstring.
+
+    Raises:
+        ValueError: If the messages form a cycle.
+
+    Returns:
+        dict: The report, with the critical path, the total execution time ("work"), the latest deadline
+              ("horizon"), the utilization and peak load, the number of tasks with negative slack and the task with
+              the least slack. For the "single_node" and, with a platform, the "multi_node" schedules it holds
+              whether they are "infeasible" and the "reasons". With ``tasks`` the per-task values follow in the
+              columnar format, as lists in task order under "task_ids", "asap", "alap" and "slack".
+    """
+    asap, alap = critical_times(model)
+    n = len(model)
+    if np is not None:
+        wcet, deadline = np.asarray(model.wcet, dtype=np.int64), np.asarray(model.deadline, dtype=np.int64)
+        slack = alap - asap
+        critical_path = int((asap + wcet).max()) if n else 0
+        late = int((slack < 0).sum())
+        least = int(slack.argmin()) if n else None
+        work, horizon = int(wcet.sum()), int(deadline.max()) if n else 0
+        order = np.argsort(deadline, kind="stable")
+        due, demand = deadline[order], np.cumsum(wcet[order])
+        positive = due > 0
+        peak = float((demand[positive] / due[positive]).max()) if positive.any() else 0.0
+    else:
+        wcet, deadline = model.wcet, model.deadline
+        slack = array("q", [latest - earliest for earliest, latest in zip(asap, alap)])
+        critical_path = max((start + duration for start, duration in zip(asap, wcet)), default=0)
+        late = sum(1 for value in slack if value < 0)
+        least = min(range(n), key=slack.__getitem__) if n else None
+        work, horizon = sum(wcet), max(deadline, default=0)
+        peak, demand = 0.0, 0
+        for i in sorted(range(n), key=deadline.__getitem__):
+            demand += wcet[i]
+            if deadline[i] > 0:
+                peak = max(peak, demand / deadline[i])
+
+    report = {
+        "tasks": n,
+        "messages": len(model.size),
+        "critical_path": critical_path,
+        "work": work,
+        "horizon": horizon,
+        "utilization": work / horizon if horizon > 0 else None,
+        "peak_load": peak,
+        "late_tasks": late,
+        "least_slack": {"task_id": model.ids[least], "slack": int(slack[least])} if least is not None else None,
+    }
+
+    reasons = []
+    if late:
+        reasons.append(f"{late} tasks can not meet their deadlines even without waiting for a node, e.g. task "
+                       f"{model.ids[least]} by {-int(slack[least])}.")
+    if model.blocked:
+        reasons.append(f"{len(model.blocked)} tasks wait for messages from senders that are not tasks.")
+    report["single_node"] = _verdict(reasons)
+    if platform is not None:
+        nodes = len(platform.compute)
+        report["compute_nodes"] = nodes
+        report["multi_node"] = _verdict(
+            reasons + ([] if nodes else ["The platform has no compute nodes."]), peak, max(nodes, 1))
+
+    if tasks:
+        report["task_ids"] = list(model.ids)
+        for name, values in (("asap", asap), ("alap", alap), ("slack", slack)):
+            report[name] = [int(value) for value in values]
+    return report
+
+
+def _verdict(reasons, peak=None, nodes=None):
+    """
+    Decide whether a schedule is infeasible, given the reasons shared by all platforms and, for schedules that run
+    one job per node at a time, the peak load against their ``nodes``.
+    """
+    reasons = list(reasons)
+    if peak is not None and peak > nodes:
+        reasons.append(f"The peak load of {peak:.3g} exceeds the {nodes} available node{'s' * (nodes > 1)}.")
+    return {"infeasible": bool(reasons), "reasons": reasons}
+
+
+def _sweep_tasks(model):
+    """Compute ASAP and ALAP task by task in topological order."""
+    graph, wcet, deadline = model.graph, model.wcet, model.deadline
+    pred_offsets, pred, succ_offsets, succ = graph.pred_offsets, graph.pred, graph.succ_offsets, graph.succ
+    order = graph.topological_order(model.ids)
+    asap = array("q", bytes(8 * len(order)))
+    for v in order:
+        start = 0
+        for k in range(pred_offsets[v], pred_offsets[v + 1]):
+            p = pred[k]
+            finish = asap[p] + wcet[p]
+            if finish > start:
+                start = finish
+        asap[v] = start
+    alap = array("q", asap)
+    for v in reversed(order):
+        finish = deadline[v]
+        for k in range(succ_offsets[v], succ_offsets[v + 1]):
+            latest = alap[succ[k]]
+            if latest < finish:
+                finish = latest
+        alap[v] = finish - wcet[v]
+    return asap, alap
+
+
+def _sweep_levels(model):
+    """
+    Compute ASAP and ALAP level by level with NumPy.
+
+    Returns:
+        tuple: ASAP and ALAP as NumPy arrays, or None if the graph has too many levels for the level-synchronous
+               sweep to pay off.
+    """
+    graph, n = model.graph, len(model)
+    pred_offsets, pred = np.asarray(graph.pred_offsets, dtype=np.int64), np.asarray(graph.pred, dtype=np.int64)
+    succ_offsets, succ = np.asarray(graph.succ_offsets, dtype=np.int64), np.asarray(graph.succ, dtype=np.int64)
+    wcet, deadline = np.asarray(model.wcet, dtype=np.int64), np.asarray(model.deadline, dtype=np.int64)
+
+    ## Kahn's algorithm one level at a time: a task joins the level after its last predecessor
+    remaining = np.diff(pred_offsets)
+    frontier = np.flatnonzero(remaining == 0)
+    levels, leveled = [], 0
+    while frontier.size:
+        levels.append(frontier)
+        leveled += frontier.size
+        if len(levels) > MIN_LEVEL_WIDTH and leveled < MIN_LEVEL_WIDTH * len(levels):
+            return None
+        targets, _ = _gather(succ_offsets, succ, frontier)
+        targets, counts = np.unique(targets, return_counts=True)
+        remaining[targets] -= counts
+        frontier = targets[remaining[targets] == 0]
+    if leveled < n:
+        raise ValueError(f"Cyclic dependency detected at job {model.ids[int(np.flatnonzero(remaining)[0])]}.")
+
+    ## Every task after the first level has predecessors, all of them on earlier levels
+    asap = np.zeros(n, dtype=np.int64)
+    for level in levels[1:]:
+        sources, counts = _gather(pred_offsets, pred, level)
+        asap[level] = np.maximum.reduceat(asap[sources] + wcet[sources], np.cumsum(counts) - counts)
+
+    ## Successors are on later levels, tasks without successors only have their own deadline
+    alap = deadline - wcet
+    for level in reversed(levels):
+        targets, counts = _gather(succ_offsets, succ, level)
+        linked = counts > 0
+        if not linked.any():
+            continue
+        starts = (np.cumsum(counts) - counts)[linked]
+        tasks = level[linked]
+        alap[tasks] = np.minimum(deadline[tasks], np.minimum.reduceat(alap[targets], starts)) - wcet[tasks]
+    return asap, alap
+
+
+def _gather(offsets, neighbours, vertices):
+    """
+    Gather the CSR neighbours of some vertices.
+
+    Returns:
+        tuple: The neighbours of all vertices in order, and the number of neighbours of every vertex.
+    """
+    starts = offsets[vertices]
+    counts = offsets[vertices + 1] - starts
+    ends = np.cumsum(counts)
+    positions = np.arange(int(ends[-1]) if ends.size else 0) + np.repeat(starts - (ends - counts), counts)
+    return neighbours[positions], counts
@@ -6,6 +6,20 @@ to calculate schedules based on different scheduling algorithms.
 
 Endpoints:
 - POST /schedule_jobs: Accepts JSON payload to schedule jobs based on application and platform data.
+- POST /schedule_jobs/stream: Same as /schedule_jobs, streaming the schedule entries as NDJSON while they are placed.
+- POST /analyze: Checks whether the deadlines of an application can be met at all, before scheduling it.
+- POST /simulate: Simulates preemptive EDF, RMS and LL on the application as a periodic task set.
+- POST /schedule_batch: Schedules many applications against one platform in worker processes, streaming the results.
+- POST /jobs: Queues a scheduling request as a job and returns its id at once.
+- GET /jobs/{job_id}: Reports the status of a job, and its schedules once it is done.
+- DELETE /jobs/{job_id}: Cancels a job.
+- POST /sessions: Keeps an application and platform on the server with their schedules, to be edited by deltas.
+- GET /sessions/{session_id}: Returns the current schedules of a session.
+- PATCH /sessions/{session_id}: Applies a delta to the application of a session and returns the changed schedules.
+- DELETE /sessions/{session_id}: Drops a session.
+- GET /algorithms: Lists the registered scheduling algorithms and their capabilities.
+- GET /metrics: Exposes the per-phase latency histograms and model sizes of /schedule_jobs in the Prometheus format.
+- GET /stats: Reports the hit and miss counters of the caches, the number of jobs in every state and the sessions.
 - GET /: Provides a basic test endpoint to confirm the app is running.
 
 See the function docstrings within this module for more detailed API documentation.
@@ -17,20 +31,93 @@ __version__ = "1.0.0"
 
 from fastapi import HTTPException
 from fastapi import FastAPI
+from fastapi import Header
+from fastapi import Query
+from fastapi import Request
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 import uvicorn
+import asyncio
+import hashlib
 import json
 import jsonschema
-from jsonschema import validate
+import logging
 import os
+import pickle
+import random
+from typing import List, Optional
 
-from config import SERVER_PORT, SERVER_HOST
+from config import SERVER_PORT, SERVER_HOST, PLATFORM_CACHE_BYTES
+from config import RESULT_CACHE_BYTES, RESULT_CACHE_TTL, RESULT_CACHE_DIR
+from config import EXECUTION_MODE, PROCESS_POOL_WORKERS
+from config import LOG_LEVEL, PAYLOAD_LOG_SAMPLE_RATE
+from config import OUTPUT_VALIDATION, OUTPUT_VALIDATION_SAMPLE_RATE
+from config import JOB_WORKERS, JOB_QUEUE_SIZE, JOB_TIMEOUT, JOB_MAX_TIMEOUT, JOB_RETENTION, JOB_RESULT_BYTES
+from config import METRICS_ENABLED
+from config import SESSION_CACHE_BYTES, SESSION_TTL, SESSION_CHECKPOINT_INTERVAL
+from config import SIMULATION_MAX_JOBS
 import algorithms as alg
+import analysis
+import batch
+from cache import LRUCache, ResultCache, content_hash
+from encoding import JSON_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE, NDJSON_MEDIA_TYPE
+from encoding import dumps, iter_ndjson, negotiate, to_columnar
+from ingest import RequestReader
+from jobs import DONE, JobQueue, QueueFull
+from metrics import NO_TIMINGS, REGISTRY, TEXT_MEDIA_TYPE, Timings
+from model import compile_application
+from session import Session
+from simulation import SIMULATIONS, run_simulation
+from topology import compile_platform
+from validation import SchemaValidator
 
 
+class LazyJSON:
+    """Defers the JSON encoding of a logged payload until a handler actually emits the record."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return json.dumps(self.data, indent=4)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Lets through only a random fraction of the records of a logger.
+
+    A caller that has to collect a payload before logging it draws the decision up front with ``sample`` and logs
+    the record with ``extra={"sampled": True}``, so it is not sampled a second time.
+    """
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def sample(self):
+        """Decide whether a record is let through."""
+        return self.rate >= 1 or random.random() < self.rate
+
+    def filter(self, record):
+        return getattr(record, "sampled", False) or self.sample()
+
+
+logger = logging.getLogger("backend")
+## Full request and response payloads, only encoded when debug logging is enabled and the record is sampled
+payload_logger = logging.getLogger("backend.payload")
+payload_sampling = SamplingFilter(PAYLOAD_LOG_SAMPLE_RATE)
+payload_logger.addFilter(payload_sampling)
+
 script_dir = os.path.dirname(__file__)
 input_schema_file = os.path.join(script_dir, "input_schema.json")
 output_schema_file = os.path.join(script_dir, "output_schema.json")
+output_schema_columnar_file = os.path.join(script_dir, "output_schema_columnar.json")
 
 ## Load the input and output schema
 with open(input_schema_file) as f:
@@ -39,7 +126,97 @@ with open(input_schema_file) as f:
 with open(output_schema_file) as f:
     output_schema = json.load(f)
 
-app = FastAPI()
+with open(output_schema_columnar_file) as f:
+    output_schema_columnar = json.load(f)
+
+## Entry fields of the columnar format, one array each
+columnar_fields = list(output_schema_columnar["properties"]["schedule"]["properties"])
+
+## Build the validators once, this also checks the schemas themselves
+request_reader = RequestReader(input_schema)
+input_validator = request_reader.request
+output_validators = {
+    JSON_MEDIA_TYPE: SchemaValidator(output_schema),
+    COLUMNAR_MEDIA_TYPE: SchemaValidator(output_schema_columnar),
+}
+## Single schedule entries, as streamed by /schedule_jobs/stream
+entry_validator = SchemaValidator(
+    dict(output_schema["properties"]["schedule"]["items"], **{"$schema": output_schema["$schema"]}))
+
+## Batches of applications against one platform, the applications are validated one by one by the workers
+batch_validator = SchemaValidator({
+    "$schema": input_schema["$schema"],
+    "type": "object",
+    "properties": {
+        "platform": input_schema["properties"]["platform"],
+        "applications": {"type": "array", "items": {"type": "object"}},
+    },
+    "required": ["platform", "applications"],
+})
+
+## Deltas of PATCH /sessions/{session_id}. Updates and removals only carry some fields of a task or message, which
+## fields an op needs is checked while the changes are applied
+application_schema = input_schema["properties"]["application"]["properties"]
+delta_validator = SchemaValidator({
+    "$schema": input_schema["$schema"],
+    "type": "object",
+    "properties": {
+        "changes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "op": {"enum": ["add", "update", "remove"]},
+                    "task": {"type": "object", "properties": application_schema["tasks"]["items"]["properties"],
+                             "required": ["id"]},
+                    "message": {"type": "object", "properties": application_schema["messages"]["items"]["properties"],
+                                "required": ["id"]},
+                },
+                "required": ["op"],
+            },
+        },
+    },
+    "required": ["changes"],
+})
+
+## Compiled platforms by content hash, requests against the same platform share the topology and its routes
+platform_cache = LRUCache(PLATFORM_CACHE_BYTES)
+## Encoded responses by content hash of the request, identical requests are answered without scheduling
+result_cache = ResultCache(RESULT_CACHE_BYTES, RESULT_CACHE_TTL, RESULT_CACHE_DIR) if RESULT_CACHE_BYTES else None
+## Keys of the cached responses by the digest of the raw body, so a repeated body is answered before it is parsed.
+## A key takes a few hundred bytes against the kilobytes of a response, a 64th of the bound fits the keys of all.
+response_keys = LRUCache(RESULT_CACHE_BYTES // 64, RESULT_CACHE_TTL)
+## Estimated memory of an entry of ``response_keys``
+RESPONSE_KEY_BYTES = 256
+## Scheduling requests submitted to /jobs, run by a bounded pool of worker threads
+job_queue = JobQueue(JOB_WORKERS, JOB_QUEUE_SIZE, JOB_RETENTION, JOB_RESULT_BYTES)
+## Sessions of /sessions by id, bounded by their estimated memory and dropped once they were not edited for a while
+session_store = LRUCache(SESSION_CACHE_BYTES, SESSION_TTL)
+
+## Registered algorithms behind the schedules of the /schedule_jobs response
+schedules = {
+    "schedule1": "ldf_single_node",
+    "schedule2": "edf_single_node",
+    "schedule3": "ll_multinode",
+    "schedule4": "ldf_multinode",
+    "schedule5": "edf_multinode",
+}
+
+## Worker processes shared by all requests when EXECUTION_MODE is "process", started on first use
+process_pool = None
+
+
+@asynccontextmanager
+async def lifespan(app):
+    global process_pool
+    yield
+    job_queue.shutdown()
+    if process_pool is not None:
+        process_pool.shutdown(cancel_futures=True)
+        process_pool = None
+
+
+app = FastAPI(lifespan=lifespan)
 origins = [
     "http://localhost:3000",
     "http://localhost:3001",
@@ -55,8 +232,13 @@ app.add_middleware(
 )
 
 
-@app.post("/schedule_jobs")
-def schedule_jobs(data: dict):
+## Request bodies are read incrementally, so their schema is declared for the API documentation only
+request_body = {"requestBody": {"required": True, "content": {"application/json": {"schema": input_schema}}}}
+
+
+@app.post("/schedule_jobs", openapi_extra=request_body)
+async def schedule_jobs(request: Request, communication: bool = False, algorithms: Optional[List[str]] = Query(None),
+                        reject_infeasible: bool = False, accept: Optional[str] = Header(None)):
     """
     Schedule jobs based on the provided application and platform data.
 
@@ -65,11 +247,41 @@ def schedule_jobs(data: dict):
     Rate Monotonic (RMS) and Least Laxity (LL) scheduling algorithms
     on single-core setups.
 
+    The algorithms run one after another in a worker thread, or concurrently in the shared process pool when
+    EXECUTION_MODE is "process", so the event loop stays responsive either way.
+
+    Identical requests are answered from the result cache. A body that was answered before is recognized by the
+    digest of its bytes before it is parsed, any other body is parsed and validated incrementally, see
+    ``parse_body``, and looked up by its content key, so reformatted requests are answered from the cache as well.
+
+    Unless METRICS_ENABLED is off, the duration of every phase of the request is observed for /metrics and listed
+    in the Server-Timing header of the response.
+
+    With ``reject_infeasible`` the application is checked by the pre-analysis of /analyze first, and refused without
+    scheduling if none of the requested schedules can meet its deadlines.
+
+    The algorithms place every task once without preemption, /simulate runs the preemptive policies on the tasks as
+    periodic jobs instead.
+
+    Schedules are sent as lists of entries by default. A request accepting "application/vnd.schedule.columnar+json"
+    receives every schedule as one array per entry field instead, as defined by output_schema_columnar.json.
+
     Args:
-        data (dict): A dictionary containing 'application' and 'platform' data necessary for scheduling.
+        request (Request): The request, its JSON body contains the 'application' and 'platform' data necessary for
+                           scheduling.
+        communication (bool): Query parameter, make the multi-node schedules account for the link delay and
+                              bandwidth of messages between different nodes.
+        algorithms (list of str): Query parameter, names of the algorithms to run, repeated or comma separated.
+                                  All five schedules are calculated if omitted.
+        reject_infeasible (bool): Query parameter, refuse applications that miss their deadlines in every requested
+                                  schedule, see ``analysis``.
+        accept (str): Accept header, picks the default or the columnar response format.
 
     Raises:
-        HTTPException: If the 'application' or 'platform' data is missing or malformed, a 400 error is raised.
+        HTTPException: If the 'application' or 'platform' data is missing or malformed, or an unknown algorithm
+                       is requested, a 400 error is raised. If neither response format is acceptable, a 406
+                       error is raised. If ``reject_infeasible`` is set and the deadlines can not be met, a 422 error
+                       is raised whose detail holds the analysis report.
 
     Returns:
         dict: A dictionary containing schedules calculated using different algorithms:
@@ -77,45 +289,971 @@ def schedule_jobs(data: dict):
               - schedule2: Schedule using Earliest Deadline First (EDF) scheduling on single-core.
               - schedule3: Schedule using Rate Monotonic Scheduling (RMS) on single-core.
               - schedule4: Schedule using Least Laxity (LL) on single-core.
+              Only the schedules of the requested algorithms are included.
+    """
+
+    selected = select_schedules(algorithms)
+    media_type = negotiate(accept)
+    if media_type is None:
+        raise HTTPException(406, f"Acceptable formats: {JSON_MEDIA_TYPE}, {COLUMNAR_MEDIA_TYPE}")
+    headers = {"Vary": "Accept"}
+    timings = Timings() if METRICS_ENABLED else NO_TIMINGS
+
+    chunks, body_digest = await receive_body(request, timings)
+
+    ## Answer identical requests from the result cache, only valid requests are ever stored. Rejecting requests
+    ## must not be answered by the schedules of an earlier request that did not ask to reject.
+    options = [communication, list(selected), media_type] + ["reject"] * reject_infeasible
+    result_key = body_key = None
+    if result_cache is not None:
+        body_key = content_hash([body_digest] + options)
+        cached = cached_response(body_key)
+        if cached is not None:
+            return Response(cached, media_type=media_type, headers=timing_headers(headers, timings))
+
+    key, data, application_data = await parse_body(chunks, timings)
+    if result_cache is not None:
+        result_key = content_hash([key] + options)
+        cached = result_cache.get(result_key)
+        if cached is not None:
+            response_keys.put(body_key, result_key, RESPONSE_KEY_BYTES)
+            return Response(cached, media_type=media_type, headers=timing_headers(headers, timings))
+
+    application_data, platform_data = await run_in_threadpool(
+        compile_models, application_data, data["platform"], communication, timings)
+    if reject_infeasible:
+        await run_in_threadpool(check_feasible, application_data, platform_data, selected, timings)
+    response = await run_algorithms(application_data, platform_data, communication, selected, timings)
+    encoded = await run_in_threadpool(encode_response, response, media_type, timings)
+    if result_key is not None:
+        result_cache.put(result_key, encoded)
+        response_keys.put(body_key, result_key, RESPONSE_KEY_BYTES)
+    return Response(encoded, media_type=media_type, headers=timing_headers(headers, timings))
+
+
+def check_feasible(application_data, platform_data, selected, timings=NO_TIMINGS):
     """
+    Refuse an application that misses its deadlines in every selected schedule, as shown by the pre-analysis.
+
+    Args:
+        application_data (ApplicationModel): The compiled application.
+        platform_data (PlatformModel): The compiled platform.
+        selected (dict): Algorithm name by schedule key.
+        timings (Timings): Receives the time spent in the analysis as "analysis".
 
-    print("Received JSON data:", json.dumps(data, indent=4))
+    Raises:
+        HTTPException: If no selected schedule can meet the deadlines, a 422 error is raised whose detail holds the
+                       reasons and the analysis report.
+    """
+    with timings.phase("analysis"):
+        report = analysis.analyze(application_data, platform_data)
+    kinds = {"multi_node" if alg.ALGORITHMS[name].multinode else "single_node" for name in selected.values()}
+    if all(report[kind]["infeasible"] for kind in kinds):
+        reasons = [reason for kind in sorted(kinds) for reason in report[kind]["reasons"]]
+        logger.info("Application can not meet its deadlines: %s", " ".join(reasons))
+        raise HTTPException(422, {"error": "The deadlines can not be met", "reasons": reasons, "analysis": report})
+
+
+def timing_headers(headers, timings):
+    """Observe the timings of a request and add its Server-Timing header, if metrics are enabled."""
+    server_timing = timings.finish()
+    if server_timing is not None:
+        headers["Server-Timing"] = server_timing
+    return headers
+
+
+@app.post("/schedule_jobs/stream", openapi_extra=request_body)
+async def schedule_jobs_stream(request: Request, communication: bool = False,
+                               algorithms: Optional[List[str]] = Query(None)):
+    """
+    Schedule jobs like /schedule_jobs, streaming the schedule entries as newline-delimited JSON.
+
+    The request is validated before the response starts. The algorithms then run one after another while the
+    response is sent, each entry being encoded as soon as it is placed, so the memory held by the server is bounded
+    by the scheduler state instead of the size of the schedules. Every schedule starts with a line holding its
+    schedule key and algorithm name, followed by one line per entry as defined by the items of the output schema:
+
+        {"schedule": "schedule1", "name": "LDF Single Node"}
+        {"task_id": 0, "node_id": 0, "start_time": 0, "end_time": 5, "deadline": 20}
+
+    Errors found once the response has started, e.g. a message without a route between two nodes, end the
+    stream with a line of the form ``{"error": "..."}``.
+
+    Args:
+        request (Request): The request, its JSON body contains the 'application' and 'platform' data necessary for
+                           scheduling.
+        communication (bool): Query parameter, make the multi-node schedules account for the messages between nodes.
+        algorithms (list of str): Query parameter, names of the algorithms to run, all five if omitted.
+
+    Raises:
+        HTTPException: If the request is invalid or an unknown algorithm is requested, a 400 error is raised.
+
+    Returns:
+        StreamingResponse: The NDJSON stream of the schedules.
+    """
+    selected = select_schedules(algorithms)
+    _, data, application_data = await read_request(request)
+    application_data, platform_data = await run_in_threadpool(
+        compile_models, application_data, data["platform"], communication)
+    lines = iter_schedules(application_data, platform_data, communication, selected)
+    return StreamingResponse(iter_ndjson(lines), media_type=NDJSON_MEDIA_TYPE)
+
+
+def iter_schedules(application_data, platform_data, communication=False, selected=None):
+    """
+    Yield the lines of a /schedule_jobs/stream response.
+
+    Args:
+        application_data (ApplicationModel): The compiled application.
+        platform_data (PlatformModel): The compiled platform.
+        communication (bool): Make the multi-node schedules account for the messages between nodes.
+        selected (dict, optional): Algorithm name by schedule key, all schedules if omitted.
+
+    Yields:
+        dict: A header per schedule followed by its entries, or an error ending the stream.
+    """
+    if selected is None:
+        selected = schedules
+    validate = output_validation_enabled()
+    for key, name in selected.items():
+        yield {"schedule": key, "name": alg.ALGORITHMS[name].name}
+        try:
+            for entry in alg.iter_algorithm(name, application_data, platform_data, communication):
+                if validate and not entry_validator.is_valid(entry):
+                    logger.error("Output data is not valid: %s", entry)
+                    yield {"error": "Invalid Output Schema"}
+                    return
+                yield entry
+        except ValueError as err:
+            logger.info("Input data can not be scheduled: %s", err)
+            yield {"error": str(err)}
+            return
+
+
+@app.post("/analyze", openapi_extra=request_body)
+async def analyze_application(request: Request, tasks: bool = False):
+    """
+    Check whether the deadlines of an application can be met at all, without scheduling it.
+
+    The pre-analysis computes the earliest (ASAP) and latest (ALAP) start of every task, their slack, the critical
+    path and the load of the application against the compute nodes of the platform, see the ``analysis`` module.
+    For the single-node and the multi-node schedules it reports whether they are certain to miss deadlines and why.
+    It costs a fraction of a schedule, so a client can check a model before asking for its schedules.
+
+    Args:
+        request (Request): The request, with the same body as /schedule_jobs.
+        tasks (bool): Query parameter, add the ASAP and ALAP start and the slack of every task.
+
+    Raises:
+        HTTPException: If the request is invalid or the messages form a cycle, a 400 error is raised.
+
+    Returns:
+        Response: The analysis report, see ``analysis.analyze``.
+    """
+    _, data, application_data = await read_request(request)
+    application_data, platform_data = await run_in_threadpool(compile_models, application_data, data["platform"])
+    report = await run_in_threadpool(analysis.analyze, application_data, platform_data, tasks)
+    return Response(dumps(report), media_type=JSON_MEDIA_TYPE)
+
+
+@app.post("/simulate", openapi_extra=request_body)
+async def simulate_application(request: Request, simulations: Optional[List[str]] = Query(None),
+                               horizon: Optional[int] = Query(None, gt=0)):
+    """
+    Simulate preemptive scheduling policies on the tasks of an application as periodic jobs.
+
+    Every task releases a job at each multiple of its deadline, which is taken as its period, until the horizon.
+    The discrete-event simulation of the ``simulation`` module runs preemptive EDF, RMS and LL on a single node and
+    on the compute nodes of the platform, the messages are not modelled. Every stretch a job runs on a node is a
+    schedule entry, so a preempted job has several entries with the deadline of the job.
+
+    Args:
+        request (Request): The request, with the same body as /schedule_jobs.
+        simulations (list of str): Query parameter, names of the simulations to run, repeated or comma separated.
+                                   All six are run if omitted.
+        horizon (int): Query parameter, jobs are released before this time, the hyperperiod of the tasks if omitted.
+
+    Raises:
+        HTTPException: If the request is invalid, an unknown simulation is requested, a task has no positive
+                       deadline or the simulations would release more than SIMULATION_MAX_JOBS jobs, a 400 error
+                       is raised.
+
+    Returns:
+        Response: The schedule and display name of every simulation by its name.
+    """
+    if simulations:
+        names = [name.strip() for entry in simulations for name in entry.split(",") if name.strip()]
+        unknown = set(names) - set(SIMULATIONS)
+        if unknown:
+            raise HTTPException(400, f"Unknown simulations: {', '.join(sorted(unknown))}")
+        selected = [name for name in SIMULATIONS if name in names]
+    else:
+        selected = list(SIMULATIONS)
+    _, data, application_data = await read_request(request)
+    application_data, platform_data = await run_in_threadpool(compile_models, application_data, data["platform"])
+    response = {}
+    for name in selected:
+        try:
+            response[name] = await run_in_threadpool(
+                run_simulation, name, application_data, platform_data, horizon, SIMULATION_MAX_JOBS)
+        except ValueError as err:
+            logger.info("Input data can not be simulated: %s", err)
+            raise HTTPException(400, str(err))
+    encoded = await run_in_threadpool(encode_response, response)
+    return Response(encoded, media_type=JSON_MEDIA_TYPE)
 
-    ## Validate the input as per input schema
+
+@app.post("/schedule_batch")
+async def schedule_batch(data: dict, communication: bool = False, algorithms: Optional[List[str]] = Query(None)):
+    """
+    Schedule many applications against one platform, streaming a result line per application as NDJSON.
+
+    The platform is validated, compiled and routed once for the whole batch. The applications are spread in chunks
+    over the shared process pool, where each is validated, compiled, scheduled and encoded, so the throughput grows
+    with the number of worker processes. Lines are sent as soon as their chunk is done, so they may arrive out of
+    order, each holding the position of its application in the batch:
+
+        {"index": 0, "schedules": {"schedule1": {"schedule": [...], "name": "LDF Single Node"}, ...}}
+        {"index": 1, "error": "Invalid Input schema: 'wcet' is a required property"}
+
+    An invalid application only fails its own line.
+
+    Args:
+        data (dict): The 'platform' shared by the batch and the list of 'applications', each like the 'application'
+                     of /schedule_jobs.
+        communication (bool): Query parameter, make the multi-node schedules account for the messages between nodes.
+        algorithms (list of str): Query parameter, names of the algorithms to run, all five if omitted.
+
+    Raises:
+        HTTPException: If the platform is invalid, 'applications' is not a list or an unknown algorithm is
+                       requested, a 400 error is raised.
+
+    Returns:
+        StreamingResponse: The NDJSON stream of the results.
+    """
+    selected = select_schedules(algorithms)
     try:
-        validate(instance=data, schema=input_schema)
-        print("Input data is valid.")
+        batch_validator.validate(data)
     except jsonschema.exceptions.ValidationError as err:
-        print("Input data is invalid:", err)
+        logger.info("Batch is invalid: %s", err.message)
         raise HTTPException(400, "Invalid Input schema")
+    try:
+        platform_data = await run_in_threadpool(get_platform, data["platform"])
+    except ValueError as err:
+        logger.info("Batch is invalid: %s", err)
+        raise HTTPException(400, str(err))
+    ## The workers can not fill the routing tables of the cached platform, so route it before pickling it once
+    if communication:
+        await run_in_threadpool(platform_data.precompute_routes)
+    payload = pickle.dumps((platform_data, selected, communication, output_validation_enabled()),
+                           pickle.HIGHEST_PROTOCOL)
+    return StreamingResponse(iter_batch(payload, data["applications"]), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def iter_batch(payload, applications):
+    """
+    Schedule the applications of a batch in the process pool, yielding the result lines of every chunk once done.
+
+    Only a couple of chunks per worker are in flight at a time, so a slow client holds back the workers instead of
+    letting the results pile up in memory.
+
+    Args:
+        payload (bytes): Pickled platform and settings of the batch, see ``batch.run_chunk``.
+        applications (list of dict): The applications of the batch.
+
+    Yields:
+        bytes: NDJSON result lines of a chunk of applications.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    workers = PROCESS_POOL_WORKERS or os.cpu_count() or 1
+    size = min(64, max(1, -(-len(applications) // (4 * workers))))
+    starts = iter(range(0, len(applications), size))
+    pending = set()
+    try:
+        while True:
+            for start in starts:
+                pending.add(loop.run_in_executor(
+                    pool, batch.run_chunk, payload, start, applications[start:start + size]))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+@app.post("/jobs", status_code=202, openapi_extra=request_body)
+async def submit_job(request: Request, communication: bool = False, algorithms: Optional[List[str]] = Query(None),
+                     timeout: Optional[float] = Query(None, gt=0)):
+    """
+    Queue a scheduling request as a job, to be polled with GET /jobs/{job_id}.
+
+    The body is read and validated like that of /schedule_jobs before the job is queued, so an invalid request is
+    refused at once. The job then runs in one of the JOB_WORKERS worker threads with the generator variants of the
+    algorithms and is stopped between two schedule entries once it is cancelled or its deadline has passed, so a
+    huge model neither blocks an HTTP worker nor holds a job worker beyond its deadline. A request answered by the
+    result cache of /schedule_jobs is done at once.
+
+    Args:
+        request (Request): The request, its JSON body contains the 'application' and 'platform' data necessary for
+                           scheduling.
+        communication (bool): Query parameter, make the multi-node schedules account for the messages between nodes.
+        algorithms (list of str): Query parameter, names of the algorithms to run, all five if omitted.
+        timeout (float): Query parameter, seconds from the submission until the job is stopped, JOB_TIMEOUT if
+                         omitted and at most JOB_MAX_TIMEOUT.
+
+    Raises:
+        HTTPException: If the request is invalid or an unknown algorithm is requested, a 400 error is raised. If
+                       JOB_QUEUE_SIZE jobs are queued or running already, a 503 error is raised.
+
+    Returns:
+        Response: The status of the job, see ``Job.info``, with its URL in the Location header.
+    """
+    selected = select_schedules(algorithms)
+    chunks, body_digest = await receive_body(request)
+    timeout = min(timeout or JOB_TIMEOUT, JOB_MAX_TIMEOUT)
+
+    ## Look the request up in the result cache of /schedule_jobs by its body, then by its content
+    options = [communication, list(selected), JSON_MEDIA_TYPE]
+    result_key = body_key = cached = None
+    if result_cache is not None:
+        body_key = content_hash([body_digest] + options)
+        cached = cached_response(body_key)
+    if cached is None:
+        key, data, application_data = await parse_body(chunks)
+        if result_cache is not None:
+            result_key = content_hash([key] + options)
+            cached = result_cache.get(result_key)
+            if cached is not None:
+                response_keys.put(body_key, result_key, RESPONSE_KEY_BYTES)
+    try:
+        if cached is not None:
+            job = job_queue.store(cached)
+            return job_response(job, 202, include_result=False)
+        job = job_queue.submit(run_job, application_data, data["platform"], communication, selected, result_key,
+                               timeout=timeout)
+    except QueueFull as err:
+        logger.warning("Job refused: %s", err)
+        raise HTTPException(503, "Too many jobs, try again later", headers={"Retry-After": "1"})
+    logger.info("Job %s queued", job.id)
+    return job_response(job, 202, include_result=False)
+
+
+@app.get("/jobs/{job_id}")
+def read_job(job_id: str):
+    """
+    Report the status of a job submitted to POST /jobs.
+
+    Args:
+        job_id (str): Id of the job.
+
+    Raises:
+        HTTPException: If there is no such job or its retention window has passed, a 404 error is raised.
+
+    Returns:
+        Response: The status of the job, see ``Job.info``. Once the job is done, its "result" holds the schedules
+                  in the format of the /schedule_jobs response.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(404, "Unknown job")
+    return job_response(job)
+
+
+@app.delete("/jobs/{job_id}")
+def cancel_job(job_id: str):
+    """
+    Cancel a job submitted to POST /jobs. A queued job is cancelled at once, a running job after its current
+    schedule entry. A finished job is left as it is.
+
+    Args:
+        job_id (str): Id of the job.
+
+    Raises:
+        HTTPException: If there is no such job or its retention window has passed, a 404 error is raised.
+
+    Returns:
+        Response: The status of the job, see ``Job.info``.
+    """
+    job = job_queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(404, "Unknown job")
+    logger.info("Job %s cancelled", job_id)
+    return job_response(job, include_result=False)
+
+
+def run_job(job, application_data, platform_data, communication, selected, result_key=None):
+    """
+    Calculate the schedules of a job, checking between the schedule entries whether the job has to stop.
+
+    Args:
+        job (Job): The running job.
+        application_data (ApplicationModel): The application of the request.
+        platform_data (dict): The platform section of the request.
+        communication (bool): Make the multi-node schedules account for the messages between nodes.
+        selected (dict): Algorithm name by schedule key.
+        result_key (str, optional): Key of the result in the result cache of /schedule_jobs, not cached if omitted.
+
+    Raises:
+        ValueError: If the application can not be scheduled on the platform or the schedules are invalid.
+        JobStopped: If the job was cancelled or its deadline has passed.
+
+    Returns:
+        bytes: The JSON encoded schedules, as in the /schedule_jobs response.
+    """
+    try:
+        application_data, platform_data = compile_models(application_data, platform_data, communication)
+        response = {}
+        for key, name in selected.items():
+            job.check()
+            schedule = []
+            for entry in alg.iter_algorithm(name, application_data, platform_data, communication):
+                schedule.append(entry)
+                job.check()
+            response[key] = {"schedule": schedule, "name": alg.ALGORITHMS[name].name}
+        encoded = encode_response(response)
+    except HTTPException as err:
+        raise ValueError(err.detail) from None
+    if result_key is not None and result_cache is not None:
+        result_cache.put(result_key, encoded)
+    return encoded
+
+
+def job_response(job, status_code=200, include_result=True):
+    """
+    Encode the status of a job, splicing in its encoded result once it is done.
+
+    Args:
+        job (Job): The job.
+        status_code (int): Status code of the response.
+        include_result (bool): Add the result of a done job.
+
+    Returns:
+        Response: The JSON response, with the URL of the job in the Location header.
+    """
+    body = dumps(job.info())
+    if include_result and job.status == DONE:
+        body = body[:-1] + b',"result":' + job.result + b"}"
+    return Response(body, status_code=status_code, media_type=JSON_MEDIA_TYPE, headers={"Location": f"/jobs/{job.id}"})
+
+
+@app.post("/sessions", status_code=201)
+async def create_session(data: dict, communication: bool = False, algorithms: Optional[List[str]] = Query(None)):
+    """
+    Keep an application and platform on the server with their schedules, to be edited by PATCH /sessions/{session_id}.
+
+    The application is compiled and scheduled once, leaving checkpoints of every schedule behind. An edit is then
+    rescheduled from the last checkpoint before the first placement it can change, see the ``session`` module, so
+    editing a large application does not pay for scheduling it from scratch. Task ids must be unique within a
+    session, and every message must connect two of its tasks. Messages may share an id as for /schedule_jobs, but
+    a delta can only update or remove messages by a unique id, and can not add a message with an id in use.
+
+    Sessions are kept for SESSION_TTL seconds after they were created or last edited, the least recently used ones
+    are dropped first once the sessions hold more than SESSION_CACHE_BYTES.
+
+    Args:
+        data (dict): The 'application' and 'platform' data, as for /schedule_jobs.
+        communication (bool): Query parameter, make the multi-node schedules account for the messages between nodes.
+        algorithms (list of str): Query parameter, names of the algorithms to run, all five if omitted.
+
+    Raises:
+        HTTPException: If the request is invalid, can not be scheduled or an unknown algorithm is requested, a 400
+                       error is raised. If the session alone would exceed SESSION_CACHE_BYTES, a 413 error is raised.
+
+    Returns:
+        Response: The "id" of the session and its "schedules" in the format of the /schedule_jobs response, with the
+                  URL of the session in the Location header.
+    """
+    selected = select_schedules(algorithms)
+    try:
+        input_validator.validate(data)
+    except jsonschema.exceptions.ValidationError as err:
+        logger.info("Input data is invalid: %s", err.message)
+        raise HTTPException(400, "Invalid Input schema")
+
+    def create():
+        platform_data = get_platform(data["platform"])
+        return Session(data["application"], platform_data, selected, communication, SESSION_CHECKPOINT_INTERVAL)
 
-    application_data = data.get("application")
-    platform_data = data.get("platform")
-
-    ldf_single_node = alg.ldf_single_node(application_data)
-    edf_single_node = alg.edf_single_node(application_data)
-    ll_multinode = alg.ll_multinode(application_data, platform_data)
-    ldf_multinode = alg.ldf_multinode(application_data, platform_data)
-    edf_multinode = alg.edf_multinode(application_data, platform_data)
-
-    response = {
-        "schedule1": ldf_single_node,
-        "schedule2": edf_single_node,
-        "schedule3": ll_multinode,
-        "schedule4": ldf_multinode,
-        "schedule5": edf_multinode,
-    }
-    ## Validate the schedules as per output schema
     try:
-        for key, value in response.items():
-            validate(instance=value, schema=output_schema)
-            print(key, "Schedule is valid")
+        session = await run_in_threadpool(create)
+    except ValueError as err:
+        logger.info("Input data can not be scheduled: %s", err)
+        raise HTTPException(400, str(err))
+    if session.nbytes() > SESSION_CACHE_BYTES:
+        raise HTTPException(413, "Session too large")
+    session_store.put(session.id, session, session.nbytes())
+    logger.info("Session %s created", session.id)
+    return await session_response(session, 201)
+
+
+@app.get("/sessions/{session_id}")
+async def read_session(session_id: str):
+    """
+    Return the current schedules of a session.
+
+    Args:
+        session_id (str): Id of the session.
+
+    Raises:
+        HTTPException: If there is no such session or it has expired, a 404 error is raised.
+
+    Returns:
+        Response: The "id" of the session and its "schedules" in the format of the /schedule_jobs response.
+    """
+    return await session_response(get_session(session_id))
+
+
+@app.patch("/sessions/{session_id}")
+async def edit_session(session_id: str, data: dict):
+    """
+    Apply a delta to the application of a session and reschedule what it changes.
+
+    The body holds a list of "changes", applied in order and as a whole or not at all:
+
+        {"changes": [
+            {"op": "add", "task": {"id": 7, "wcet": 5, "mcet": 3, "deadline": 40}},
+            {"op": "add", "message": {"id": "m7", "sender": 3, "receiver": 7, "size": 8}},
+            {"op": "update", "task": {"id": 2, "deadline": 30}},
+            {"op": "remove", "message": {"id": "m1"}}
+        ]}
+
+    Added tasks and messages carry all their fields, updates the id and the fields to change (the "wcet", "mcet"
+    and "deadline" of a task or the "size" of a message) and removals only the id. Removing a task also removes
+    its messages. An added task is best added in the same delta as its incoming messages, a task without
+    predecessors reschedules from the start.
+
+    Args:
+        session_id (str): Id of the session.
+        data (dict): The delta.
+
+    Raises:
+        HTTPException: If there is no such session or it has expired, a 404 error is raised. If the delta is
+                       malformed, refers to unknown ids or the edited application can not be scheduled, e.g.
+                       because an added message closes a cycle, a 400 error is raised and the session is left
+                       as it was.
+
+    Returns:
+        dict: The "id" of the session and its changed "schedules": for every schedule key the "name" of the
+              algorithm, the "length" of the new schedule, the index "from" which its entries differ from the
+              previous schedule and those "entries".
+    """
+    session = get_session(session_id)
+    try:
+        delta_validator.validate(data)
     except jsonschema.exceptions.ValidationError as err:
-        print("Output data is not valid", err)
-        raise HTTPException(500, "Invalid Output Schema")
+        logger.info("Delta is invalid: %s", err.message)
+        raise HTTPException(400, "Invalid delta schema")
+
+    def apply():
+        with session.lock:
+            return session.apply(data["changes"])
+
+    try:
+        changed = await run_in_threadpool(apply)
+    except ValueError as err:
+        logger.info("Delta can not be applied: %s", err)
+        raise HTTPException(400, str(err))
+    ## Storing the session again renews its time to live and its size estimate
+    session_store.put(session.id, session, session.nbytes())
+
+    if output_validation_enabled():
+        for key, value in changed.items():
+            if not all(entry_validator.is_valid(entry) for entry in value["entries"]):
+                logger.error("Output data of %s is not valid", key)
+                raise HTTPException(500, "Invalid Output Schema")
+    return Response(dumps({"id": session.id, "schedules": changed}), media_type=JSON_MEDIA_TYPE)
+
+
+@app.delete("/sessions/{session_id}", status_code=204)
+def delete_session(session_id: str):
+    """
+    Drop a session.
+
+    Args:
+        session_id (str): Id of the session.
+
+    Raises:
+        HTTPException: If there is no such session or it has expired, a 404 error is raised.
+    """
+    if session_store.pop(session_id) is None:
+        raise HTTPException(404, "Unknown session")
+    logger.info("Session %s deleted", session_id)
+    return Response(status_code=204)
+
+
+def get_session(session_id):
+    """Return the session with the given id, or raise a 404 error if there is none or it has expired."""
+    session = session_store.get(session_id)
+    if session is None:
+        raise HTTPException(404, "Unknown session")
+    return session
+
+
+async def session_response(session, status_code=200):
+    """
+    Encode the schedules of a session like a /schedule_jobs response, together with the id of the session.
 
-    print(json.dumps(response, indent=4))
-    return response
+    Args:
+        session (Session): The session.
+        status_code (int): Status code of the response.
+
+    Returns:
+        Response: The JSON response, with the URL of the session in the Location header.
+    """
+    def encode():
+        with session.lock:
+            response = session.schedules()
+        return encode_response(response)
+
+    body = await run_in_threadpool(encode)
+    body = dumps({"id": session.id})[:-1] + b',"schedules":' + body + b"}"
+    return Response(body, status_code=status_code, media_type=JSON_MEDIA_TYPE,
+                    headers={"Location": f"/sessions/{session.id}"})
+
+
+async def read_request(request, timings=NO_TIMINGS):
+    """
+    Receive, parse and validate the body of a scheduling request, see ``receive_body`` and ``parse_body``.
+
+    Args:
+        request (Request): The request.
+        timings (Timings): Receives the durations of the phases, see ``receive_body`` and ``parse_body``.
+
+    Raises:
+        HTTPException: If the body is not valid JSON or does not match the input schema, a 400 error is raised.
+
+    Returns:
+        tuple: The content key of the request, the request without the tasks and messages of its application, and
+               the ApplicationModel of its tasks and messages.
+    """
+    chunks, _ = await receive_body(request, timings)
+    return await parse_body(chunks, timings)
+
+
+async def receive_body(request, timings=NO_TIMINGS):
+    """
+    Receive the body of a request, hashing it on the way.
+
+    The digest lets /schedule_jobs answer a body it has seen before from the result cache without parsing it.
+
+    Args:
+        request (Request): The request.
+        timings (Timings): Receives the time spent receiving and hashing the body as "receive".
+
+    Returns:
+        tuple: The chunks of the body and the SHA-256 hex digest of the body.
+    """
+    chunks = []
+    digest = hashlib.sha256()
+    with timings.phase("receive"):
+        async for chunk in request.stream():
+            digest.update(chunk)
+            chunks.append(chunk)
+    return chunks, digest.hexdigest()
+
+
+async def parse_body(chunks, timings=NO_TIMINGS):
+    """
+    Parse and validate a received body.
+
+    The chunks are parsed one after another, the tasks and messages being validated one by one and written into
+    compact arrays, so the parsed body is never held as a whole. Every chunk is released from ``chunks`` once it is
+    parsed.
+
+    The content key identifies the request independently of its formatting, the order of its keys and the ids of its
+    messages, see ``ApplicationModel.digest``.
+
+    Args:
+        chunks (list of bytes): The chunks of the body.
+        timings (Timings): Receives the time spent parsing the chunks, including the validation of the tasks and
+                           messages, as "parse" and the final validation of the request and its content key as
+                           "validate".
+
+    Raises:
+        HTTPException: If the body is not valid JSON or does not match the input schema, a 400 error is raised.
+
+    Returns:
+        tuple: The content key of the request, the request without the tasks and messages of its application, and
+               the ApplicationModel of its tasks and messages.
+    """
+    if payload_logger.isEnabledFor(logging.DEBUG) and payload_sampling.sample():
+        payload_logger.debug("Received JSON data: %s", b"".join(chunks).decode(), extra={"sampled": True})
+
+    def parse():
+        parser = request_reader.parser()
+        with timings.phase("parse"):
+            for k, chunk in enumerate(chunks):
+                chunks[k] = None
+                parser.feed(chunk)
+        with timings.phase("validate"):
+            data, application_data = parser.close()
+            return content_hash([data, application_data.digest()]), data, application_data
+
+    try:
+        key, data, application_data = await run_in_threadpool(parse)
+    except jsonschema.exceptions.ValidationError as err:
+        logger.info("Input data is invalid: %s", err.message)
+        raise HTTPException(400, "Invalid Input schema")
+    except ValueError as err:
+        logger.info("Input data is invalid: %s", err)
+        raise HTTPException(400, str(err))
+    logger.debug("Input data is valid.")
+    return key, data, application_data
+
+
+def cached_response(body_key):
+    """
+    Look up the response of a request body that was answered before.
+
+    Args:
+        body_key (str): Key of the raw body and the options of the request.
+
+    Returns:
+        bytes: The encoded response, or None if the body was not seen or its response is no longer cached.
+    """
+    result_key = response_keys.get(body_key)
+    return result_cache.get(result_key) if result_key is not None else None
+
+
+def compile_models(application_data, platform_data, communication=False, timings=NO_TIMINGS):
+    """
+    Compile the application and platform of a valid scheduling request.
+
+    Args:
+        application_data (dict or ApplicationModel): The application section of the request, or its compiled model.
+        platform_data (dict): The platform section of the request.
+        communication (bool): Whether the multi-node schedules will need the routes between the compute nodes.
+        timings (Timings): Receives the time spent compiling as "compile" and the numbers of tasks, messages and
+                           platform nodes.
+
+    Raises:
+        HTTPException: If the application can not be scheduled on the platform, a 400 error is raised.
+
+    Returns:
+        tuple: The compiled ApplicationModel and PlatformModel.
+    """
+    ## Compile the application and platform once, all algorithms share the compiled models
+    with timings.phase("compile"):
+        try:
+            application_data = compile_application(application_data)
+            application_data.graph.topological_order(application_data.ids)
+            platform_data = get_platform(platform_data)
+        except ValueError as err:
+            logger.info("Input data is invalid: %s", err)
+            raise HTTPException(400, str(err))
+
+        ## Worker processes can not fill the routing tables of the cached platform, so route them up front
+        if communication and EXECUTION_MODE == "process":
+            platform_data.precompute_routes()
+    timings.size("tasks", len(application_data))
+    timings.size("messages", len(application_data.size))
+    timings.size("nodes", len(platform_data.node_ids))
+    return application_data, platform_data
+
+
+def select_schedules(algorithms=None):
+    """
+    Pick the schedules of the /schedule_jobs response to calculate.
+
+    Args:
+        algorithms (list of str, optional): Names of the requested algorithms, each entry may hold several
+                                            comma-separated names. All schedules are selected if omitted.
+
+    Raises:
+        HTTPException: If an algorithm is not registered, a 400 error is raised.
+
+    Returns:
+        dict: Algorithm name by schedule key, in response order.
+    """
+    if not algorithms:
+        return dict(schedules)
+    names = {name.strip() for entry in algorithms for name in entry.split(",") if name.strip()}
+    unknown = names - set(alg.ALGORITHMS)
+    if unknown:
+        raise HTTPException(400, f"Unknown algorithms: {', '.join(sorted(unknown))}")
+    return {key: name for key, name in schedules.items() if name in names}
+
+
+async def run_algorithms(application_data, platform_data, communication=False, selected=None, timings=NO_TIMINGS):
+    """
+    Calculate the schedules of the /schedule_jobs response.
+
+    In "process" execution mode the models are pickled once and the algorithms run concurrently in the shared
+    process pool, so the latency is close to that of the slowest algorithm. Otherwise they run one after another
+    in a worker thread.
+
+    Args:
+        application_data (ApplicationModel): The compiled application.
+        platform_data (PlatformModel): The compiled platform.
+        communication (bool): Make the multi-node schedules account for the messages between nodes.
+        selected (dict, optional): Algorithm name by schedule key, all schedules if omitted.
+        timings (Timings): Receives the durations of the setup and the placement loop of every algorithm.
+
+    Raises:
+        HTTPException: If the application can not be scheduled on the platform, a 400 error is raised.
+
+    Returns:
+        dict: The result of every algorithm by its schedule key.
+    """
+    if selected is None:
+        selected = schedules
+    try:
+        if EXECUTION_MODE == "process":
+            payload = pickle.dumps((application_data, platform_data, communication), pickle.HIGHEST_PROTOCOL)
+            loop = asyncio.get_running_loop()
+            pool = get_process_pool()
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, alg.run_pickled, name, payload, timings.enabled)
+                for name in selected.values()))
+            if timings.enabled:
+                for _, durations in results:
+                    timings.update(durations)
+                results = [result for result, _ in results]
+        else:
+            algorithm_timings = timings if timings.enabled else None
+            results = await run_in_threadpool(lambda: [
+                alg.run_algorithm(name, application_data, platform_data, communication, algorithm_timings)
+                for name in selected.values()])
+    except ValueError as err:
+        logger.info("Input data can not be scheduled: %s", err)
+        raise HTTPException(400, str(err))
+    return dict(zip(selected, results))
+
+
+def get_process_pool():
+    """Return the process pool shared by all requests, starting it on first use."""
+    global process_pool
+    if process_pool is None:
+        process_pool = ProcessPoolExecutor(PROCESS_POOL_WORKERS)
+    return process_pool
+
+
+def encode_response(response, media_type=JSON_MEDIA_TYPE, timings=NO_TIMINGS):
+    """
+    Validate the schedules of a response and encode it.
+
+    Depending on OUTPUT_VALIDATION the schedules are validated for every response ("always"), for a random
+    fraction of the responses ("sampled") or not at all ("off"), against the output schema of the format.
+
+    Args:
+        response (dict): The result of every algorithm by its schedule key.
+        media_type (str): Response format, one object per schedule entry or one array per entry field.
+        timings (Timings): Receives the time spent validating as "output_validation" and converting and encoding
+                           the response as "serialize".
+
+    Raises:
+        HTTPException: If a schedule does not match the output schema, a 500 error is raised.
+
+    Returns:
+        bytes: The JSON encoded response.
+    """
+    if media_type == COLUMNAR_MEDIA_TYPE:
+        with timings.phase("serialize"):
+            response = {key: to_columnar(value, columnar_fields) for key, value in response.items()}
+
+    ## Validate the schedules as per output schema
+    validator = output_validators[media_type]
+    if output_validation_enabled():
+        with timings.phase("output_validation"):
+            try:
+                for key, value in response.items():
+                    validator.validate(value)
+                    logger.debug("%s Schedule is valid", key)
+            except jsonschema.exceptions.ValidationError as err:
+                logger.error("Output data is not valid: %s", err.message)
+                raise HTTPException(500, "Invalid Output Schema")
+
+    payload_logger.debug("Sending JSON data: %s", LazyJSON(response))
+    with timings.phase("serialize"):
+        return dumps(response)
+
+
+def output_validation_enabled():
+    """Decide whether to validate the schedules of a response, as set by OUTPUT_VALIDATION."""
+    return OUTPUT_VALIDATION == "always" or (
+        OUTPUT_VALIDATION == "sampled" and random.random() < OUTPUT_VALIDATION_SAMPLE_RATE)
+
+
+def get_platform(platform_data):
+    """
+    Compile the platform section of a request, reusing the compiled model of an identical earlier platform.
+
+    Args:
+        platform_data (dict): Contains the nodes and the links between them.
+
+    Raises:
+        ValueError: If a link refers to a node that is not part of the platform.
+
+    Returns:
+        PlatformModel: The compiled platform model.
+    """
+    key = content_hash(platform_data)
+    platform = platform_cache.get(key)
+    if platform is None:
+        platform = compile_platform(platform_data)
+        platform_cache.put(key, platform, platform.nbytes())
+    return platform
+
+
+@app.get("/algorithms")
+def read_algorithms():
+    """
+    List the registered scheduling algorithms, e.g. to pick the ones to run with /schedule_jobs.
+
+    Returns:
+        dict: Display name, schedule key and capabilities of every algorithm by its name.
+    """
+    keys = {name: key for key, name in schedules.items()}
+    return {
+        name: {
+            "name": algorithm.name,
+            "schedule": keys.get(name),
+            "multinode": algorithm.multinode,
+            "communication_aware": algorithm.communication_aware,
+        }
+        for name, algorithm in alg.ALGORITHMS.items()
+    }
+
+
+@app.get("/metrics")
+def read_metrics():
+    """
+    Expose the metrics of /schedule_jobs in the Prometheus text format: latency histograms of the request phases
+    and of the setup and placement loop of every algorithm, and histograms of the numbers of tasks, messages and
+    platform nodes.
+
+    Raises:
+        HTTPException: If METRICS_ENABLED is off, a 404 error is raised.
+
+    Returns:
+        Response: The metrics.
+    """
+    if not METRICS_ENABLED:
+        raise HTTPException(404, "Metrics are disabled")
+    return Response(REGISTRY.render(), media_type=TEXT_MEDIA_TYPE)
+
+
+@app.get("/stats")
+def read_stats():
+    """
+    Report the hit and miss counters of the caches, the number of jobs in every state and the sessions.
+
+    Returns:
+        dict: Counters and occupancy of the platform and result caches, the job counts of the job queue and the
+              counters and occupancy of the session store.
+    """
+    return {
+        "platform_cache": platform_cache.stats(),
+        "result_cache": result_cache.stats() if result_cache is not None else None,
+        "jobs": job_queue.stats(),
+        "sessions": session_store.stats(),
+    }
 
 
 @app.get("/")
@@ -130,4 +1268,5 @@ def read_root():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT, log_level="info")
@@ -0,0 +1,99 @@
+"""
+This module schedules batches of applications against one platform in worker processes.
+
+The platform of a batch is validated and compiled once by the server and pickled once per batch. The applications
+are shipped to the workers in chunks. A worker validates, compiles and schedules every application of its chunk and
+encodes the result line by line, so everything proportional to the number of applications runs in parallel. An
+invalid application only fails its own line of the result.
+
+Functions:
+- schedule_application: Validates, compiles and schedules a single application.
+- run_chunk: Worker entry point, schedules a chunk of applications and encodes their result lines.
+"""
+
+__version__ = "1.0.0"
+
+
+import json
+import os
+import pickle
+from functools import lru_cache
+
+from jsonschema.exceptions import ValidationError
+
+import algorithms as alg
+from encoding import dumps
+from model import compile_application
+from validation import SchemaValidator
+
+script_dir = os.path.dirname(__file__)
+
+
+@lru_cache(maxsize=None)
+def validators():
+    """
+    Build the validators of an application and of a schedule once per process.
+
+    Returns:
+        tuple: The SchemaValidator of the application section of the input schema and that of the output schema.
+    """
+    with open(os.path.join(script_dir, "input_schema.json")) as f:
+        input_schema = json.load(f)
+    with open(os.path.join(script_dir, "output_schema.json")) as f:
+        output_schema = json.load(f)
+    application_schema = dict(input_schema["properties"]["application"], **{"$schema": input_schema["$schema"]})
+    return SchemaValidator(application_schema), SchemaValidator(output_schema)
+
+
+def schedule_application(application_data, platform, selected, communication=False):
+    """
+    Validate, compile and schedule a single application.
+
+    Args:
+        application_data (dict): The application section of a request.
+        platform (PlatformModel): The compiled platform.
+        selected (dict): Algorithm name by schedule key.
+        communication (bool): Make the multi-node schedules account for the messages between nodes.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the application does not match the input schema.
+        ValueError: If the application can not be scheduled on the platform.
+
+    Returns:
+        dict: The result of every algorithm by its schedule key.
+    """
+    validators()[0].validate(application_data)
+    application = compile_application(application_data)
+    application.graph.topological_order(application.ids)
+    return {key: alg.run_algorithm(name, application, platform, communication) for key, name in selected.items()}
+
+
+def run_chunk(payload, start, applications):
+    """
+    Schedule a chunk of the applications of a batch, e.g. in a worker process.
+
+    Args:
+        payload (bytes): Pickled ``(platform, selected, communication, validate_output)`` tuple shared by the batch.
+        start (int): Position of the first application of the chunk in the batch.
+        applications (list of dict): The applications of the chunk.
+
+    Returns:
+        bytes: One NDJSON line per application, ``{"index": i, "schedules": {...}}`` or ``{"index": i, "error": ...}``.
+    """
+    platform, selected, communication, validate_output = pickle.loads(payload)
+    lines = []
+    for index, application_data in enumerate(applications, start):
+        try:
+            schedules = schedule_application(application_data, platform, selected, communication)
+        except ValidationError as err:
+            line = {"index": index, "error": f"Invalid Input schema: {err.message}"}
+        except ValueError as err:
+            line = {"index": index, "error": str(err)}
+        else:
+            if validate_output and not all(map(validators()[1].is_valid, schedules.values())):
+                line = {"index": index, "error": "Invalid Output Schema"}
+            else:
+                line = {"index": index, "schedules": schedules}
+        lines.append(dumps(line))
+    lines.append(b"")
+    return b"\n".join(lines)
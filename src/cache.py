@@ -0,0 +1,272 @@
+"""
+This module provides the caches used by the scheduling API to skip repeated work across requests.
+
+Entries are keyed on a content hash of the JSON section they were derived from, so two requests carrying the same
+data share an entry no matter how their keys are ordered. The caches are bounded by an estimate of the memory their
+entries hold and evict the least recently used entries first. Entries can also expire after a time to live.
+
+Classes:
+- LRUCache: Thread-safe least recently used cache bounded by the total size of its entries.
+- DiskCache: SQLite-backed cache of encoded values that survives worker restarts.
+- ResultCache: In-memory LRUCache in front of an optional DiskCache, for complete responses.
+
+Functions:
+- content_hash: Hashes a JSON-compatible value independently of its key order.
+"""
+
+__version__ = "1.0.0"
+
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def content_hash(data):
+    """
+    Hash a JSON-compatible value independently of the order of its keys.
+
+    Args:
+        data: Any value that can be serialized to JSON.
+
+    Returns:
+        str: Hex digest of the canonical JSON encoding.
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class LRUCache:
+    """
+    Least recently used cache bounded by the total size of its entries.
+
+    Attributes:
+        max_bytes (int): Upper bound of the summed entry sizes.
+        ttl (float): Seconds an entry stays valid after it was stored, forever if None.
+        hits (int): Number of lookups that found an entry.
+        misses (int): Number of lookups that did not find an entry.
+        evictions (int): Number of entries dropped to stay within ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes, ttl=None):
+        """
+        Create an empty cache.
+
+        Args:
+            max_bytes (int): Upper bound of the summed entry sizes. Entries larger than this are not cached.
+            ttl (float, optional): Seconds an entry stays valid after it was stored, forever if omitted.
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return the entry stored under ``key`` and mark it as most recently used, or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= entry[1]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size):
+        """
+        Store an entry, evicting the least recently used entries until it fits.
+
+        Args:
+            key (str): Key of the entry.
+            value: The cached value.
+            size (int): Estimated memory held by the value in bytes.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            while self._bytes + size > self.max_bytes:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+            expires = time.monotonic() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (value, size, expires)
+            self._bytes += size
+
+    def pop(self, key, default=None):
+        """Remove the entry stored under ``key`` and return it, or ``default`` if there is none."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            if entry[2] is not None and entry[2] <= time.monotonic():
+                return default
+            return entry[0]
+
+    def clear(self):
+        """Drop all entries, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Report the counters and the occupancy of the cache.
+
+        Returns:
+            dict: Hits, misses, evictions, number of entries and their summed size against the bound.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class DiskCache:
+    """
+    SQLite-backed cache of encoded values that survives worker restarts and is shared by workers on one host.
+
+    Attributes:
+        path (str): Path of the SQLite database.
+        max_bytes (int): Upper bound of the summed value sizes, the oldest values are dropped first.
+        ttl (float): Seconds a value stays valid after it was stored, forever if None.
+    """
+
+    def __init__(self, directory, max_bytes, ttl=None):
+        """
+        Open the cache database in ``directory``, creating both if needed.
+
+        Args:
+            directory (str): Directory holding the database.
+            max_bytes (int): Upper bound of the summed value sizes.
+            ttl (float, optional): Seconds a value stays valid after it was stored, forever if omitted.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "results.sqlite3")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, stored REAL, expires REAL, size INTEGER, value BLOB)")
+
+    def get(self, key):
+        """Return the value stored under ``key``, or None if there is none or it has expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM entries WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, time.time())).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, key, value):
+        """
+        Store an encoded value, then drop expired values and the oldest values beyond ``max_bytes``.
+
+        Args:
+            key (str): Key of the value.
+            value (bytes): The encoded value.
+        """
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        expires = now + self.ttl if self.ttl is not None else None
+        with self._lock:
+            connection = self._connection
+            connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                               (key, now, expires, len(value), value))
+            connection.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (now,))
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                oldest = connection.execute("SELECT key, size FROM entries ORDER BY stored").fetchall()
+                dropped = []
+                for old_key, size in oldest:
+                    if total <= self.max_bytes:
+                        break
+                    dropped.append((old_key,))
+                    total -= size
+                connection.executemany("DELETE FROM entries WHERE key = ?", dropped)
+
+    def clear(self):
+        """Drop all values."""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+
+
+class ResultCache:
+    """
+    Cache of complete encoded responses: an in-memory LRUCache in front of an optional DiskCache.
+
+    Values found on disk are promoted to memory, so a worker restarted with a warm disk tier warms up again on the
+    first repeated request.
+    """
+
+    def __init__(self, max_bytes, ttl=None, directory=None):
+        """
+        Create the cache.
+
+        Args:
+            max_bytes (int): Upper bound of the summed response sizes, per tier.
+            ttl (float, optional): Seconds a response stays valid after it was stored, forever if omitted.
+            directory (str, optional): Directory of the on-disk tier, memory only if omitted.
+        """
+        self.memory = LRUCache(max_bytes, ttl)
+        self.disk = DiskCache(directory, max_bytes, ttl) if directory else None
+        self.disk_hits = 0
+
+    def get(self, key):
+        """Return the encoded response stored under ``key``, or None."""
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.disk_hits += 1
+                self.memory.put(key, value, len(value))
+        return value
+
+    def put(self, key, value):
+        """Store an encoded response in both tiers."""
+        self.memory.put(key, value, len(value))
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def clear(self):
+        """Drop all responses from both tiers, keeping the counters."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        """
+        Report the counters and the occupancy of the cache.
+
+        Returns:
+            dict: Counters of the memory tier, plus the hits served from disk.
+        """
+        stats = self.memory.stats()
+        stats["disk_hits"] = self.disk_hits
+        stats["disk"] = self.disk.path if self.disk is not None else None
+        return stats
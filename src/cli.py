@@ -0,0 +1,294 @@
+"""
+This module is the command-line runner that schedules many models offline, without the API server.
+
+Every input model is scheduled with the registered algorithms in a pool of worker processes. Models are read like
+the body of /schedule_jobs: JSON requests are parsed incrementally and validated against the input schema, model
+files written by ``modelfile`` are memory-mapped. A record is written per model as soon as it is done, with the time
+spent loading the model and running every algorithm:
+
+- JSONL output holds one object per model with the timings and the complete schedules.
+- CSV output holds one row per model and algorithm with the timings, the makespan and the missed deadlines.
+
+The output is flushed after every record. With ``--resume`` the models already recorded in the output are skipped
+and new records are appended, so an interrupted run picks up where it stopped.
+
+Usage:
+    python src/cli.py tests/input_models -o results.jsonl
+    python src/cli.py "models/*.json" -o results.csv --algorithms edf_multinode --workers 8 --resume
+"""
+
+__version__ = "1.0.0"
+
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+
+from jsonschema.exceptions import ValidationError
+
+import algorithms as alg
+from ingest import RequestReader
+from modelfile import MAGIC, load_model
+from topology import compile_platform
+
+script_dir = os.path.dirname(__file__)
+
+## Extensions of the input models picked up in directories
+MODEL_EXTENSIONS = (".json", ".bin")
+
+CSV_FIELDS = ["model", "algorithm", "status", "error", "tasks", "load_seconds", "schedule_seconds", "makespan",
+              "missed_deadlines"]
+
+
+@lru_cache(maxsize=None)
+def request_reader():
+    """Build the reader of JSON requests once per process."""
+    with open(os.path.join(script_dir, "input_schema.json")) as f:
+        return RequestReader(json.load(f))
+
+
+def find_models(patterns):
+    """
+    Expand directories and glob patterns into the paths of the input models.
+
+    Args:
+        patterns (list of str): Directories, searched recursively for model files, files or glob patterns.
+
+    Returns:
+        list of str: The model paths, sorted and without duplicates.
+    """
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                paths.update(os.path.join(root, name) for name in files if name.endswith(MODEL_EXTENSIONS))
+        else:
+            paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(paths)
+
+
+def load(path):
+    """
+    Load an input model.
+
+    Args:
+        path (str): Path of a JSON request or of a model file.
+
+    Raises:
+        ValueError: If the model is malformed or can not be scheduled.
+        jsonschema.exceptions.ValidationError: If a JSON request does not match the input schema.
+
+    Returns:
+        tuple: The compiled ApplicationModel and PlatformModel.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            application, platform = load_model(path)
+        else:
+            f.seek(0)
+            request, application = request_reader().read(iter(lambda: f.read(1 << 16), b""))
+            platform = compile_platform(request["platform"])
+    application.graph.topological_order(application.ids)
+    return application, platform
+
+
+def schedule_model(path, names, communication=False):
+    """
+    Schedule a model with the given algorithms, timing every step. Runs in the worker processes.
+
+    Args:
+        path (str): Path of the input model.
+        names (list of str): Names of the algorithms to run.
+        communication (bool): Make the multi-node schedules account for the messages between nodes.
+
+    Returns:
+        dict: The record of the model, see the module documentation.
+    """
+    record = {"model": path, "status": "ok"}
+    start = time.perf_counter()
+    try:
+        application, platform = load(path)
+    except ValidationError as err:
+        record.update(status="error", error=f"Invalid Input schema: {err.message}")
+        return record
+    except (OSError, ValueError) as err:
+        record.update(status="error", error=str(err))
+        return record
+    record["tasks"] = len(application)
+    record["load_seconds"] = time.perf_counter() - start
+
+    record["results"] = results = {}
+    for name in names:
+        start = time.perf_counter()
+        try:
+            result = alg.run_algorithm(name, application, platform, communication)
+        except ValueError as err:
+            results[name] = {"status": "error", "error": str(err)}
+            continue
+        elapsed = time.perf_counter() - start
+        schedule = result["schedule"]
+        results[name] = {
+            "status": "ok",
+            "schedule_seconds": elapsed,
+            "makespan": max((entry["end_time"] for entry in schedule), default=0),
+            "missed_deadlines": sum(entry["end_time"] > entry["deadline"] for entry in schedule),
+            "schedule": schedule,
+        }
+    return record
+
+
+class RecordWriter:
+    """Writes the records of a run to a JSONL or CSV file, appending to the records of an interrupted run."""
+
+    def __init__(self, path, output_format, resume=False):
+        """
+        Open the output.
+
+        Args:
+            path (str): Path of the output file.
+            output_format (str): "jsonl" or "csv".
+            resume (bool): Keep the records of an earlier run and append to them, otherwise start a new file.
+        """
+        self.format = output_format
+        self.done = set()
+        if resume and os.path.exists(path):
+            self.done = _recorded_models(path, output_format)
+            self._file = open(path, "a", newline="")
+        else:
+            self._file = open(path, "w", newline="")
+        if self.format == "csv":
+            self._csv = csv.DictWriter(self._file, CSV_FIELDS, extrasaction="ignore")
+            if self._file.tell() == 0:
+                self._csv.writeheader()
+
+    def write(self, record):
+        """Write the record of a model and flush it to disk."""
+        if self.format == "jsonl":
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        elif "results" not in record:
+            self._csv.writerow(dict(record, algorithm=""))
+        else:
+            self._csv.writerows(
+                dict(record, algorithm=name, **{key: value for key, value in result.items() if key != "schedule"})
+                for name, result in record["results"].items())
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def _recorded_models(path, output_format):
+    """
+    Collect the models recorded by an earlier run, cutting off a record that was only partly written.
+
+    A JSONL record is a single line, so only a torn last line is dropped. A CSV record spans one row per algorithm
+    and its quoted fields may hold newlines, so the file is parsed as CSV, the rows of the last model are dropped
+    whether they are complete or not, and that model is scheduled again.
+
+    Args:
+        path (str): Path of the output file.
+        output_format (str): "jsonl" or "csv".
+
+    Returns:
+        set of str: Paths of the recorded models.
+    """
+    if output_format == "jsonl":
+        with open(path, "rb+") as f:
+            data = f.read()
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                f.truncate(complete)
+        return {json.loads(line)["model"] for line in data[:complete].decode().splitlines() if line}
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    if rows:
+        last = rows[-1]["model"]
+        rows = [row for row in rows if row["model"] != last]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    return {row["model"] for row in rows}
+
+
+def run(paths, names, writer, communication=False, workers=None):
+    """
+    Schedule the models in a process pool, writing every record as soon as it is done.
+
+    Args:
+        paths (list of str): Paths of the input models.
+        names (list of str): Names of the algorithms to run.
+        writer (RecordWriter): Output of the records.
+        communication (bool): Make the multi-node schedules account for the messages between nodes.
+        workers (int, optional): Number of worker processes, one per CPU if omitted. 1 runs in this process.
+
+    Returns:
+        int: Number of models that could not be loaded.
+    """
+    failed = 0
+    if workers == 1:
+        for path in paths:
+            record = schedule_model(path, names, communication)
+            failed += record["status"] != "ok"
+            writer.write(record)
+        return failed
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        window = 2 * workers
+        queue = iter(paths)
+        pending = set()
+        while True:
+            for path in queue:
+                pending.add(pool.submit(schedule_model, path, names, communication))
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return failed
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                failed += record["status"] != "ok"
+                writer.write(record)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Schedule input models offline, in parallel.")
+    parser.add_argument("inputs", nargs="+", help="Directories, model files or glob patterns")
+    parser.add_argument("-o", "--output", default="results.jsonl", help="Output file, .jsonl or .csv")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="Output format, taken from the extension if omitted")
+    parser.add_argument("--algorithms", default=",".join(alg.ALGORITHMS),
+                        help="Comma-separated names of the algorithms to run, all by default")
+    parser.add_argument("--communication", action="store_true",
+                        help="Account for the messages between nodes in the multi-node schedules")
+    parser.add_argument("--workers", type=int, help="Number of worker processes, one per CPU by default")
+    parser.add_argument("--resume", action="store_true", help="Skip the models already recorded in the output")
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.algorithms.split(",") if name.strip()]
+    unknown = set(names) - set(alg.ALGORITHMS)
+    if unknown:
+        parser.error(f"unknown algorithms: {', '.join(sorted(unknown))}")
+    output_format = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+
+    writer = RecordWriter(args.output, output_format, args.resume)
+    paths = [path for path in find_models(args.inputs) if path not in writer.done]
+    start = time.perf_counter()
+    try:
+        failed = run(paths, names, writer, args.communication, args.workers)
+    finally:
+        writer.close()
+    print(f"Scheduled {len(paths) - failed} of {len(paths)} models in {time.perf_counter() - start:.2f} s, "
+          f"skipped {len(writer.done)} recorded models.", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,32 @@ such as development, testing, and production.
 Attributes:
     SERVER_HOST (str): The hostname where the FastAPI server will run. Default is '127.0.0.1'.
     SERVER_PORT (int): The port on which the FastAPI server will listen. Default is 8000.
+    PLATFORM_CACHE_BYTES (int): Memory bound of the cache of compiled platforms shared between requests.
+    RESULT_CACHE_BYTES (int): Size bound of the cache of complete /schedule_jobs responses, per tier.
+    RESULT_CACHE_TTL (float): Seconds a cached response stays valid. None keeps responses until they are evicted.
+    RESULT_CACHE_DIR (str): Directory of the on-disk response cache. None keeps responses in memory only.
+    EXECUTION_MODE (str): "inline" runs the algorithms of a request one after another in a worker thread,
+        "process" runs them concurrently in a process pool shared by all requests.
+    PROCESS_POOL_WORKERS (int): Number of worker processes in "process" mode. None uses one per CPU.
+    LOG_LEVEL (str): Level of the application logs. "DEBUG" also logs the request and response payloads.
+    PAYLOAD_LOG_SAMPLE_RATE (float): Fraction of the requests whose payloads are logged at debug level.
+    OUTPUT_VALIDATION (str): Validate the calculated schedules against the output schema "always", "sampled"
+        for a fraction of the responses, or "off".
+    OUTPUT_VALIDATION_SAMPLE_RATE (float): Fraction of the responses validated in "sampled" mode.
+    JOB_WORKERS (int): Number of worker threads running the jobs submitted to /jobs.
+    JOB_QUEUE_SIZE (int): Upper bound of the jobs that are queued or running, further submissions are refused.
+    JOB_TIMEOUT (float): Default deadline of a job in seconds, counted from its submission.
+    JOB_MAX_TIMEOUT (float): Upper bound of the deadline a client can ask for.
+    JOB_RETENTION (float): Seconds a finished job and its result are kept for polling.
+    JOB_RESULT_BYTES (int): Upper bound of the summed size of the results kept for polling, the oldest finished jobs
+        are dropped before the end of their retention to stay within it.
+    METRICS_ENABLED (bool): Time the phases of /schedule_jobs for the /metrics endpoint and the Server-Timing header.
+    SESSION_CACHE_BYTES (int): Memory bound of the sessions of /sessions, the least recently used ones are dropped.
+    SESSION_TTL (float): Seconds a session is kept after it was created or last edited.
+    SESSION_CHECKPOINT_INTERVAL (int): Minimum number of placements between two checkpoints of a session schedule,
+        fewer checkpoints hold less memory but make edits reschedule more placements.
+    SIMULATION_MAX_JOBS (int): Upper bound of the periodic jobs a simulation of /simulate may release, longer
+        simulations are refused.
 
 Example:
     Accessing configuration settings:
@@ -30,3 +56,40 @@ __version__ = "1.0.0"
 # Define server settings
 SERVER_HOST = "127.0.0.1"  # Make 0.0.0.0 to allow access from other devices
 SERVER_PORT = 8000  # Default port for Uvicorn
+
+# Define cache settings
+PLATFORM_CACHE_BYTES = 64 * 1024 * 1024  # Compiled platforms and their routing tables
+RESULT_CACHE_BYTES = 256 * 1024 * 1024  # Complete responses, 0 disables the response cache
+RESULT_CACHE_TTL = 600  # Seconds
+RESULT_CACHE_DIR = None  # e.g. ".cache/results" to keep responses across worker restarts
+
+# Define execution settings
+EXECUTION_MODE = "inline"  # "inline" or "process"
+PROCESS_POOL_WORKERS = None  # Defaults to the number of CPUs
+
+# Define logging settings
+LOG_LEVEL = "INFO"
+PAYLOAD_LOG_SAMPLE_RATE = 1.0  # Payloads are only encoded for logging at DEBUG level
+
+# Define validation settings
+OUTPUT_VALIDATION = "always"  # "always", "sampled" or "off", e.g. "off" in production
+OUTPUT_VALIDATION_SAMPLE_RATE = 0.01
+
+# Define job settings
+JOB_WORKERS = 2
+JOB_QUEUE_SIZE = 64
+JOB_TIMEOUT = 300  # Seconds
+JOB_MAX_TIMEOUT = 3600  # Seconds
+JOB_RETENTION = 600  # Seconds
+JOB_RESULT_BYTES = 256 * 1024 * 1024  # Encoded results of the finished jobs
+
+# Define metrics settings
+METRICS_ENABLED = True  # Phases are timed per request, not per task
+
+# Define session settings
+SESSION_CACHE_BYTES = 512 * 1024 * 1024  # Estimated memory of the schedules and checkpoints of all sessions
+SESSION_TTL = 3600  # Seconds
+SESSION_CHECKPOINT_INTERVAL = 256
+
+# Define simulation settings
+SIMULATION_MAX_JOBS = 1000000  # Jobs released over the horizon, summed over all tasks
@@ -0,0 +1,282 @@
+"""
+This module provides the lightweight directed acyclic graph used by the scheduling algorithms.
+
+The schedulers only ever ask for the predecessors and successors of a task, so the graph is stored as two compressed
+sparse row (CSR) arrays over dense vertex indices instead of a dict-of-dicts graph. It is built once per request and
+shared by all algorithms. networkx is only imported when the graph is exported for visualization.
+
+The graph can also be edited in place, for the scheduling sessions that keep a model between requests. Adding or
+removing a vertex or an edge keeps the neighbours of every vertex in edge order, an edge costs O(V) to shift the
+offsets, removing a vertex renumbers the ones after it and costs O(V + E).
+
+Classes:
+- Dag: Array-backed directed graph with Kahn's algorithm for topological order and cycle detection.
+"""
+
+__version__ = "1.0.0"
+
+
+from array import array
+from bisect import bisect_left
+
+
+class Dag:
+    """
+    Directed graph over the vertices ``0 .. size - 1`` with CSR predecessor and successor adjacency.
+
+    The neighbours of vertex ``v`` are ``pred[pred_offsets[v]:pred_offsets[v + 1]]`` and
+    ``succ[succ_offsets[v]:succ_offsets[v + 1]]``, both listed in edge order. ``pred_edge`` holds the position of
+    each predecessor edge in the input, so per-edge values can be looked up alongside ``pred``.
+
+    Attributes:
+        size (int): Number of vertices.
+        pred_offsets (array): CSR offsets into ``pred``, ``size + 1`` entries.
+        pred (array): Predecessor vertices.
+        pred_edge (array): Input position of the edge to every predecessor.
+        succ_offsets (array): CSR offsets into ``succ``, ``size + 1`` entries.
+        succ (array): Successor vertices.
+    """
+
+    __slots__ = ("size", "pred_offsets", "pred", "pred_edge", "succ_offsets", "succ")
+
+    def __init__(self, size, sources, targets):
+        """
+        Build the graph from its edges ``sources[k] -> targets[k]``.
+
+        Args:
+            size (int): Number of vertices.
+            sources (array): Source vertex of every edge.
+            targets (array): Target vertex of every edge.
+        """
+        self.size = size
+        self.pred_offsets, self.pred, self.pred_edge = _csr(size, targets, sources)
+        self.succ_offsets, self.succ, _ = _csr(size, sources, targets)
+
+    @classmethod
+    def from_csr(cls, pred_offsets, pred, pred_edge, succ_offsets, succ):
+        """
+        Wrap CSR arrays that were built before, e.g. loaded from a model file, without copying them.
+
+        Args:
+            pred_offsets (sequence): CSR offsets into ``pred``, one more than the number of vertices.
+            pred (sequence): Predecessor vertices.
+            pred_edge (sequence): Input position of the edge to every predecessor.
+            succ_offsets (sequence): CSR offsets into ``succ``.
+            succ (sequence): Successor vertices.
+
+        Returns:
+            Dag: The graph backed by the given arrays.
+        """
+        dag = cls.__new__(cls)
+        dag.size = len(pred_offsets) - 1
+        dag.pred_offsets, dag.pred, dag.pred_edge = pred_offsets, pred, pred_edge
+        dag.succ_offsets, dag.succ = succ_offsets, succ
+        return dag
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def edge_count(self):
+        """Number of edges in the graph."""
+        return len(self.succ)
+
+    def predecessors(self, v):
+        """Return the predecessors of vertex ``v``."""
+        return self.pred[self.pred_offsets[v]:self.pred_offsets[v + 1]]
+
+    def successors(self, v):
+        """Return the successors of vertex ``v``."""
+        return self.succ[self.succ_offsets[v]:self.succ_offsets[v + 1]]
+
+    def copy(self):
+        """Return an independent copy of the graph."""
+        return Dag.from_csr(array("q", self.pred_offsets), array("q", self.pred), array("q", self.pred_edge),
+                            array("q", self.succ_offsets), array("q", self.succ))
+
+    def add_vertex(self):
+        """
+        Add a vertex without edges.
+
+        Returns:
+            int: The index of the new vertex.
+        """
+        self.pred_offsets.append(self.pred_offsets[-1])
+        self.succ_offsets.append(self.succ_offsets[-1])
+        self.size += 1
+        return self.size - 1
+
+    def add_edge(self, source, target, edge):
+        """
+        Add the edge ``source -> target`` after the existing edges of both vertices.
+
+        Args:
+            source (int): Source vertex.
+            target (int): Target vertex.
+            edge (int): Input position of the edge, stored in ``pred_edge``.
+        """
+        position = self.pred_offsets[target + 1]
+        self.pred.insert(position, source)
+        self.pred_edge.insert(position, edge)
+        _shift(self.pred_offsets, target + 1, 1)
+        self.succ.insert(self.succ_offsets[source + 1], target)
+        _shift(self.succ_offsets, source + 1, 1)
+
+    def remove_edge(self, source, target, edge):
+        """
+        Remove the edge ``source -> target`` stored with the input position ``edge``.
+
+        Raises:
+            ValueError: If there is no such edge.
+        """
+        start, end = self.pred_offsets[target], self.pred_offsets[target + 1]
+        position = start + self.pred_edge[start:end].index(edge)
+        if self.pred[position] != source:
+            raise ValueError(f"Edge {edge} does not start at vertex {source}.")
+        del self.pred[position]
+        del self.pred_edge[position]
+        _shift(self.pred_offsets, target + 1, -1)
+        start = self.succ_offsets[source]
+        del self.succ[start + self.successors(source).index(target)]
+        _shift(self.succ_offsets, source + 1, -1)
+
+    def remove_vertex(self, v):
+        """
+        Remove vertex ``v`` and its edges. The vertices after it move down by one index.
+
+        Returns:
+            list of int: The input positions of the removed edges.
+        """
+        pred_dropped = _positions(self.pred_offsets, self.pred, v, self.successors(v))
+        succ_dropped = _positions(self.succ_offsets, self.succ, v, self.predecessors(v))
+        removed = [self.pred_edge[k] for k in pred_dropped]
+        self.pred_offsets = _drop_offsets(self.pred_offsets, v, pred_dropped)
+        self.pred = _renumber(_without(self.pred, pred_dropped), v)
+        self.pred_edge = _without(self.pred_edge, pred_dropped)
+        self.succ_offsets = _drop_offsets(self.succ_offsets, v, succ_dropped)
+        self.succ = _renumber(_without(self.succ, succ_dropped), v)
+        self.size -= 1
+        return removed
+
+    def indegrees(self):
+        """Return the number of predecessors of every vertex."""
+        offsets = self.pred_offsets
+        return [offsets[v + 1] - offsets[v] for v in range(self.size)]
+
+    def topological_order(self, labels=None):
+        """
+        Order the vertices so that every edge points forward, using Kahn's algorithm.
+
+        Args:
+            labels (list, optional): Label of every vertex to report a cycle with, e.g. the job ids, the vertex
+                                     index is used if omitted.
+
+        Raises:
+            ValueError: If the graph contains a cycle.
+
+        Returns:
+            list of int: The vertices in topological order.
+        """
+        succ_offsets, succ = self.succ_offsets, self.succ
+        remaining = self.indegrees()
+        order = [v for v, count in enumerate(remaining) if not count]
+        for v in order:
+            for k in range(succ_offsets[v], succ_offsets[v + 1]):
+                successor = succ[k]
+                remaining[successor] -= 1
+                if not remaining[successor]:
+                    order.append(successor)
+        if len(order) < self.size:
+            cyclic = next(v for v, count in enumerate(remaining) if count)
+            if labels is None:
+                raise ValueError(f"Cyclic dependency detected at vertex {cyclic}.")
+            raise ValueError(f"Cyclic dependency detected at job {labels[cyclic]}.")
+        return order
+
+    def to_networkx(self, labels=None):
+        """
+        Export the graph as a networkx DiGraph, e.g. for visualization.
+
+        Args:
+            labels (list, optional): Node label for every vertex, the vertex index is used if omitted.
+
+        Raises:
+            ImportError: If networkx is not installed.
+
+        Returns:
+            networkx.DiGraph: The exported graph.
+        """
+        import networkx as nx
+
+        if labels is None:
+            labels = range(self.size)
+        graph = nx.DiGraph()
+        graph.add_nodes_from(labels)
+        for v in range(self.size):
+            graph.add_edges_from((labels[v], labels[w]) for w in self.successors(v))
+        return graph
+
+
+def _positions(offsets, neighbours, v, linked):
+    """Return the sorted positions of the CSR entries of vertex ``v`` and of the entries of ``linked`` vertices
+    pointing to ``v``."""
+    positions = set(range(offsets[v], offsets[v + 1]))
+    for w in set(linked):
+        positions.update(k for k in range(offsets[w], offsets[w + 1]) if neighbours[k] == v)
+    return sorted(positions)
+
+
+def _without(values, positions):
+    """Return a copy of an array without the entries at the sorted ``positions``."""
+    kept = array("q")
+    start = 0
+    for k in positions:
+        kept.extend(values[start:k])
+        start = k + 1
+    kept.extend(values[start:])
+    return kept
+
+
+def _renumber(neighbours, v):
+    """Move the vertices after the removed vertex ``v`` down by one index."""
+    return array("q", [u - (u > v) for u in neighbours])
+
+
+def _drop_offsets(offsets, v, positions):
+    """Return the CSR offsets without vertex ``v`` once the entries at the sorted ``positions`` are removed."""
+    dropped = array("q", [offset - bisect_left(positions, offset) for offset in offsets])
+    del dropped[v + 1]
+    return dropped
+
+
+def _shift(offsets, start, delta):
+    """Add ``delta`` to the CSR offsets from position ``start`` on."""
+    offsets[start:] = array("q", [offset + delta for offset in offsets[start:]])
+
+
+def _csr(size, sources, targets):
+    """
+    Group the edges ``sources[k] -> targets[k]`` by source in compressed sparse row form.
+
+    Args:
+        size (int): Number of vertices.
+        sources (array): Source vertex of every edge.
+        targets (array): Target vertex of every edge.
+
+    Returns:
+        tuple: ``(offsets, neighbours, edges)``, neighbours of a vertex keeping the edge order and the input
+               position of every edge.
+    """
+    offsets = array("q", bytes(8 * (size + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+    fill = offsets[:-1]
+    neighbours = array("q", bytes(8 * len(sources)))
+    edges = array("q", bytes(8 * len(sources)))
+    for edge, (source, target) in enumerate(zip(sources, targets)):
+        neighbours[fill[source]] = target
+        edges[fill[source]] = edge
+        fill[source] += 1
+    return offsets, neighbours, edges
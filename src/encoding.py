@@ -0,0 +1,139 @@
+"""
+This module encodes the responses of the scheduling API.
+
+Responses are encoded with orjson when it is installed, which serializes the long lists of schedule entries an
+order of magnitude faster than the standard library, and with the json module otherwise. Besides the default
+format, with one object per schedule entry, a schedule can be sent in a columnar format holding one array per
+entry field. It repeats no keys, so it is smaller on the wire and faster to encode and to decode. Clients choose
+the format through the Accept header of the request. Streamed responses are encoded as newline-delimited JSON.
+
+Attributes:
+    JSON_MEDIA_TYPE (str): Media type of the default format, one object per schedule entry.
+    COLUMNAR_MEDIA_TYPE (str): Media type of the columnar format, one array per entry field.
+    NDJSON_MEDIA_TYPE (str): Media type of streamed responses, one JSON value per line.
+
+Functions:
+- dumps: Encodes a JSON-compatible value to compact UTF-8 bytes.
+- to_columnar: Converts a schedule to the columnar format.
+- iter_ndjson: Encodes a stream of values as newline-delimited JSON in chunks.
+- negotiate: Picks the response format for the Accept header of a request.
+"""
+
+__version__ = "1.0.0"
+
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_MEDIA_TYPE = "application/vnd.schedule.columnar+json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+## Supported media types in order of preference, for Accept headers that rank them equally
+_MEDIA_TYPES = (JSON_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE)
+## Specificity of the wildcard media ranges, a concrete media type has specificity 2
+_SPECIFICITY = {"*/*": 0, "application/*": 1}
+
+
+def dumps(value):
+    """
+    Encode a JSON-compatible value.
+
+    Args:
+        value: Any value that can be serialized to JSON.
+
+    Returns:
+        bytes: The compact UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            ## e.g. integers beyond 64 bit, which the json module still encodes
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def to_columnar(result, fields):
+    """
+    Convert the schedule of an algorithm result to the columnar format.
+
+    Args:
+        result (dict): Result of an algorithm, holding its schedule as a list of entries.
+        fields (list of str): Entry fields to turn into columns, in order.
+
+    Returns:
+        dict: A copy of the result whose schedule maps every field to the list of its values in entry order.
+    """
+    entries = result["schedule"]
+    columnar = dict(result)
+    columnar["schedule"] = {field: [entry[field] for entry in entries] for field in fields}
+    return columnar
+
+
+def iter_ndjson(values, chunk_bytes=64 * 1024):
+    """
+    Encode a stream of values as newline-delimited JSON, one value per line.
+
+    The lines are joined into chunks of about ``chunk_bytes``, so the server sends few large writes instead of
+    one per value, while holding no more than one chunk of the encoded stream.
+
+    Args:
+        values (iterable): JSON-compatible values.
+        chunk_bytes (int): Size from which a chunk is sent.
+
+    Yields:
+        bytes: Chunks of complete lines.
+    """
+    lines, size = [], 0
+    for value in values:
+        line = dumps(value)
+        lines.append(line)
+        size += len(line) + 1
+        if size >= chunk_bytes:
+            lines.append(b"")
+            yield b"\n".join(lines)
+            lines, size = [], 0
+    if lines:
+        lines.append(b"")
+        yield b"\n".join(lines)
+
+
+def negotiate(accept):
+    """
+    Pick the response format for the Accept header of a request.
+
+    Args:
+        accept (str): Value of the Accept header, None or empty if the request has none.
+
+    Returns:
+        str: The preferred supported media type, or None if the header accepts neither format.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    ## Quality of every supported type, taken from the most specific matching range as in RFC 9110
+    qualities = {}
+    for entry in accept.split(","):
+        media_range, *params = [part.strip() for part in entry.split(";")]
+        media_range = media_range.lower()
+        specificity = _SPECIFICITY.get(media_range, 2)
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        for media_type in _MEDIA_TYPES:
+            if specificity == 2 and media_range != media_type:
+                continue
+            if specificity < qualities.get(media_type, (-1, 0.0))[0]:
+                continue
+            qualities[media_type] = (specificity, quality)
+    best = max(_MEDIA_TYPES, key=lambda media_type: qualities.get(media_type, (0, 0.0))[1])
+    return best if qualities.get(best, (0, 0.0))[1] > 0 else None
@@ -0,0 +1,300 @@
+"""
+This module reads scheduling requests incrementally, as the body of the request arrives.
+
+Parsing a request body into Python dicts and then validating the whole tree holds every task and message twice and
+walks them twice. Instead the ``tasks`` and ``messages`` arrays of the application are decoded one item at a time
+with the C scanner of the json module, each item is validated against its schema as soon as it is decoded and then
+written straight into the compact arrays of an ApplicationBuilder. Everything else in the request, e.g. the
+platform, is small and decoded as a whole. What is left of the request once the two arrays are taken out is
+validated against the complete input schema at the end, so the result is the same as validating the parsed body.
+
+Unlike ``json.loads``, which keeps the last of repeated keys, a key repeated in the request object or in its
+application is rejected: the items of a streamed array are already in the builder when a second array of the same
+name would replace them. Objects decoded as a whole, e.g. the platform, keep the last value as usual.
+
+Classes:
+- RequestReader: Holds the validators of the input schema, built once, and creates a parser per request.
+- RequestParser: Push parser fed with the chunks of one request body.
+"""
+
+__version__ = "1.0.0"
+
+
+import codecs
+import json
+import re
+
+from jsonschema.exceptions import ValidationError
+
+from model import ApplicationBuilder
+from validation import SchemaValidator
+
+_WHITESPACE = " \t\n\r"
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*").match
+
+## Arrays of the application section that are read item by item, and the builder method taking their items
+_STREAMED = {"tasks": "add_task", "messages": "add_message"}
+
+
+class RequestReader:
+    """
+    Reads scheduling requests against an input schema.
+
+    Attributes:
+        request (SchemaValidator): Validator of the complete input schema.
+        items (dict): Validator of the items of every streamed array, by the name of the array.
+    """
+
+    def __init__(self, schema):
+        """
+        Build the validators of the request and of the items of its streamed arrays.
+
+        Args:
+            schema (dict): The input schema.
+
+        Raises:
+            jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+        """
+        self.request = SchemaValidator(schema)
+        application = schema["properties"]["application"]["properties"]
+        self.items = {
+            name: SchemaValidator(dict(application[name]["items"], **{"$schema": schema["$schema"]}))
+            for name in _STREAMED
+        }
+
+    def parser(self):
+        """Return a parser for the body of one request."""
+        return RequestParser(self)
+
+    def read(self, chunks):
+        """
+        Parse a complete request body.
+
+        Args:
+            chunks (iterable of bytes): The body of the request.
+
+        Returns:
+            tuple: See ``RequestParser.close``.
+        """
+        parser = self.parser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        return parser.close()
+
+
+class RequestParser:
+    """
+    Push parser of a scheduling request, fed with the chunks of the request body as they arrive.
+
+    The parser is written as a generator that suspends whenever it runs out of input, so every chunk is parsed as
+    far as possible when it is fed and only the incomplete tail of the input is buffered.
+
+    Attributes:
+        tasks (int): Number of tasks read once the tasks array is complete.
+        messages (int): Number of messages read once the messages array is complete.
+    """
+
+    def __init__(self, reader):
+        """
+        Start parsing a request body.
+
+        Args:
+            reader (RequestReader): Validators of the input schema.
+        """
+        self.tasks = 0
+        self.messages = 0
+        self._reader = reader
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        decoder = json.JSONDecoder()
+        self._scan = decoder.raw_decode
+        self._scan_once = decoder.scan_once
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._request = {}
+        self._builder = ApplicationBuilder()
+        self._parse = self._run()
+        next(self._parse)
+
+    def feed(self, chunk):
+        """
+        Parse the next chunk of the body.
+
+        Args:
+            chunk (bytes): Next part of the UTF-8 encoded body.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+            jsonschema.exceptions.ValidationError: If a task or message does not match its schema.
+        """
+        text = self._decode(chunk)
+        if not text:
+            return
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        if self._parse is not None:
+            self._resume()
+        elif self._buffer.strip(_WHITESPACE):
+            raise ValueError("Extra data after the request.")
+
+    def close(self):
+        """
+        Finish parsing once the whole body was fed.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+            jsonschema.exceptions.ValidationError: If the request does not match the input schema.
+
+        Returns:
+            tuple: The request without the tasks and messages of the application, which are empty lists, and the
+                   ApplicationModel holding them.
+        """
+        self._buffer = self._buffer[self._pos:] + self._decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        if self._parse is not None:
+            self._resume()
+        if self._buffer[self._pos:].strip(_WHITESPACE):
+            raise ValueError("Extra data after the request.")
+        self._reader.request.validate(self._request)
+        return self._request, self._builder.build()
+
+    def _resume(self):
+        try:
+            next(self._parse)
+        except StopIteration:
+            self._parse = None
+
+    ## The parsing generators below yield to wait for more input and return their result
+
+    def _run(self):
+        yield
+        yield from self._object(self._request, self._request_member)
+
+    def _request_member(self, key):
+        if key == "application" and (yield from self._peek()) == "{":
+            application = self._request[key] = {}
+            yield from self._object(application, lambda key: self._application_member(application, key))
+        else:
+            self._request[key] = yield from self._value()
+
+    def _application_member(self, application, key):
+        if key in _STREAMED and (yield from self._peek()) == "[":
+            application[key] = []
+            validator = self._reader.items[key]
+            add = getattr(self._builder, _STREAMED[key])
+            count = 0
+
+            def take(item):
+                try:
+                    validator.validate(item)
+                except ValidationError as err:
+                    err.path.extendleft(reversed(["application", key, count]))
+                    raise
+                add(item)
+
+            more = yield from self._next_item(True)
+            while more:
+                take((yield from self._value()))
+                count += 1
+                ## Decode the items that are complete in the buffer without suspending in between
+                buffer, pos, scan = self._buffer, self._pos, self._scan_once
+                while True:
+                    match = _SEPARATOR(buffer, pos)
+                    if match is None or match.end() == len(buffer):
+                        break
+                    if match.group(1) == "]":
+                        pos = match.end()
+                        more = False
+                        break
+                    try:
+                        item, end = scan(buffer, match.end())
+                    except (StopIteration, json.JSONDecodeError):
+                        break
+                    if end == len(buffer) and isinstance(item, (int, float)):
+                        break
+                    take(item)
+                    count += 1
+                    pos = end
+                self._pos = pos
+                if more:
+                    more = yield from self._next_item(False)
+            setattr(self, key, count)
+        else:
+            application[key] = yield from self._value()
+
+    def _object(self, target, member):
+        """Parse an object, ``member`` parses the value of every key."""
+        yield from self._expect("{")
+        if (yield from self._peek()) == "}":
+            self._pos += 1
+            return
+        while True:
+            key = yield from self._value()
+            if not isinstance(key, str):
+                raise ValueError("Expecting a property name enclosed in double quotes.")
+            if key in target:
+                raise ValueError(f"Duplicate key '{key}'.")
+            yield from self._expect(":")
+            yield from member(key)
+            separator = yield from self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError("Expecting ',' or '}' in an object.")
+
+    def _next_item(self, first):
+        """Consume the opening bracket or the separator before the next array item, False at the end."""
+        if first:
+            yield from self._expect("[")
+            if (yield from self._peek()) == "]":
+                self._pos += 1
+                return False
+            return True
+        separator = yield from self._peek()
+        self._pos += 1
+        if separator == "]":
+            return False
+        if separator != ",":
+            raise ValueError("Expecting ',' or ']' in an array.")
+        return True
+
+    def _expect(self, char):
+        if (yield from self._peek()) != char:
+            raise ValueError(f"Expecting '{char}'.")
+        self._pos += 1
+
+    def _peek(self):
+        """Return the next character that is not whitespace, None at the end of the body."""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if self._eof:
+                return None
+            yield
+
+    def _value(self):
+        """Decode the next complete JSON value."""
+        yield from self._peek()
+        while True:
+            try:
+                value, end = self._scan(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                if self._eof:
+                    raise ValueError(f"Invalid JSON: {err.msg}.") from None
+                ## Wait for the buffered input to double, so long values are not rescanned for every chunk
+                wanted = 2 * (len(self._buffer) - self._pos)
+                while not self._eof and len(self._buffer) - self._pos < wanted:
+                    yield
+                continue
+            if end == len(self._buffer) and not self._eof and isinstance(value, (int, float)):
+                ## A number at the end of the input may continue in the next chunk
+                yield
+                continue
+            self._pos = end
+            return value
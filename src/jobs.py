@@ -0,0 +1,322 @@
+"""
+This module runs long computations as jobs in a bounded pool of worker threads, decoupled from the HTTP requests.
+
+A client submits a job and gets its id back at once, then polls the job until it is done. The number of jobs that
+are queued or running is bounded, so a burst of huge models is turned away instead of piling up, and every job has
+a deadline counted from its submission. Jobs stop cooperatively: the job function calls ``Job.check`` between steps
+of its work, e.g. between the schedule entries yielded by the generator variant of an algorithm, which raises once
+the job was cancelled or its deadline has passed. Finished jobs and their results are kept for a retention window
+and dropped afterwards, or earlier, oldest first, once their results exceed a memory bound.
+
+The backend only relies on ``submit``, ``store``, ``get``, ``cancel``, ``stats`` and ``shutdown``, so the JobQueue
+can be replaced by a stand-in with the same methods, e.g. one backed by an external queue.
+
+Classes:
+- Job: State and result of a job, polled by the clients.
+- JobQueue: Bounded queue of jobs and the worker threads running them.
+"""
+
+__version__ = "1.0.0"
+
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+logger = logging.getLogger("jobs")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timed_out"
+
+## States a job does not leave any more
+FINISHED = frozenset({DONE, FAILED, CANCELLED, TIMED_OUT})
+
+
+class JobStopped(Exception):
+    """Raised by ``Job.check`` to stop a job that was cancelled or ran past its deadline."""
+
+    def __init__(self, status):
+        super().__init__(status)
+        self.status = status
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while the queue holds as many unfinished jobs as it allows."""
+
+
+class Job:
+    """
+    State and result of a job.
+
+    Attributes:
+        id (str): Unique id of the job.
+        status (str): One of QUEUED, RUNNING, DONE, FAILED, CANCELLED or TIMED_OUT.
+        result: Return value of the job function once the job is DONE.
+        error (str): Reason of a FAILED, CANCELLED or TIMED_OUT job.
+        submitted_at (float): Unix time of the submission.
+        started_at (float): Unix time the job started running, None before.
+        finished_at (float): Unix time the job finished, None before.
+        deadline (float): ``time.monotonic`` time after which the job is stopped, None for no deadline.
+    """
+
+    __slots__ = ("id", "status", "result", "error", "submitted_at", "started_at", "finished_at", "deadline",
+                 "function", "args", "_cancelled")
+
+    def __init__(self, function=None, args=(), timeout=None):
+        """
+        Create a queued job.
+
+        Args:
+            function (callable, optional): Called as ``function(job, *args)`` to run the job.
+            args (tuple): Further arguments of ``function``.
+            timeout (float, optional): Seconds from now until the deadline of the job, no deadline if omitted.
+        """
+        self.id = uuid.uuid4().hex
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.function = function
+        self.args = args
+        self._cancelled = False
+
+    def check(self):
+        """
+        Stop the job if it was cancelled or its deadline has passed, called by the job function between steps.
+
+        Raises:
+            JobStopped: If the job has to stop.
+        """
+        if self._cancelled:
+            raise JobStopped(CANCELLED)
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise JobStopped(TIMED_OUT)
+
+    def info(self):
+        """
+        Describe the state of the job, without its result.
+
+        Returns:
+            dict: Id, status, timestamps and, for jobs that did not succeed, the error.
+        """
+        info = {
+            "id": self.id,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.error is not None:
+            info["error"] = self.error
+        return info
+
+
+class JobQueue:
+    """
+    Bounded queue of jobs run by a pool of worker threads, started on the first submission.
+
+    Attributes:
+        workers (int): Number of worker threads.
+        max_jobs (int): Upper bound of the jobs that are queued or running.
+        retention (float): Seconds a finished job and its result are kept.
+        max_result_bytes (int): Upper bound of the summed size of the kept results, None for no bound.
+        evictions (int): Number of finished jobs dropped before the end of their retention to stay within
+                         ``max_result_bytes``.
+    """
+
+    def __init__(self, workers, max_jobs, retention, max_result_bytes=None):
+        """
+        Create an empty queue.
+
+        Args:
+            workers (int): Number of worker threads.
+            max_jobs (int): Upper bound of the jobs that are queued or running.
+            retention (float): Seconds a finished job and its result are kept.
+            max_result_bytes (int, optional): Upper bound of the summed size of the results of the finished jobs,
+                                              counting results that are bytes, unbounded if omitted. The oldest
+                                              finished jobs are dropped to stay within it, the latest finished job
+                                              is always kept.
+        """
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self.retention = retention
+        self.max_result_bytes = max_result_bytes
+        self.evictions = 0
+        self._jobs = OrderedDict()
+        ## Ids of the finished jobs with the time they expire and the size of their result, in the order they finished
+        self._expiry = deque()
+        self._result_bytes = 0
+        self._unfinished = 0
+        self._queue = queue.Queue()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def submit(self, function, *args, timeout=None):
+        """
+        Queue a job.
+
+        Args:
+            function (callable): Called as ``function(job, *args)`` in a worker thread, returns the result of the job.
+                                 A ValueError fails the job with its message.
+            *args: Further arguments of ``function``.
+            timeout (float, optional): Seconds from now until the job is stopped, no deadline if omitted.
+
+        Raises:
+            QueueFull: If ``max_jobs`` jobs are queued or running.
+
+        Returns:
+            Job: The queued job.
+        """
+        job = Job(function, args, timeout)
+        with self._lock:
+            self._expire()
+            if self._unfinished >= self.max_jobs:
+                raise QueueFull(f"{self._unfinished} jobs are queued or running.")
+            self._unfinished += 1
+            self._jobs[job.id] = job
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name=f"job-worker-{len(self._threads)}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self._queue.put(job)
+        return job
+
+    def store(self, result):
+        """
+        Register a job that is done already, e.g. because its result was found in a cache.
+
+        Args:
+            result: The result of the job.
+
+        Returns:
+            Job: The finished job.
+        """
+        job = Job()
+        job.started_at = job.submitted_at
+        with self._lock:
+            self._expire()
+            self._jobs[job.id] = job
+            self._finish(job, DONE, result=result)
+        return job
+
+    def get(self, job_id):
+        """Return the job with the given id, or None if there is none or it has expired."""
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job. A queued job is cancelled at once, a running job once it checks its state next.
+
+        Args:
+            job_id (str): Id of the job.
+
+        Returns:
+            Job: The job, or None if there is none or it has expired.
+        """
+        with self._lock:
+            self._expire()
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED:
+                return job
+            job._cancelled = True
+            if job.status == QUEUED:
+                self._finish(job, CANCELLED, error="Cancelled")
+        return job
+
+    def stats(self):
+        """
+        Count the jobs in every state.
+
+        Returns:
+            dict: Number of kept jobs by status, the size of the kept results, the number of evicted jobs and the
+                  bounds of the queue.
+        """
+        with self._lock:
+            self._expire()
+            counts = dict.fromkeys([QUEUED, RUNNING, DONE, FAILED, CANCELLED, TIMED_OUT], 0)
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            return dict(counts, result_bytes=self._result_bytes, evictions=self.evictions, workers=self.workers,
+                        max_jobs=self.max_jobs, max_result_bytes=self.max_result_bytes)
+
+    def shutdown(self):
+        """Cancel all unfinished jobs and stop the worker threads once their current jobs have stopped."""
+        with self._lock:
+            for job in list(self._jobs.values()):
+                if job.status not in FINISHED:
+                    job._cancelled = True
+                    if job.status == QUEUED:
+                        self._finish(job, CANCELLED, error="Cancelled")
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+
+    def _work(self):
+        """Run the queued jobs one after another, until a None is queued."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                if job.status != QUEUED:
+                    continue
+                job.status = RUNNING
+                job.started_at = time.time()
+            try:
+                job.check()
+                result = job.function(job, *job.args)
+            except JobStopped as stop:
+                outcome = {"status": stop.status, "error": "Cancelled" if stop.status == CANCELLED else
+                           "Deadline exceeded"}
+            except ValueError as err:
+                outcome = {"status": FAILED, "error": str(err)}
+            except Exception:
+                logger.exception("Job %s failed", job.id)
+                outcome = {"status": FAILED, "error": "Internal Server Error"}
+            else:
+                outcome = {"status": DONE, "result": result}
+            with self._lock:
+                self._finish(job, **outcome)
+
+    def _finish(self, job, status, result=None, error=None):
+        """Move a job to a final state and schedule its expiry. Called with the lock held."""
+        if job.function is not None:
+            self._unfinished -= 1
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        job.function = job.args = None
+        size = len(result) if isinstance(result, (bytes, bytearray, memoryview)) else 0
+        self._expiry.append((time.monotonic() + self.retention, job.id, size))
+        self._result_bytes += size
+        if self.max_result_bytes is not None:
+            while self._result_bytes > self.max_result_bytes and len(self._expiry) > 1:
+                self._drop()
+                self.evictions += 1
+
+    def _expire(self):
+        """Drop the finished jobs past the retention window. Called with the lock held."""
+        now = time.monotonic()
+        while self._expiry and self._expiry[0][0] <= now:
+            self._drop()
+
+    def _drop(self):
+        """Drop the job that finished first among the kept ones. Called with the lock held."""
+        _, job_id, size = self._expiry.popleft()
+        self._jobs.pop(job_id, None)
+        self._result_bytes -= size
@@ -0,0 +1,213 @@
+"""
+This module records where the time of a scheduling request goes, for a Prometheus /metrics endpoint and the
+Server-Timing header of the response.
+
+A request collects the duration of each of its phases in a Timings object: parsing the body, validating the
+input, compiling the models, setting up and running every algorithm, validating and serializing the output. Once
+the response is ready the durations are observed by the histograms of the registry and listed in the Server-Timing
+header. Nothing is observed per task or entry, only per phase, and when metrics are disabled the request gets
+``NO_TIMINGS``, whose methods do nothing.
+
+Algorithm phases are named ``<algorithm>.setup`` (building the scheduler state up to the first placed job) and
+``<algorithm>.loop`` (placing the remaining jobs). They are observed with the algorithm as a label of their own.
+
+Classes:
+- Histogram: Prometheus histogram with labels.
+- Registry: Collection of histograms rendered in the Prometheus text format.
+- Timings: Phase durations and model sizes of one request.
+- NullTimings: Stand-in for Timings while metrics are disabled.
+
+Attributes:
+    REGISTRY (Registry): The metrics exposed on /metrics.
+    NO_TIMINGS (NullTimings): Timings of requests while metrics are disabled.
+"""
+
+__version__ = "1.0.0"
+
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+
+TEXT_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+## Upper bounds of the buckets of durations in seconds and of model sizes
+SECONDS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (10, 100, 1000, 10000, 100000, 1000000, 10000000)
+
+
+class Histogram:
+    """
+    Prometheus histogram with a fixed set of label names.
+
+    Attributes:
+        name (str): Metric name.
+        help (str): Description of the metric.
+        buckets (tuple): Increasing upper bounds of the buckets, the +Inf bucket is implied.
+        labelnames (tuple): Names of the labels, their values are passed to ``observe`` in this order.
+    """
+
+    def __init__(self, name, help, buckets, labelnames=()):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.labelnames = tuple(labelnames)
+        ## Per label values: count per bucket (the last one for +Inf), sum and count of the observations
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        """Record an observation for the given label values."""
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        """Return the histogram in the Prometheus text format."""
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, ([*counts], total, count)) for labels, (counts, total, count)
+                            in self._series.items())
+        for labels, (counts, total, count) in series:
+            pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, labels)]
+            cumulative = 0
+            for bound, bucket in zip(self.buckets + ("+Inf",), counts):
+                cumulative += bucket
+                selector = ",".join(pairs + [f'le="{bound}"'])
+                lines.append(f"{self.name}_bucket{{{selector}}} {cumulative}")
+            selector = "{" + ",".join(pairs) + "}" if pairs else ""
+            lines.append(f"{self.name}_sum{selector} {total!r}")
+            lines.append(f"{self.name}_count{selector} {count}")
+        return "\n".join(lines) + "\n"
+
+
+class Registry:
+    """Collection of histograms rendered together."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def histogram(self, name, help, buckets, labelnames=()):
+        """Create and register a histogram, see ``Histogram``."""
+        metric = Histogram(name, help, buckets, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Return all metrics in the Prometheus text format."""
+        return "".join(metric.render() for metric in self._metrics)
+
+
+REGISTRY = Registry()
+PHASE_SECONDS = REGISTRY.histogram(
+    "scheduler_phase_seconds", "Duration of the phases of a scheduling request.", SECONDS_BUCKETS, ("phase",))
+ALGORITHM_SECONDS = REGISTRY.histogram(
+    "scheduler_algorithm_seconds", "Duration of the setup and placement loop of a scheduling algorithm.",
+    SECONDS_BUCKETS, ("algorithm", "phase"))
+MODEL_SIZE = REGISTRY.histogram(
+    "scheduler_model_size", "Number of tasks, messages and platform nodes of a scheduling request.", SIZE_BUCKETS,
+    ("kind",))
+
+
+class Timings:
+    """
+    Phase durations and model sizes of one request.
+
+    Attributes:
+        enabled (bool): Always True, False for ``NO_TIMINGS``.
+        durations (dict): Seconds spent in every phase, in the order the phases were first entered.
+        sizes (dict): Model size by kind, e.g. "tasks".
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.durations = {}
+        self.sizes = {}
+        self._start = time.perf_counter()
+
+    def add(self, phase, seconds):
+        """Add the duration of a phase, phases entered more than once are summed up."""
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    def update(self, durations):
+        """Add the durations of several phases, e.g. measured in a worker process."""
+        for phase, seconds in durations.items():
+            self.add(phase, seconds)
+
+    def phase(self, name):
+        """Return a context manager adding the time spent in its block to the phase ``name``."""
+        return _Phase(self, name)
+
+    def size(self, kind, value):
+        """Record a model size."""
+        self.sizes[kind] = value
+
+    def finish(self):
+        """
+        Observe the durations and sizes by the histograms of the registry.
+
+        Returns:
+            str: The Server-Timing header listing every phase and the total time of the request in milliseconds.
+        """
+        total = time.perf_counter() - self._start
+        for phase, seconds in self.durations.items():
+            algorithm, _, algorithm_phase = phase.rpartition(".")
+            if algorithm:
+                ALGORITHM_SECONDS.observe(seconds, algorithm, algorithm_phase)
+            else:
+                PHASE_SECONDS.observe(seconds, phase)
+        PHASE_SECONDS.observe(total, "total")
+        for kind, value in self.sizes.items():
+            MODEL_SIZE.observe(value, kind)
+        return ", ".join(f"{phase};dur={seconds * 1e3:.3f}" for phase, seconds in
+                         [*self.durations.items(), ("total", total)])
+
+
+class NullTimings:
+    """Timings of requests while metrics are disabled, every method does nothing."""
+
+    enabled = False
+    durations = sizes = {}
+    _null = nullcontext()
+
+    def add(self, phase, seconds):
+        pass
+
+    def update(self, durations):
+        pass
+
+    def phase(self, name):
+        return self._null
+
+    def size(self, kind, value):
+        pass
+
+    def finish(self):
+        return None
+
+
+NO_TIMINGS = NullTimings()
+
+
+class _Phase:
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings, name):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.timings.add(self.name, time.perf_counter() - self.start)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,320 @@
+"""
+This module compiles the application model of a scheduling request into a compact, index-based form.
+
+The JSON input describes tasks and messages as lists of dicts that refer to each other by id. The schedulers only
+need the execution times, the deadlines and the predecessors/successors of each task, so the model is compiled
+once per request: task ids are mapped to dense integer indices, the per-task values are stored in parallel arrays
+and the messages are stored in a Dag over the task indices.
+
+Classes:
+- ApplicationModel: Compiled application model shared by all scheduling algorithms.
+- ApplicationBuilder: Collects tasks and messages one by one, e.g. while they are parsed, into an ApplicationModel.
+
+Functions:
+- compile_application: Builds an ApplicationModel from the application section of the input.
+- int64: Converts a value of the input to the integer it is stored as.
+- int64_array: Converts the values of the input to an array of 64-bit integers.
+"""
+
+__version__ = "1.0.0"
+
+
+import hashlib
+import json
+from array import array
+
+from dag import Dag
+
+## Range of the signed 64-bit integers the values of the tasks and messages are stored as
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+class ApplicationModel:
+    """
+    Application model with dense task indices, parallel value arrays and the message graph.
+
+    Attributes:
+        ids (list): Task id for every task index, in input order.
+        index (dict): Task index for every task id.
+        wcet (array): Worst-case execution time per task.
+        mcet (array): Mean-case execution time per task.
+        deadline (array): Deadline per task.
+        graph (Dag): Message graph over the task indices.
+        size (array): Size of every message, in the edge order of ``graph``.
+        blocked (tuple): Indices of tasks that receive a message from a sender which is not a task.
+    """
+
+    __slots__ = ("ids", "index", "wcet", "mcet", "deadline", "graph", "size", "blocked")
+
+    def __init__(self, ids, wcet, mcet, deadline, senders, receivers, size, blocked=(), index=None):
+        """
+        Build the model from per-task values and the message edges as task indices.
+
+        Args:
+            ids (list): Task id for every task index.
+            wcet (array): Worst-case execution time per task.
+            mcet (array): Mean-case execution time per task.
+            deadline (array): Deadline per task.
+            senders (array): Sender task index of every message.
+            receivers (array): Receiver task index of every message.
+            size (array): Size of every message.
+            blocked (tuple): Indices of tasks waiting for a sender which is not a task.
+            index (dict, optional): Task index for every task id, derived from ``ids`` if omitted.
+        """
+        self.ids = ids
+        self.index = index if index is not None else {task_id: i for i, task_id in enumerate(ids)}
+        self.wcet = wcet
+        self.mcet = mcet
+        self.deadline = deadline
+        self.graph = Dag(len(ids), senders, receivers)
+        self.size = size
+        self.blocked = blocked
+
+    @classmethod
+    def from_graph(cls, ids, wcet, mcet, deadline, graph, size, blocked=(), index=None):
+        """
+        Build the model around a message graph that was built before, e.g. loaded from a model file.
+
+        Args:
+            ids (sequence): Task id for every task index.
+            wcet (sequence): Worst-case execution time per task.
+            mcet (sequence): Mean-case execution time per task.
+            deadline (sequence): Deadline per task.
+            graph (Dag): Message graph over the task indices.
+            size (sequence): Size of every message, in the edge order of ``graph``.
+            blocked (tuple): Indices of tasks waiting for a sender which is not a task.
+            index (dict, optional): Task index for every task id, derived from ``ids`` if omitted.
+
+        Returns:
+            ApplicationModel: The model holding the given sequences without copying them.
+        """
+        model = cls.__new__(cls)
+        model.ids = ids
+        model.index = index if index is not None else {task_id: i for i, task_id in enumerate(ids)}
+        model.wcet, model.mcet, model.deadline = wcet, mcet, deadline
+        model.graph = graph
+        model.size = size
+        model.blocked = blocked
+        return model
+
+    def __len__(self):
+        return len(self.ids)
+
+    def digest(self):
+        """
+        Hash the content of the model.
+
+        Applications that differ only in their formatting, the order of the keys of their tasks and messages or the
+        ids of their messages compile to the same model and get the same digest.
+
+        Returns:
+            str: SHA-256 hex digest of the task ids, the value arrays and the message graph.
+        """
+        digest = hashlib.sha256(json.dumps([self.ids, self.blocked]).encode())
+        graph = self.graph
+        for column in (self.wcet, self.mcet, self.deadline, self.size, graph.pred_offsets, graph.pred,
+                       graph.pred_edge, graph.succ_offsets, graph.succ):
+            digest.update(memoryview(column).cast("B"))
+        return digest.hexdigest()
+
+    def indegrees(self):
+        """
+        Count the predecessors of every task.
+
+        Messages from senders that are not tasks are counted as well, so the receiving task never becomes ready.
+
+        Returns:
+            list of int: Number of predecessors per task index.
+        """
+        counts = self.graph.indegrees()
+        for i in self.blocked:
+            counts[i] += 1
+        return counts
+
+
+def compile_application(application_data):
+    """
+    Compile the application section of the input into an ApplicationModel.
+
+    Messages whose receiver is not a task are ignored, messages whose sender is not a task block their receiver.
+
+    Args:
+        application_data (dict or ApplicationModel): Contains tasks and the messages between them.
+                                                     An already compiled model is returned unchanged.
+
+    Raises:
+        ValueError: If a value of a task or message is not a 64-bit integer.
+
+    Returns:
+        ApplicationModel: The compiled application model.
+    """
+    if isinstance(application_data, ApplicationModel):
+        return application_data
+
+    tasks = application_data['tasks']
+    ids = [task['id'] for task in tasks]
+    index = {task_id: i for i, task_id in enumerate(ids)}
+    messages = application_data.get('messages', [])
+    senders, receivers, size, blocked = _resolve_messages(
+        index, (message['sender'] for message in messages), (message['receiver'] for message in messages),
+        (message['size'] for message in messages))
+
+    return ApplicationModel(
+        ids,
+        int64_array([task['wcet'] for task in tasks], "Task wcet"),
+        int64_array([task['mcet'] for task in tasks], "Task mcet"),
+        int64_array([task['deadline'] for task in tasks], "Task deadline"),
+        senders,
+        receivers,
+        size,
+        blocked,
+        index,
+    )
+
+
+def int64(value, field):
+    """
+    Convert a value of the input to the signed 64-bit integer it is stored as.
+
+    The input schema, like JSON itself, accepts integral floats such as ``1.0`` as integers, so they are converted.
+
+    Args:
+        value: The decoded value.
+        field (str): Name of the value in the error message.
+
+    Raises:
+        ValueError: If the value is not an integer or does not fit into 64 bits.
+
+    Returns:
+        int: The value.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if not isinstance(value, int) or not INT64_MIN <= value <= INT64_MAX:
+        raise ValueError(f"{field} must be an integer between {INT64_MIN} and {INT64_MAX}, got {value!r}.")
+    return value
+
+
+def int64_array(values, field):
+    """
+    Convert values of the input to an array of signed 64-bit integers, see ``int64``.
+
+    Args:
+        values (list): The decoded values.
+        field (str): Name of the values in the error message.
+
+    Raises:
+        ValueError: If a value is not an integer or does not fit into 64 bits.
+
+    Returns:
+        array: The values.
+    """
+    ## Plain integers, the common case, are copied at once and only the values of other inputs are converted
+    try:
+        return array("q", values)
+    except (TypeError, OverflowError):
+        return array("q", [int64(value, field) for value in values])
+
+
+def _resolve_messages(index, sender_ids, receiver_ids, sizes):
+    """
+    Turn the messages between task ids into edges between task indices.
+
+    Messages whose receiver is not a task are ignored, messages whose sender is not a task block their receiver.
+
+    Args:
+        index (dict): Task index for every task id.
+        sender_ids (iterable): Sender task id of every message.
+        receiver_ids (iterable): Receiver task id of every message.
+        sizes (iterable): Size of every message.
+
+    Raises:
+        ValueError: If a size is not a 64-bit integer.
+
+    Returns:
+        tuple: Sender indices, receiver indices and sizes of the edges, and the indices of the blocked tasks.
+    """
+    senders = array("q")
+    receivers = array("q")
+    size = array("q")
+    blocked = []
+    for sender_id, receiver_id, message_size in zip(sender_ids, receiver_ids, sizes):
+        receiver = index.get(receiver_id)
+        if receiver is None:
+            continue
+        sender = index.get(sender_id)
+        if sender is None:
+            blocked.append(receiver)
+            continue
+        try:
+            size.append(message_size)
+        except (TypeError, OverflowError):
+            size.append(int64(message_size, "Message size"))
+        senders.append(sender)
+        receivers.append(receiver)
+    return senders, receivers, size, tuple(blocked)
+
+
+class ApplicationBuilder:
+    """
+    Collects the tasks and messages of an application one by one into compact arrays.
+
+    Messages may refer to tasks that are added later, so their task ids are only resolved by ``build``.
+    """
+
+    __slots__ = ("ids", "wcet", "mcet", "deadline", "sender_ids", "receiver_ids", "size")
+
+    def __init__(self):
+        self.ids = []
+        self.wcet = array("q")
+        self.mcet = array("q")
+        self.deadline = array("q")
+        self.sender_ids = []
+        self.receiver_ids = []
+        self.size = array("q")
+
+    def add_task(self, task):
+        """
+        Add a task given as in the ``tasks`` of the application section.
+
+        Raises:
+            ValueError: If a value of the task is not a 64-bit integer, see ``int64``.
+        """
+        try:
+            self.wcet.append(task['wcet'])
+            self.mcet.append(task['mcet'])
+            self.deadline.append(task['deadline'])
+        except (TypeError, OverflowError):
+            ## Drop the values appended before the failing one and convert them all
+            n = len(self.ids)
+            del self.wcet[n:], self.mcet[n:], self.deadline[n:]
+            self.wcet.append(int64(task['wcet'], "Task wcet"))
+            self.mcet.append(int64(task['mcet'], "Task mcet"))
+            self.deadline.append(int64(task['deadline'], "Task deadline"))
+        self.ids.append(task['id'])
+
+    def add_message(self, message):
+        """
+        Add a message given as in the ``messages`` of the application section.
+
+        Raises:
+            ValueError: If the size of the message is not a 64-bit integer, see ``int64``.
+        """
+        try:
+            self.size.append(message['size'])
+        except (TypeError, OverflowError):
+            self.size.append(int64(message['size'], "Message size"))
+        self.sender_ids.append(message['sender'])
+        self.receiver_ids.append(message['receiver'])
+
+    def build(self):
+        """
+        Resolve the messages and build the model.
+
+        Returns:
+            ApplicationModel: The compiled application model.
+        """
+        index = {task_id: i for i, task_id in enumerate(self.ids)}
+        senders, receivers, size, blocked = _resolve_messages(index, self.sender_ids, self.receiver_ids, self.size)
+        return ApplicationModel(self.ids, self.wcet, self.mcet, self.deadline, senders, receivers, size,
+                                blocked, index)
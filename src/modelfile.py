@@ -0,0 +1,216 @@
+"""
+This module stores compiled application and platform models in a compact binary file that is loaded without parsing.
+
+Design-space exploration schedules the same large models over and over, and reading them from JSON costs more than
+scheduling them. A model file holds the compiled form instead: fixed-width task columns, the CSR arrays of the
+message graph and the link table, all as 64-bit integers aligned to 8 bytes. Loading a file memory-maps it and
+wraps every column in a memoryview, so the algorithms index the mapped pages directly and only the pages they touch
+are ever read. Task and node ids are stored as an integer column when they are all integers, and as a JSON array
+otherwise.
+
+File layout, little-endian:
+
+- Header: magic ``SCHDMODL``, format version and number of sections (``<8sII``).
+- Section table: name, kind (``q`` for an int64 column, ``j`` for JSON), offset and length in bytes of every
+  section (``<8sc7xQQ``).
+- Section data, every section starting at a multiple of 8 bytes.
+
+Functions:
+- write_model: Writes an application and platform to a model file.
+- load_model: Memory-maps a model file and returns its application and platform models.
+- convert: Converts a request in the JSON input format to a model file.
+
+Usage:
+    python src/modelfile.py model.json [model.bin]
+"""
+
+__version__ = "1.0.0"
+
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from dag import Dag
+from ingest import RequestReader
+from model import ApplicationModel, compile_application
+from topology import PlatformModel, compile_platform
+
+MAGIC = b"SCHDMODL"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sII")
+_SECTION = struct.Struct("<8sc7xQQ")
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def write_model(application_data, platform_data, path):
+    """
+    Write an application and platform to a model file.
+
+    Args:
+        application_data (dict or ApplicationModel): The application section of a request, or its compiled model.
+        platform_data (dict or PlatformModel): The platform section of a request, or its compiled model.
+        path (str): Path of the model file, replaced if it exists.
+    """
+    application = compile_application(application_data)
+    platform = compile_platform(platform_data)
+    graph = application.graph
+
+    type_names = list(platform.types)
+    node_types = array("q", bytes(8 * len(platform.node_ids)))
+    for code, name in enumerate(type_names):
+        for k in platform.types[name]:
+            node_types[k] = code
+
+    sections = [
+        (b"task_ids", *_ids_section(application.ids)),
+        (b"wcet", b"q", application.wcet),
+        (b"mcet", b"q", application.mcet),
+        (b"deadline", b"q", application.deadline),
+        (b"pred_off", b"q", graph.pred_offsets),
+        (b"pred", b"q", graph.pred),
+        (b"pred_edg", b"q", graph.pred_edge),
+        (b"succ_off", b"q", graph.succ_offsets),
+        (b"succ", b"q", graph.succ),
+        (b"msg_size", b"q", application.size),
+        (b"blocked", b"q", application.blocked),
+        (b"node_ids", *_ids_section(platform.node_ids)),
+        (b"typename", b"j", type_names),
+        (b"nodetype", b"q", node_types),
+        (b"lnk_from", b"q", platform.link_start),
+        (b"lnk_to", b"q", platform.link_end),
+        (b"lnk_dlay", b"q", platform.link_delay),
+        (b"lnk_bw", b"q", platform.link_bandwidth),
+    ]
+    blobs = []
+    for name, kind, values in sections:
+        if kind == b"q":
+            column = array("q", values)
+            if sys.byteorder != "little":
+                column.byteswap()
+            blobs.append(column.tobytes())
+        else:
+            blobs.append(json.dumps(values, separators=(",", ":"), ensure_ascii=False).encode())
+
+    offset = _align(_HEADER.size + _SECTION.size * len(sections))
+    table = []
+    for (name, kind, _), blob in zip(sections, blobs):
+        table.append(_SECTION.pack(name, kind, offset, len(blob)))
+        offset = _align(offset + len(blob))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        f.writelines(table)
+        for blob in blobs:
+            f.write(bytes(_align(f.tell()) - f.tell()))
+            f.write(blob)
+
+
+def load_model(path):
+    """
+    Memory-map a model file and return its models.
+
+    The integer columns of the models are memoryviews of the mapped file, which stays mapped as long as any of them
+    is referenced. Such models can not be pickled, worker processes should load the file themselves.
+
+    Args:
+        path (str): Path of the model file.
+
+    Raises:
+        ValueError: If the file is not a model file of a supported version, or it is truncated or corrupt.
+
+    Returns:
+        tuple: The ApplicationModel and the PlatformModel.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise ValueError(f"{path} is not a model file.")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    magic, version, count = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a model file.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path} has model file version {version}, expected {FORMAT_VERSION}.")
+    try:
+        return _read_sections(view, count)
+    except (struct.error, KeyError, IndexError, TypeError, ValueError) as err:
+        raise ValueError(f"{path} is a truncated or corrupt model file: {err!r}.") from None
+
+
+def _read_sections(view, count):
+    """Build the models from the section table and the sections of a mapped model file."""
+    sections = {}
+    for position in range(_HEADER.size, _HEADER.size + count * _SECTION.size, _SECTION.size):
+        name, kind, offset, length = _SECTION.unpack_from(view, position)
+        name = name.rstrip(b"\0")
+        if offset + length > len(view):
+            raise ValueError(f"section {name!r} ends past the end of the file")
+        data = view[offset:offset + length]
+        if kind == b"j":
+            sections[name] = json.loads(bytes(data))
+        elif sys.byteorder == "little":
+            sections[name] = data.cast("q")
+        else:
+            column = array("q", bytes(data))
+            column.byteswap()
+            sections[name] = column
+
+    graph = Dag.from_csr(sections[b"pred_off"], sections[b"pred"], sections[b"pred_edg"],
+                         sections[b"succ_off"], sections[b"succ"])
+    application = ApplicationModel.from_graph(
+        sections[b"task_ids"], sections[b"wcet"], sections[b"mcet"], sections[b"deadline"], graph,
+        sections[b"msg_size"], tuple(sections[b"blocked"]))
+    type_names = sections[b"typename"]
+    platform = PlatformModel(
+        sections[b"node_ids"], [type_names[code] for code in sections[b"nodetype"]],
+        sections[b"lnk_from"], sections[b"lnk_to"], sections[b"lnk_dlay"], sections[b"lnk_bw"])
+    return application, platform
+
+
+def convert(json_path, model_path, schema_path=None):
+    """
+    Convert a request in the JSON input format to a model file.
+
+    The request is read incrementally and validated against the input schema, like the body of /schedule_jobs.
+
+    Args:
+        json_path (str): Path of the JSON request holding the application and the platform.
+        model_path (str): Path of the model file to write.
+        schema_path (str, optional): Path of the input schema, the one next to this module if omitted.
+
+    Raises:
+        ValueError: If the request is not valid JSON or a link refers to an unknown node.
+        jsonschema.exceptions.ValidationError: If the request does not match the input schema.
+    """
+    if schema_path is None:
+        schema_path = os.path.join(os.path.dirname(__file__), "input_schema.json")
+    with open(schema_path) as f:
+        reader = RequestReader(json.load(f))
+    with open(json_path, "rb") as f:
+        request, application = reader.read(iter(lambda: f.read(1 << 16), b""))
+    write_model(application, request["platform"], model_path)
+
+
+def _ids_section(ids):
+    """Return the kind and values of the section holding ``ids``, an int64 column if they are all integers."""
+    if all(type(i) is int and _INT64_MIN <= i <= _INT64_MAX for i in ids):
+        return b"q", ids
+    return b"j", list(ids)
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert a JSON request to a model file.")
+    parser.add_argument("json_path", help="Request holding the application and the platform")
+    parser.add_argument("model_path", nargs="?", help="Model file to write, the JSON path with a .bin suffix if omitted")
+    args = parser.parse_args()
+    convert(args.json_path, args.model_path or os.path.splitext(args.json_path)[0] + ".bin")
@@ -0,0 +1,654 @@
+"""
+This module keeps an application and its schedules on the server, so that an edit of the application is
+rescheduled incrementally instead of from scratch.
+
+A session compiles the application once and calculates the selected schedules, leaving checkpoints of the scheduler
+state behind while the jobs are placed. A delta then adds, updates or removes tasks and messages. Every change
+touches a few jobs: a task whose execution time or deadline changed, the receiver of an added, removed or resized
+message, an added task and the successors of a removed one. A touched job can only alter a schedule from the
+placement at which it becomes ready, the one after its last predecessor was placed, before or after the edit. Up to
+the first such placement the placement order of the schedule is kept as it is, and the placement resumes from the
+last checkpoint before it, with the jobs ranked by their edited priority keys. The result is the schedule of the
+edited application calculated from scratch: edited tasks and messages keep their position in the input, added ones
+are appended and removed ones dropped.
+
+Editing a job that is placed late in a schedule therefore costs little more than the placements after it. A job
+that is ready from the start, e.g. a task without predecessors or an added task without messages, reschedules from
+the beginning, so a task is best added in the same delta as its incoming messages. Removing a task renumbers the
+tasks after it and costs O(V + E) on top of the placements.
+
+Classes:
+- Session: An application and a platform with their incrementally updated schedules.
+"""
+
+__version__ = "1.0.0"
+
+
+import heapq
+import threading
+import uuid
+from array import array
+from bisect import bisect_right, insort
+
+import algorithms as alg
+from model import ApplicationModel, int64, int64_array
+
+## Minimum number of placements between two checkpoints of a schedule
+CHECKPOINT_INTERVAL = 256
+
+## Task fields an update may change, and those the schedules depend on
+TASK_FIELDS = ("wcet", "mcet", "deadline")
+SCHEDULED_FIELDS = ("wcet", "deadline")
+
+## Step of the jobs that are not placed, after any placed job
+UNPLACED = 2 ** 62
+
+## Stands for the edge of a message id that several messages of the application share, deltas can not address it
+_SHARED = object()
+
+
+class _Track:
+    """
+    Schedule of one algorithm in a session, with what is needed to resume its placement.
+
+    The values per job are kept in arrays, which are copied in one go and are not traversed by the garbage collector.
+    """
+
+    __slots__ = ("name", "entries", "log", "step", "state", "checkpoints", "epochs")
+
+    def __init__(self, name, entries, log, step, state, checkpoints, epochs):
+        self.name = name
+        ## Schedule entries, and the task index and step of every placed job
+        self.entries = entries
+        self.log = log
+        self.step = step
+        ## Final scheduler state, its ranking and placement are reused by the next delta
+        self.state = state
+        self.checkpoints = checkpoints
+        ## Number of deltas removing tasks before every checkpoint was taken, its task indices are renumbered by the
+        ## later ones only when it is resumed
+        self.epochs = epochs
+
+
+class Session:
+    """
+    An application and a platform with the schedules of the selected algorithms, updated incrementally by deltas.
+
+    Task and message ids are unique within a session, and every message connects two of its tasks.
+
+    Attributes:
+        id (str): Unique id of the session.
+        model (ApplicationModel): The current application.
+        platform (PlatformModel): The platform of the multi-node schedules.
+        communication (bool): Whether the multi-node schedules account for the messages between nodes.
+        selected (dict): Algorithm name by schedule key.
+        lock (threading.Lock): To be held while the session is read or edited.
+    """
+
+    def __init__(self, application_data, platform, selected, communication=False, interval=CHECKPOINT_INTERVAL):
+        """
+        Compile the application and calculate its schedules.
+
+        Args:
+            application_data (dict): The application section of a valid request.
+            platform (PlatformModel): Compiled platform.
+            selected (dict): Algorithm name by schedule key.
+            communication (bool): Make the multi-node schedules account for the messages between nodes.
+            interval (int): Minimum number of placements between two checkpoints of a schedule.
+
+        Raises:
+            ValueError: If a task id is not unique, a message does not connect two tasks, a value is not a 64-bit
+                        integer or the application can not be scheduled on the platform.
+        """
+        self.id = uuid.uuid4().hex
+        self.platform = platform
+        self.communication = communication
+        self.selected = dict(selected)
+        self.interval = interval
+        self.lock = threading.Lock()
+
+        tasks = application_data["tasks"]
+        ids = [task["id"] for task in tasks]
+        index = {task_id: i for i, task_id in enumerate(ids)}
+        if len(index) < len(ids):
+            raise ValueError("Task ids must be unique within a session.")
+        ## Edge, sender id and receiver id of every message by its id, and the message id of every edge ever added.
+        ## Messages may share an id as in /schedule_jobs, such an id maps to _SHARED and can not be edited.
+        self._messages = {}
+        self._edge_messages = []
+        ## Sorted indices of the removed tasks of every delta that removed tasks
+        self._removals = []
+        senders, receivers, size = array("q"), array("q"), array("q")
+        for message in application_data.get("messages", []):
+            _check_message(message, index, False)
+            self._messages[message["id"]] = _SHARED if message["id"] in self._messages else \
+                (len(size), message["sender"], message["receiver"])
+            self._edge_messages.append(message["id"])
+            senders.append(index[message["sender"]])
+            receivers.append(index[message["receiver"]])
+            size.append(int64(message["size"], "Message size"))
+        self.model = ApplicationModel(
+            ids, *(int64_array([task[field] for task in tasks], f"Task {field}") for field in TASK_FIELDS),
+            senders, receivers, size, (), index)
+
+        ## Priority keys of the current application by priority function
+        self._keys = {}
+        for name in self.selected.values():
+            priority = alg.ALGORITHMS[name].priority
+            if priority not in self._keys:
+                self._keys[priority] = priority(self.model)
+        self._tracks = {key: self._schedule(name, self.model, None, (), self._keys)[0]
+                        for key, name in self.selected.items()}
+
+    def schedules(self):
+        """
+        Return the current schedules.
+
+        Returns:
+            dict: The result of every algorithm by its schedule key, as in the /schedule_jobs response.
+        """
+        return {key: {"schedule": list(track.entries), "name": track.name} for key, track in self._tracks.items()}
+
+    def nbytes(self):
+        """Estimate the memory held by the session in bytes."""
+        return len(self.model) * (128 + 512 * len(self._tracks)) + len(self._messages) * 128
+
+    def apply(self, changes):
+        """
+        Apply a delta and reschedule what it affects. The delta is applied as a whole or not at all.
+
+        Every change is a dict with an "op" of "add", "update" or "remove" and either a "task" or a "message" as in
+        the application section of a request. An update carries the id and the fields to change: the "wcet", "mcet"
+        and "deadline" of a task or the "size" of a message. A removal only needs the id, removing a task also
+        removes its messages.
+
+        Args:
+            changes (list of dict): The changes, applied in order.
+
+        Raises:
+            ValueError: If a change is malformed, refers to an unknown id or sets a value that is not a 64-bit
+                        integer, or if the edited application can not be scheduled, e.g. because an added message
+                        closes a cycle.
+
+        Returns:
+            dict: For every schedule key, the "name" of the algorithm, the "length" of the new schedule, the index
+                  "from" which its entries differ from the previous schedule and those "entries". The new schedule
+                  is the previous one cut at "from" and extended by "entries".
+        """
+        delta = _Delta(self)
+        for change in changes:
+            delta.apply(change)
+        model = delta.model
+        keys = delta.keys(self._keys)
+
+        ## Resized messages only delay jobs across nodes
+        resized = delta.resized if self.communication else set()
+        tracks, replaced = {}, {}
+        try:
+            for key, name in self.selected.items():
+                touched = delta.touched | resized if alg.ALGORITHMS[name].multinode else delta.touched
+                tracks[key], *replaced[key] = self._schedule(name, model, self._tracks[key], touched, keys, delta)
+        except BaseException:
+            for key, (kept, tail) in replaced.items():
+                _restore(self._tracks[key], tracks[key], kept, tail)
+            raise
+
+        result = {}
+        for key, track in tracks.items():
+            kept, tail = replaced[key]
+            new = track.entries
+            start = min(kept + len(tail), len(new))
+            for position in range(kept, start):
+                if tail[position - kept] != new[position]:
+                    start = position
+                    break
+            result[key] = {"name": track.name, "length": len(new), "from": start, "entries": new[start:]}
+
+        delta.commit(self)
+        if delta.removed:
+            self._removals.append(delta.removed)
+        self.model = model
+        self._keys = keys
+        self._tracks = tracks
+        return result
+
+    def _schedule(self, name, model, track, touched, keys, delta=None):
+        """
+        Calculate a schedule of the model, resuming the placement of the previous schedule where possible.
+
+        Resuming takes over the entry list of the previous schedule, its entries after the resumed checkpoint are
+        returned to restore it, see ``_restore``.
+
+        Args:
+            name (str): Name of the algorithm.
+            model (ApplicationModel): The application to schedule.
+            track (_Track): The previous schedule, calculated from scratch if None.
+            touched (set): Ids of the tasks that may be placed differently, see the module docstring.
+            keys (dict): Priority keys of the model by priority function.
+            delta (_Delta): The changes of the model, to map the task indices of the previous schedule.
+
+        Raises:
+            ValueError: If the application can not be scheduled on the platform.
+
+        Returns:
+            tuple: The new schedule, the number of entries kept from the previous schedule and its entries after
+                   them.
+        """
+        algorithm = alg.ALGORITHMS[name]
+        platform = self.platform if algorithm.multinode else None
+        communication = self.communication and algorithm.communication_aware
+        priority_keys = keys[algorithm.priority]
+        removals = self._removals + [delta.removed] if delta is not None and delta.removed else self._removals
+
+        position = -1
+        if track is not None:
+            first = _first_affected(self.model, model, track.step, touched)
+            position = bisect_right([c.placed for c in track.checkpoints], first - 1) - 1
+
+        if position < 0:
+            state = alg.start_schedule(model, lambda _: priority_keys, platform)
+            entries, log, step, checkpoints, epochs = [], array("q"), array("q", [UNPLACED]) * len(model), [], []
+            kept, tail = 0, track.entries if track is not None else []
+        else:
+            state, log, step = _resume(self.model, model, track, position, priority_keys, touched, delta, removals)
+            checkpoints, epochs = track.checkpoints[:position], track.epochs[:position]
+            entries, kept = track.entries, track.checkpoints[position].placed
+            tail = entries[kept:]
+            del entries[kept:]
+
+        index = model.index
+        new = _Track(algorithm.name, entries, log, step, state, checkpoints, epochs)
+        try:
+            for entry in alg.place_jobs(model, state, platform, algorithm.sweep, communication, checkpoints,
+                                        self.interval):
+                i = index[entry["task_id"]]
+                step[i] = len(entries)
+                log.append(i)
+                entries.append(entry)
+        except BaseException:
+            if track is not None:
+                _restore(track, new, kept, tail)
+            raise
+        epochs.extend([len(removals)] * (len(checkpoints) - len(epochs)))
+        if position < 0:
+            for field in ("order", "rank", "end_times", "placed_on"):
+                setattr(state, field, array("q", getattr(state, field)))
+        return new, kept, tail
+
+
+def _restore(track, new, kept, tail):
+    """Give the previous schedule its entries back after its placement was resumed by ``new``."""
+    if new.entries is track.entries:
+        del track.entries[kept:]
+        track.entries.extend(tail)
+
+
+def _check_message(message, index, known):
+    """
+    Check a message to add.
+
+    Args:
+        message (dict): The message.
+        index (dict): Task index for every task id.
+        known (bool): Whether the id of the message is in use.
+
+    Raises:
+        ValueError: If the id of the message is in use or it does not connect two tasks.
+    """
+    if known:
+        raise ValueError(f"Message id {message['id']} is not unique.")
+    if message["sender"] not in index or message["receiver"] not in index:
+        raise ValueError(f"Message {message['id']} does not connect two tasks of the session.")
+
+
+class _Tasks:
+    """Per-task values of some tasks of a model, to compute their priority keys alone."""
+
+    __slots__ = ("ids", "wcet", "mcet", "deadline")
+
+    def __init__(self, model, indices):
+        self.ids = [model.ids[i] for i in indices]
+        self.wcet = [model.wcet[i] for i in indices]
+        self.mcet = [model.mcet[i] for i in indices]
+        self.deadline = [model.deadline[i] for i in indices]
+
+
+class _Delta:
+    """
+    The changes of one delta, applied to a copy of the application of a session.
+
+    The per-task arrays and the graph are copied, the messages are looked up in the session and only the changed
+    ones are held here until ``commit``.
+
+    Attributes:
+        model (ApplicationModel): The edited application.
+        touched (set): Ids of the tasks whose values or incoming messages changed.
+        resized (set): Ids of the tasks receiving a message whose size changed.
+        removed (list of int): Sorted indices of the removed tasks in the application before the edit.
+    """
+
+    def __init__(self, session):
+        old = session.model
+        self.model = ApplicationModel.from_graph(
+            list(old.ids), array("q", old.wcet), array("q", old.mcet), array("q", old.deadline), old.graph.copy(),
+            array("q", old.size), (), dict(old.index))
+        self.touched = set()
+        self.resized = set()
+        self.removed = []
+        self._tasks = len(old)
+        self._index = old.index
+        ## Ids of the tasks added by this delta, to tell them from the tasks of the session with the same id
+        self._new_ids = set()
+        self._messages = session._messages
+        self._edge_messages = session._edge_messages
+        ## Edited messages by id, None for removed ones, and the message ids of the added edges
+        self._changed = {}
+        self._added = []
+
+    def apply(self, change):
+        """Apply one change, see ``Session.apply``."""
+        op = change.get("op")
+        if op not in ("add", "update", "remove") or ("task" in change) == ("message" in change):
+            raise ValueError("A change needs an op of add, update or remove and either a task or a message.")
+        if "task" in change:
+            getattr(self, f"_{op}_task")(change["task"])
+        else:
+            getattr(self, f"_{op}_message")(change["message"])
+
+    def keys(self, keys):
+        """
+        Compute the priority keys of the edited application.
+
+        Args:
+            keys (dict): Priority keys of the application before the edit by priority function.
+
+        Returns:
+            dict: Priority keys of the edited application by priority function.
+        """
+        model = self.model
+        changed = sorted({model.index[task_id] for task_id in self.touched if task_id in model.index})
+        result = {}
+        for priority, previous in keys.items():
+            updated = previous[:]
+            for i in reversed(self.removed):
+                del updated[i]
+            ## Priority functions only read the per-task values, so the changed keys are computed alone
+            for i, key in zip(changed, priority(_Tasks(model, changed))):
+                if i < len(updated):
+                    updated[i] = key
+                else:
+                    updated.append(key)
+            result[priority] = updated
+        return result
+
+    def renumbering(self):
+        """
+        Map the task indices before the edit to those after it.
+
+        Returns:
+            array: The new index of every task index before the edit, -1 for removed tasks.
+        """
+        mapping = array("q")
+        start = 0
+        for count, i in enumerate(self.removed):
+            mapping.extend(range(start - count, i - count))
+            mapping.append(-1)
+            start = i + 1
+        mapping.extend(range(start - len(self.removed), self._tasks - len(self.removed)))
+        return mapping
+
+    def commit(self, session):
+        """Store the edited messages in the session."""
+        for message_id, message in self._changed.items():
+            if message is None:
+                session._messages.pop(message_id, None)
+            else:
+                session._messages[message_id] = message
+        session._edge_messages.extend(self._added)
+
+    def _add_task(self, task):
+        missing = [field for field in TASK_FIELDS if field not in task]
+        if missing:
+            raise ValueError(f"Task {task['id']} is missing {', '.join(missing)}.")
+        model = self.model
+        if task["id"] in model.index:
+            raise ValueError(f"Task id {task['id']} is not unique.")
+        values = [int64(task[field], f"Task {field}") for field in TASK_FIELDS]
+        model.index[task["id"]] = model.graph.add_vertex()
+        model.ids.append(task["id"])
+        for field, value in zip(TASK_FIELDS, values):
+            getattr(model, field).append(value)
+        self.touched.add(task["id"])
+        self._new_ids.add(task["id"])
+
+    def _update_task(self, task):
+        i = self._task(task["id"])
+        values = {field: int64(task[field], f"Task {field}") for field in TASK_FIELDS if field in task}
+        for field, value in values.items():
+            getattr(self.model, field)[i] = value
+        if any(field in task for field in SCHEDULED_FIELDS):
+            self.touched.add(task["id"])
+
+    def _remove_task(self, task):
+        model = self.model
+        i = self._task(task["id"])
+        self.touched.update(model.ids[s] for s in model.graph.successors(i))
+        for edge in model.graph.remove_vertex(i):
+            message_id = self._edge_message(edge)
+            if self._lookup(message_id) is not _SHARED:
+                self._changed[message_id] = None
+        del model.ids[i]
+        for field in TASK_FIELDS:
+            del getattr(model, field)[i]
+        model.index = {task_id: k for k, task_id in enumerate(model.ids)}
+        self.touched.add(task["id"])
+        if task["id"] in self._new_ids:
+            self._new_ids.discard(task["id"])
+        else:
+            insort(self.removed, self._index[task["id"]])
+
+    def _add_message(self, message):
+        missing = [field for field in ("sender", "receiver", "size") if field not in message]
+        if missing:
+            raise ValueError(f"Message {message['id']} is missing {', '.join(missing)}.")
+        model = self.model
+        _check_message(message, model.index, self._lookup(message["id"]) is not None)
+        size = int64(message["size"], "Message size")
+        edge = len(model.size)
+        model.graph.add_edge(model.index[message["sender"]], model.index[message["receiver"]], edge)
+        model.size.append(size)
+        self._changed[message["id"]] = (edge, message["sender"], message["receiver"])
+        self._added.append(message["id"])
+        self.touched.add(message["receiver"])
+
+    def _update_message(self, message):
+        edge, _, receiver = self._message(message["id"])
+        if "size" in message:
+            self.model.size[edge] = int64(message["size"], "Message size")
+            self.resized.add(receiver)
+
+    def _remove_message(self, message):
+        model = self.model
+        edge, sender, receiver = self._message(message["id"])
+        model.graph.remove_edge(model.index[sender], model.index[receiver], edge)
+        self._changed[message["id"]] = None
+        self.touched.add(receiver)
+
+    def _task(self, task_id):
+        i = self.model.index.get(task_id)
+        if i is None:
+            raise ValueError(f"Unknown task {task_id}.")
+        return i
+
+    def _lookup(self, message_id):
+        if message_id in self._changed:
+            return self._changed[message_id]
+        return self._messages.get(message_id)
+
+    def _message(self, message_id):
+        message = self._lookup(message_id)
+        if message is None:
+            raise ValueError(f"Unknown message {message_id}.")
+        if message is _SHARED:
+            raise ValueError(f"Message id {message_id} is shared by several messages and can not be edited.")
+        return message
+
+    def _edge_message(self, edge):
+        count = len(self._edge_messages)
+        return self._edge_messages[edge] if edge < count else self._added[edge - count]
+
+
+def _first_affected(old, new, step, touched):
+    """
+    Find the first placement of a schedule that the touched jobs can change.
+
+    A job can only change the placement from the step at which it becomes ready, the step after its last
+    predecessor was placed, before or after the edit. Predecessors that were not placed before are placed after
+    every job that is placed the same way, so they count as placed last.
+
+    Args:
+        old (ApplicationModel): The application before the edit.
+        new (ApplicationModel): The application after the edit.
+        step (array): Step of every task index of ``old`` in the previous schedule.
+        touched (set): Ids of the touched tasks.
+
+    Returns:
+        int: The number of placements that are kept at most, the length of the previous schedule if no job is
+             touched.
+    """
+    first = len(old)
+    for model in (old, new):
+        graph = model.graph
+        for task_id in touched:
+            i = model.index.get(task_id)
+            if i is None:
+                continue
+            ready = 0
+            for p in graph.predecessors(i):
+                if model is old:
+                    placed = step[p]
+                else:
+                    previous = old.index.get(model.ids[p])
+                    placed = step[previous] if previous is not None else UNPLACED
+                ready = max(ready, placed + 1)
+            first = min(first, ready)
+    return first
+
+
+def _resume(old, new, track, position, keys, touched, delta, removals):
+    """
+    Rebuild the scheduler state of the new application before the placement of a checkpoint of the previous schedule.
+
+    The jobs placed before the checkpoint keep their placement and step, the ready jobs of the checkpoint are ranked
+    by the new priority keys and the unplaced predecessors of the other jobs are counted in the new application.
+    Removed tasks are dropped from the previous schedule first, moving the task indices after them down, so that
+    the remaining tasks have the indices they have in the new application and the added tasks follow them. The
+    ready jobs of the checkpoint are renumbered by every removal since it was taken.
+
+    Args:
+        old (ApplicationModel): The application before the edit.
+        new (ApplicationModel): The application after the edit.
+        track (_Track): The previous schedule.
+        position (int): Position of the checkpoint to resume from in the checkpoints of ``track``.
+        keys (sequence): Priority key of every task index of ``new``.
+        touched (set): Ids of the touched tasks, the only ones whose priority key may have changed.
+        delta (_Delta): The changes of the application.
+        removals (list of list): Sorted indices of the removed tasks of every delta that removed tasks, this one
+                                 included.
+
+    Returns:
+        tuple: The ScheduleState and the task index and step of the placed jobs.
+    """
+    checkpoint = track.checkpoints[position]
+    placed = checkpoint.placed
+    previous = track.state
+    end_times, placed_on, step = previous.end_times[:], previous.placed_on[:], track.step[:]
+    log, order, rank = track.log, previous.order, previous.rank
+    ready_jobs, next_sweep_jobs = checkpoint.ready, checkpoint.next_sweep
+    for removed in removals[track.epochs[position]:]:
+        ## The removed tasks were not ready yet at a checkpoint that is still resumed
+        ready_jobs = [k - bisect_right(removed, k) for k in ready_jobs]
+        next_sweep_jobs = [k - bisect_right(removed, k) for k in next_sweep_jobs]
+    if delta.removed:
+        mapping = delta.renumbering()
+
+        def renumber(indices):
+            return array("q", [k for k in map(mapping.__getitem__, indices) if k >= 0])
+
+        for i in reversed(delta.removed):
+            del end_times[i], placed_on[i], step[i]
+        log, order = renumber(log), renumber(order)
+        rank = array("q", bytes(8 * len(order)))
+        for r, i in enumerate(order):
+            rank[i] = r
+
+    ## The remaining tasks keep their indices, the added tasks follow them
+    n, remaining = len(new), len(step)
+    zeros = array("q", bytes(8 * (n - remaining)))
+    end_times.extend(zeros)
+    placed_on.extend(zeros)
+    step.extend(array("q", [UNPLACED]) * (n - remaining))
+    moved = {new.index[task_id] for task_id in touched if task_id in new.index} | set(range(remaining, n))
+    order, rank = _rerank(order, rank, n, keys, moved)
+
+    graph = new.graph
+    unplaced = [*log[placed:], *range(remaining, n)]
+    unscheduled = array("q", bytes(8 * n))
+    for k in unplaced:
+        step[k] = UNPLACED
+    for k in unplaced:
+        unscheduled[k] = sum(1 for p in graph.predecessors(k) if step[p] == UNPLACED)
+
+    def heap(jobs):
+        ranks = [rank[i] for i in jobs]
+        heapq.heapify(ranks)
+        return ranks
+
+    available = checkpoint.available.copy() if checkpoint.available is not None else None
+    state = alg.ScheduleState(order, rank, unscheduled, heap(ready_jobs), heap(next_sweep_jobs), available,
+                              end_times, placed_on, placed)
+    return state, log[:placed], step
+
+
+def _rerank(order, rank, size, keys, moved):
+    """
+    Rank the jobs by their new priority keys, as ``algorithms.rank_jobs`` does.
+
+    The jobs whose key may have changed and the added jobs are moved into the previous ranking by binary search.
+    Only the ranks between the first and the last moved position are updated, up to the end if jobs were added.
+
+    Args:
+        order (array): Task index of every rank in the previous ranking.
+        rank (array): Rank of every task index in the previous ranking.
+        size (int): Number of jobs, the jobs from ``len(order)`` on are added.
+        keys (sequence): Priority key of every task index.
+        moved (set of int): Task indices of the jobs to rank again.
+
+    Returns:
+        tuple: The task index of every rank and the rank of every task index.
+    """
+    added = size > len(order)
+    order = array("q", order)
+    rank = rank + array("q", bytes(8 * (size - len(rank))))
+    removed = sorted((rank[i] for i in moved if i < len(order)), reverse=True)
+    for position in removed:
+        del order[position]
+    lowest = removed[-1] if removed else len(order)
+    highest = removed[0] if removed else 0
+    for i in sorted(moved):
+        ## Ties keep the input order, as in the stable sort of ``rank_jobs``
+        key, low, high = keys[i], 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            j = order[middle]
+            if keys[j] < key or (keys[j] == key and j < i):
+                low = middle + 1
+            else:
+                high = middle
+        order.insert(low, i)
+        lowest, highest = min(lowest, low), max(highest, low)
+    ## A position after every removed and inserted job holds the same job as before, unless jobs were added
+    highest = len(order) - 1 if added else min(len(order) - 1, highest + len(moved))
+    for position in range(lowest, highest + 1):
+        rank[order[position]] = position
+    return order, rank
@@ -0,0 +1,254 @@
+"""
+This module simulates preemptive scheduling policies on periodic task sets, as a discrete-event simulation.
+
+The schedulers of ``algorithms`` place every task once and never interrupt it. Here every task is periodic instead:
+its deadline is taken as its period and relative deadline, so task ``i`` releases a job at every multiple of its
+period until the end of the horizon, the hyperperiod of all periods by default, and each job has to run for the WCET
+of its task before the next release. All tasks release their first job at time 0. Messages are not modelled, the
+tasks are independent as in the classic analyses of these policies.
+
+The simulation only advances from event to event: job releases, job completions and, for Least Laxity, the points
+at which a waiting job's laxity drops below that of a running job. The events are kept in one heap, and at every
+event time the jobs with the best priorities run on the compute nodes, preempting running jobs with worse
+priorities. A job that keeps running keeps its node, a job that starts takes the free node with the lowest position,
+so a preempted job may resume on another node. The cost grows with the number of events, O((J + P) log J) for J jobs
+and P preemptions on a few nodes, and not with the length of the horizon.
+
+Policies:
+- EDF: the job with the earliest absolute deadline first.
+- RMS: the job of the task with the shortest period first, a fixed priority per task.
+- LL: the job with the least laxity first, the time left until its deadline minus its remaining execution time.
+
+Ties go to the running job, then to the task that comes first in the input and its earlier job. Jobs that miss their
+deadline keep running until they are done. Every stretch of time a job runs on a node becomes one schedule entry as
+defined by output_schema.json, with the absolute deadline of the job, so a preempted job has several entries. The
+entries are yielded in the order the stretches end.
+
+Classes:
+- Simulation: Display name, policy and platform of a registered simulation.
+
+Functions:
+- hyperperiod: Least common multiple of the periods of an application.
+- simulate: Yields the schedule entries of a policy on an application.
+- run_simulation: Runs a registered simulation by name.
+"""
+
+__version__ = "1.0.0"
+
+
+import heapq
+import math
+from collections import namedtuple
+from itertools import count
+
+from model import compile_application
+from topology import compile_platform
+
+EDF = "edf"
+RMS = "rms"
+LL = "ll"
+POLICIES = (EDF, RMS, LL)
+
+## Upper bound of the jobs a simulation releases, hyperperiods of unrelated periods grow fast
+MAX_JOBS = 1000000
+
+## Kinds of events, completions at a time are handled before the releases to free their nodes
+_COMPLETE, _RELEASE, _LAXITY = 0, 1, 2
+
+
+## A registered simulation: its display name, the policy and whether it runs on the compute nodes of the platform
+## or on a single node
+Simulation = namedtuple("Simulation", ["name", "policy", "multinode"])
+
+## Registry of the simulations by name
+SIMULATIONS = {
+    "edf_preemptive_single_node": Simulation("Preemptive EDF Single Node", EDF, False),
+    "rms_preemptive_single_node": Simulation("Preemptive RMS Single Node", RMS, False),
+    "ll_preemptive_single_node": Simulation("Preemptive LL Single Node", LL, False),
+    "edf_preemptive_multinode": Simulation("Preemptive EDF Multi Node", EDF, True),
+    "rms_preemptive_multinode": Simulation("Preemptive RMS Multi Node", RMS, True),
+    "ll_preemptive_multinode": Simulation("Preemptive LL Multi Node", LL, True),
+}
+
+
+class _Job:
+    """A released job, with the remaining execution time it had when its current stretch on a node started."""
+
+    __slots__ = ("task", "release", "deadline", "remaining", "node", "start", "version")
+
+    def __init__(self, task, release, deadline, remaining):
+        self.task = task
+        self.release = release
+        self.deadline = deadline
+        self.remaining = remaining
+        self.node = None
+        self.start = None
+        ## Incremented whenever the job starts or stops running, to discard the completion events of earlier stretches
+        self.version = 0
+
+
+def hyperperiod(model):
+    """
+    Compute the hyperperiod of an application, after which the releases of all tasks repeat.
+
+    Args:
+        model (ApplicationModel): The compiled application.
+
+    Raises:
+        ValueError: If a task has no positive deadline to take as its period.
+
+    Returns:
+        int: The least common multiple of the periods, 0 without tasks.
+    """
+    for i, period in enumerate(model.deadline):
+        if period <= 0:
+            raise ValueError(f"Task {model.ids[i]} needs a positive deadline to be simulated as its period.")
+    return math.lcm(*model.deadline) if len(model) else 0
+
+
+def simulate(model, policy, platform=None, horizon=None, max_jobs=MAX_JOBS):
+    """
+    Simulate a preemptive policy on the periodic jobs of an application, see the module docstring.
+
+    The input is checked when the function is called, so invalid input is reported before the first entry.
+
+    Args:
+        model (ApplicationModel): The compiled application.
+        policy (str): One of EDF, RMS or LL.
+        platform (PlatformModel, optional): The jobs run on its compute nodes, on node 0 alone if omitted.
+        horizon (int, optional): Jobs are released before this time, the hyperperiod if omitted.
+        max_jobs (int, optional): Upper bound of the released jobs, unbounded if None.
+
+    Raises:
+        ValueError: If the policy is unknown, a task has no positive deadline, the platform has no compute nodes
+                    or more than ``max_jobs`` jobs would be released.
+
+    Returns:
+        iterator of dict: The schedule entries, in the order the stretches of the jobs end.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy}, expected one of {', '.join(POLICIES)}.")
+    if horizon is None:
+        horizon = hyperperiod(model)
+    else:
+        hyperperiod(model)
+    jobs = sum(-(-horizon // period) for period in model.deadline)
+    if max_jobs is not None and jobs > max_jobs:
+        raise ValueError(f"The simulation would release {jobs} jobs over {horizon} time units, more than "
+                         f"{max_jobs}. Choose a shorter horizon.")
+    if platform is None:
+        node_ids = [0]
+    elif len(platform.compute):
+        node_ids = [platform.node_ids[k] for k in platform.compute]
+    else:
+        raise ValueError("The platform has no compute nodes to schedule the jobs on.")
+    return _run(model, policy, node_ids, horizon)
+
+
+def _run(model, policy, node_ids, horizon):
+    """Run the event loop of ``simulate``."""
+    ids, wcet, periods = model.ids, model.wcet, model.deadline
+    sequence = count()
+    events = [(0, _RELEASE, next(sequence), i) for i in range(len(ids))] if horizon > 0 else []
+    ## Waiting jobs by their priority key while waiting, the task and the release of the job break ties
+    ready = []
+    running = [None] * len(node_ids)
+    laxity_version = 0
+
+    if policy == EDF:
+        def waiting_key(job):
+            return job.deadline
+        running_key = waiting_key
+    elif policy == RMS:
+        def waiting_key(job):
+            return periods[job.task]
+        running_key = waiting_key
+    else:
+        ## The laxity of all jobs at a time is their deadline minus their remaining execution time minus the time,
+        ## so the jobs are compared by the first two. It is fixed while a job waits and grows while it runs.
+        def waiting_key(job):
+            return job.deadline - job.remaining
+
+        def running_key(job):
+            return job.deadline - job.remaining + now - job.start
+
+    def stretch(job, end):
+        return {"task_id": ids[job.task], "node_id": node_ids[job.node], "start_time": job.start, "end_time": end,
+                "deadline": job.deadline}
+
+    while events:
+        now = events[0][0]
+        changed = False
+        while events and events[0][0] == now:
+            _, kind, _, payload = heapq.heappop(events)
+            if kind == _COMPLETE:
+                job, version = payload
+                if job.version == version:
+                    running[job.node] = None
+                    changed = True
+                    yield stretch(job, now)
+            elif kind == _RELEASE:
+                release = now + periods[payload]
+                if release < horizon:
+                    heapq.heappush(events, (release, _RELEASE, next(sequence), payload))
+                job = _Job(payload, now, release, wcet[payload])
+                heapq.heappush(ready, (waiting_key(job), payload, now, job))
+                changed = True
+            else:
+                changed = changed or payload == laxity_version
+        ## Events of stretches that were cut short change nothing
+        if not changed:
+            continue
+
+        ## The best of the running jobs and as many waiting jobs as there are nodes get the nodes
+        candidates = [(running_key(job), 0, job.task, job.release, job) for job in running if job is not None]
+        candidates.extend((key, 1, task, release, job) for key, task, release, job in
+                          [heapq.heappop(ready) for _ in range(min(len(node_ids), len(ready)))])
+        candidates.sort(key=lambda candidate: candidate[:4])
+        for key, waiting, task, release, job in candidates[len(node_ids):]:
+            if not waiting:
+                running[job.node] = None
+                if now > job.start:
+                    yield stretch(job, now)
+                job.remaining -= now - job.start
+                job.version += 1
+                key = waiting_key(job)
+            heapq.heappush(ready, (key, task, release, job))
+        free = iter([node for node, job in enumerate(running) if job is None])
+        for _, waiting, _, _, job in candidates[:len(node_ids)]:
+            if waiting:
+                job.node = next(free)
+                job.start = now
+                job.version += 1
+                running[job.node] = job
+                heapq.heappush(events, (now + job.remaining, _COMPLETE, next(sequence), (job, job.version)))
+
+        ## Least Laxity preempts once the best waiting job has less laxity than the worst running job
+        if policy == LL and ready and None not in running:
+            laxity_version += 1
+            worst = max(running_key(job) for job in running)
+            heapq.heappush(events, (now + ready[0][0] - worst + 1, _LAXITY, next(sequence), laxity_version))
+
+
+def run_simulation(name, application_data, platform_data=None, horizon=None, max_jobs=MAX_JOBS):
+    """
+    Run a registered simulation.
+
+    Args:
+        name (str): Name of the simulation in ``SIMULATIONS``.
+        application_data (dict or ApplicationModel): The tasks of the application, their deadlines are the periods.
+        platform_data (dict or PlatformModel, optional): The platform, required by multi-node simulations.
+        horizon (int, optional): Jobs are released before this time, the hyperperiod if omitted.
+        max_jobs (int, optional): Upper bound of the released jobs, unbounded if None.
+
+    Raises:
+        KeyError: If no simulation is registered under ``name``.
+        ValueError: If the application can not be simulated, see ``simulate``.
+
+    Returns:
+        dict: The schedule entries of the simulation and its display name, as the result of an algorithm.
+    """
+    simulation = SIMULATIONS[name]
+    platform = compile_platform(platform_data) if simulation.multinode else None
+    entries = simulate(compile_application(application_data), simulation.policy, platform, horizon, max_jobs)
+    return {"schedule": list(entries), "name": simulation.name}
@@ -0,0 +1,209 @@
+"""
+This module compiles the platform model of a scheduling request into a compact, index-based form.
+
+Platform nodes are mapped to dense positions in input order and partitioned by their ``type`` once per request,
+so the schedulers get the positions of the compute nodes directly instead of scanning the platform for every job.
+Routers only forward messages and are never offered for placement. Links are stored as parallel arrays over the
+node positions.
+
+For communication-aware scheduling the platform also answers how long a message takes between two nodes: the
+accumulated ``link_delay`` of the fastest route plus ``size / bandwidth`` over the narrowest link of that route.
+Routes are found with Dijkstra's algorithm the first time a source node is asked for and cached on the model, so
+each source costs O(L log N) once per platform for L links and N nodes.
+
+Classes:
+- PlatformModel: Compiled platform model shared by all multi-node scheduling algorithms.
+
+Functions:
+- compile_platform: Builds a PlatformModel from the platform section of the input.
+"""
+
+__version__ = "1.0.0"
+
+
+import heapq
+from array import array
+
+from model import int64_array
+
+COMPUTE_NODE_TYPE = "compute"
+
+
+class PlatformModel:
+    """
+    Platform model with dense node positions, nodes partitioned by type and parallel link arrays.
+
+    Attributes:
+        node_ids (list): Node id for every node position, in input order.
+        index (dict): Node position for every node id.
+        types (dict): Increasing node positions for every node type.
+        compute (array): Increasing positions of the nodes that can execute jobs.
+        link_start (array): Start node position of every link.
+        link_end (array): End node position of every link.
+        link_delay (array): Delay of every link.
+        link_bandwidth (array): Bandwidth of every link.
+    """
+
+    __slots__ = ("node_ids", "index", "types", "compute",
+                 "link_start", "link_end", "link_delay", "link_bandwidth", "_neighbours", "_routes")
+
+    def __init__(self, node_ids, node_types, link_start, link_end, link_delay, link_bandwidth):
+        """
+        Build the model from the node ids and types and the links as node positions.
+
+        Args:
+            node_ids (list): Node id for every node position.
+            node_types (list of str): Type of every node.
+            link_start (array): Start node position of every link.
+            link_end (array): End node position of every link.
+            link_delay (array): Delay of every link.
+            link_bandwidth (array): Bandwidth of every link.
+        """
+        self.node_ids = node_ids
+        self.index = {node_id: k for k, node_id in enumerate(node_ids)}
+        self.types = {}
+        for k, node_type in enumerate(node_types):
+            self.types.setdefault(node_type, array("q")).append(k)
+        self.compute = self.types.get(COMPUTE_NODE_TYPE, array("q"))
+        self.link_start = link_start
+        self.link_end = link_end
+        self.link_delay = link_delay
+        self.link_bandwidth = link_bandwidth
+        self._neighbours = None
+        self._routes = {}
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def routes_from(self, source):
+        """
+        Find the fastest route from a node to every other node, links being usable in both directions.
+
+        Among routes with the same accumulated delay the one with the widest narrowest link is taken. The result is
+        cached, so every source is only routed once per platform.
+
+        Args:
+            source (int): Position of the source node.
+
+        Returns:
+            tuple: ``(delay, bandwidth)`` lists over the node positions, the accumulated link delay and the narrowest
+                   bandwidth of the route to each node. Unreachable nodes have bandwidth 0.
+        """
+        routes = self._routes.get(source)
+        if routes is not None:
+            return routes
+
+        neighbours = self._neighbours
+        if neighbours is None:
+            # Built completely before publishing it, the model may be shared between requests
+            neighbours = [[] for _ in self.node_ids]
+            for start, end, delay, bandwidth in zip(self.link_start, self.link_end,
+                                                    self.link_delay, self.link_bandwidth):
+                if bandwidth > 0:
+                    neighbours[start].append((end, delay, bandwidth))
+                    neighbours[end].append((start, delay, bandwidth))
+            self._neighbours = neighbours
+
+        delays = [float("inf")] * len(self.node_ids)
+        widths = [0] * len(self.node_ids)
+        delays[source] = 0
+        widths[source] = float("inf")
+        queue = [(0, -widths[source], source)]
+        while queue:
+            delay, width, node = heapq.heappop(queue)
+            if delay > delays[node] or (delay == delays[node] and -width < widths[node]):
+                continue
+            for neighbour, link_delay, bandwidth in neighbours[node]:
+                candidate_delay = delay + link_delay
+                candidate_width = min(-width, bandwidth)
+                if candidate_delay < delays[neighbour] or (
+                        candidate_delay == delays[neighbour] and candidate_width > widths[neighbour]):
+                    delays[neighbour] = candidate_delay
+                    widths[neighbour] = candidate_width
+                    heapq.heappush(queue, (candidate_delay, -candidate_width, neighbour))
+
+        routes = self._routes[source] = (delays, widths)
+        return routes
+
+    def precompute_routes(self):
+        """Route every compute node, e.g. before the model is shipped to processes that can not share the cache."""
+        for source in self.compute:
+            self.routes_from(source)
+
+    def nbytes(self):
+        """
+        Estimate the memory held by the model, e.g. to bound a cache of compiled platforms.
+
+        Routes are filled in lazily, so the estimate reserves room for the routes from every compute node.
+
+        Returns:
+            int: Estimated size in bytes.
+        """
+        arrays = (self.compute, self.link_start, self.link_end, self.link_delay, self.link_bandwidth)
+        nodes = len(self.node_ids)
+        return (sum(a.itemsize * len(a) for a in arrays)
+                + nodes * 128
+                + len(self.link_start) * 2 * 96
+                + len(self.compute) * nodes * 48)
+
+    def transfer_time(self, source, target, size):
+        """
+        Time a message needs from one node to another.
+
+        Args:
+            source (int): Position of the sending node.
+            target (int): Position of the receiving node.
+            size (int): Size of the message.
+
+        Raises:
+            ValueError: If there is no route between the nodes.
+
+        Returns:
+            int: 0 on the same node, otherwise the route delay plus ``size / bandwidth`` rounded up.
+        """
+        if source == target:
+            return 0
+        delays, widths = self.routes_from(source)
+        if not widths[target]:
+            raise ValueError(
+                f"No route between nodes {self.node_ids[source]} and {self.node_ids[target]}.")
+        return delays[target] + -(-size // widths[target])
+
+
+def compile_platform(platform_data):
+    """
+    Compile the platform section of the input into a PlatformModel.
+
+    Args:
+        platform_data (dict or PlatformModel): Contains the nodes and the links between them.
+                                               An already compiled model is returned unchanged.
+
+    Raises:
+        ValueError: If a link refers to a node that is not part of the platform, or its delay or bandwidth is not a
+                    64-bit integer.
+
+    Returns:
+        PlatformModel: The compiled platform model.
+    """
+    if isinstance(platform_data, PlatformModel):
+        return platform_data
+
+    nodes = platform_data['nodes']
+    node_ids = [node['id'] for node in nodes]
+    index = {node_id: k for k, node_id in enumerate(node_ids)}
+
+    links = platform_data.get('links', [])
+    try:
+        link_start = array("q", [index[link['start_node']] for link in links])
+        link_end = array("q", [index[link['end_node']] for link in links])
+    except KeyError as err:
+        raise ValueError(f"Link refers to unknown node {err.args[0]}.") from None
+
+    return PlatformModel(
+        node_ids,
+        [node['type'] for node in nodes],
+        link_start,
+        link_end,
+        int64_array([link['link_delay'] for link in links], "Link link_delay"),
+        int64_array([link['bandwidth'] for link in links], "Link bandwidth"),
+    )
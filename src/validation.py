@@ -0,0 +1,171 @@
+"""
+This module validates the request and response payloads of the scheduling API against their JSON schemas.
+
+Building a jsonschema validator checks the schema itself, so validators are built once when the schema is loaded.
+Large payloads consist of long arrays of flat objects, which makes the generic keyword dispatch of jsonschema the
+dominant cost. The plain structural subset of a schema (``type``, ``properties``, ``required`` and ``items``) is
+therefore also compiled into nested closures that check a payload in one pass. A payload that passes this fast check
+is valid. One that fails it, or a schema using any other keyword, goes through the full jsonschema validator, which
+has the final say and reports the error.
+
+Classes:
+- SchemaValidator: Fast structural check backed by a precompiled jsonschema validator.
+
+Functions:
+- compile_fast_validator: Compiles the structural subset of a schema into a predicate.
+"""
+
+__version__ = "1.0.0"
+
+
+from jsonschema.validators import validator_for
+
+## Keywords the fast validator understands, any other keyword makes it fall back to jsonschema
+_STRUCTURAL_KEYWORDS = {"$schema", "type", "properties", "required", "items", "title", "description"}
+
+## Exact Python types of the decoded JSON values, subclasses and integral floats are left to jsonschema
+_TYPES = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+
+_MISSING = object()
+
+
+def compile_fast_validator(schema):
+    """
+    Compile the structural subset of a JSON schema into a predicate.
+
+    The predicate never accepts a payload the schema rejects, but may reject payloads the schema accepts, for
+    example integers encoded as floats.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        callable: Returns True for payloads that are valid, or None if the schema uses keywords outside the subset.
+    """
+    if not isinstance(schema, dict) or set(schema) - _STRUCTURAL_KEYWORDS:
+        return None
+
+    allowed = None
+    if "type" in schema:
+        names = [schema["type"]] if isinstance(schema["type"], str) else schema["type"]
+        if any(name not in _TYPES for name in names):
+            return None
+        allowed = frozenset(t for name in names for t in _TYPES[name])
+
+    required = tuple(schema.get("required", ()))
+    properties = []
+    for key, subschema in schema.get("properties", {}).items():
+        check = compile_fast_validator(subschema)
+        if check is None:
+            return None
+        properties.append((key, check))
+
+    check_item = None
+    if "items" in schema:
+        check_item = compile_fast_validator(schema["items"])
+        if check_item is None:
+            return None
+
+    if not required and not properties and check_item is None:
+        if allowed is None:
+            return lambda value: True
+        check_type = allowed.__contains__
+        return lambda value: check_type(type(value))
+
+    # Properties that only restrict the type, e.g. the fields of a task, are checked inline
+    flat = [(key, _leaf_types(schema["properties"][key])) for key, _ in properties]
+    if all(types is not None for _, types in flat):
+        def check_fields(value):
+            for key in required:
+                if key not in value:
+                    return False
+            for key, types in flat:
+                item = value.get(key, _MISSING)
+                if item is not _MISSING and type(item) not in types:
+                    return False
+            return True
+    else:
+        def check_fields(value):
+            for key in required:
+                if key not in value:
+                    return False
+            for key, check in properties:
+                item = value.get(key, _MISSING)
+                if item is not _MISSING and not check(item):
+                    return False
+            return True
+
+    def check(value):
+        kind = type(value)
+        if allowed is not None and kind not in allowed:
+            return False
+        if kind is dict and (required or properties):
+            return check_fields(value)
+        if kind is list and check_item is not None:
+            return all(map(check_item, value))
+        if kind is dict or kind is list or allowed is not None:
+            return True
+        # A subclass of dict or list may still be subject to the keywords above, leave it to jsonschema
+        return not isinstance(value, (dict, list))
+
+    return check
+
+
+def _leaf_types(schema):
+    """Return the exact types allowed by a schema that only restricts the type, or None."""
+    if set(schema) - {"type", "title", "description"} or "type" not in schema:
+        return None
+    names = [schema["type"]] if isinstance(schema["type"], str) else schema["type"]
+    return frozenset(t for name in names for t in _TYPES[name])
+
+
+class SchemaValidator:
+    """
+    Validates payloads against a JSON schema, trying the fast structural check before the full validator.
+
+    Attributes:
+        schema (dict): The JSON schema.
+        fast (callable): Compiled structural check, None if the schema is outside the supported subset.
+        full (jsonschema.protocols.Validator): Validator for the draft declared by the schema, built once.
+    """
+
+    def __init__(self, schema):
+        """
+        Check the schema and build both validators.
+
+        Args:
+            schema (dict): The JSON schema.
+
+        Raises:
+            jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+        """
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        self.schema = schema
+        self.full = cls(schema)
+        self.fast = compile_fast_validator(schema)
+
+    def is_valid(self, instance):
+        """Return whether the payload is valid."""
+        if self.fast is not None and self.fast(instance):
+            return True
+        return self.full.is_valid(instance)
+
+    def validate(self, instance):
+        """
+        Validate a payload.
+
+        Raises:
+            jsonschema.exceptions.ValidationError: If the payload is invalid.
+        """
+        if self.fast is not None and self.fast(instance):
+            return
+        self.full.validate(instance)
@@ -0,0 +1,97 @@
+import os
+import random
+import sys
+
+import pytest
+
+# Adjust path to include the 'src' directory for importing the analysis
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+import analysis
+from model import compile_application
+from topology import compile_platform
+
+platform = compile_platform({
+    "nodes": [{"id": 0, "type": "compute"}, {"id": 1, "type": "compute"}, {"id": 2, "type": "router"}],
+    "links": [],
+})
+
+## a -> c, b -> c, c -> d with the deadline of c out of reach of the chain a -> c
+application = {
+    "tasks": [
+        {"id": "a", "wcet": 10, "mcet": 5, "deadline": 100},
+        {"id": "b", "wcet": 30, "mcet": 5, "deadline": 100},
+        {"id": "c", "wcet": 20, "mcet": 5, "deadline": 45},
+        {"id": "d", "wcet": 5, "mcet": 5, "deadline": 100},
+    ],
+    "messages": [
+        {"id": 0, "sender": "a", "receiver": "c", "size": 1},
+        {"id": 1, "sender": "b", "receiver": "c", "size": 1},
+        {"id": 2, "sender": "c", "receiver": "d", "size": 1},
+    ],
+}
+
+
+@pytest.fixture(params=["numpy", "python"])
+def sweep(request, monkeypatch):
+    """Run a test with the NumPy sweep and with the sequential sweep."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(analysis, "MIN_LEVEL_WIDTH", 1)
+    else:
+        monkeypatch.setattr(analysis, "np", None)
+    return request.param
+
+
+def test_critical_times(sweep):
+    """Test the ASAP and ALAP starts, the slack and the infeasibility of a missed deadline."""
+    report = analysis.analyze(compile_application(application), platform, tasks=True)
+    assert report["asap"] == [0, 0, 30, 50]
+    assert report["alap"] == [15, -5, 25, 95]
+    assert report["slack"] == [15, -5, -5, 45]
+    assert report["critical_path"] == 55 and report["work"] == 65 and report["horizon"] == 100
+    assert report["late_tasks"] == 2 and report["least_slack"] == {"task_id": "b", "slack": -5}
+    assert report["multi_node"]["infeasible"] and report["compute_nodes"] == 2
+    assert report["single_node"]["reasons"][0].startswith("2 tasks can not meet their deadlines")
+
+
+def test_load(sweep):
+    """Test that the peak load rules out a single compute node but not two, and never the single-node schedules."""
+    relaxed = dict(application, tasks=[dict(task, deadline=60) for task in application["tasks"]])
+    report = analysis.analyze(compile_application(relaxed), platform)
+    assert report["late_tasks"] == 0 and report["utilization"] == pytest.approx(65 / 60)
+    assert report["single_node"] == {"infeasible": False, "reasons": []}
+    assert report["multi_node"] == {"infeasible": False, "reasons": []}
+    one_node = compile_platform({"nodes": [{"id": 0, "type": "compute"}], "links": []})
+    assert analysis.analyze(compile_application(relaxed), one_node)["multi_node"] == {
+        "infeasible": True, "reasons": ["The peak load of 1.08 exceeds the 1 available node."]}
+
+
+def test_overlapping_single_node(sweep):
+    """Test that independent jobs overlapping on the single node are not ruled out by their load."""
+    tasks = {"tasks": [{"id": i, "wcet": 10, "mcet": 5, "deadline": 15} for i in range(2)], "messages": []}
+    report = analysis.analyze(compile_application(tasks), platform)
+    assert report["peak_load"] == pytest.approx(20 / 15)
+    assert report["single_node"] == {"infeasible": False, "reasons": []}
+
+
+def test_cycle(sweep):
+    """Test that a cycle is reported as an error."""
+    cyclic = dict(application, messages=application["messages"] + [{"id": 3, "sender": "d", "receiver": "a",
+                                                                     "size": 1}])
+    with pytest.raises(ValueError, match="Cyclic dependency detected at job a"):
+        analysis.analyze(compile_application(cyclic))
+
+
+def test_sweeps_agree(monkeypatch):
+    """Test that the level-synchronous sweep matches the sequential one on a random graph."""
+    np = pytest.importorskip("numpy")
+    rng = random.Random(1)
+    tasks = [{"id": i, "wcet": rng.randint(1, 20), "mcet": 1, "deadline": rng.randint(10, 400)} for i in range(500)]
+    messages = [{"id": k, "sender": rng.randrange(receiver), "receiver": receiver, "size": 1}
+                for k, receiver in enumerate(rng.choices(range(1, 500), k=1500))]
+    model = compile_application({"tasks": tasks, "messages": messages})
+    monkeypatch.setattr(analysis, "MIN_LEVEL_WIDTH", 1)
+    asap, alap = analysis._sweep_levels(model)
+    expected = analysis._sweep_tasks(model)
+    assert np.array_equal(asap, expected[0]) and np.array_equal(alap, expected[1])
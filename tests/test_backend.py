@@ -0,0 +1,402 @@
+import pytest
+import os
+import json
+import logging
+import sys
+import time
+
+# Adjust path to include the 'src' directory for importing the backend
+script_dir = os.path.dirname(__file__)
+input_models_dir = os.path.join(script_dir, "input_models")
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from fastapi.testclient import TestClient
+import backend
+from jobs import JobQueue
+
+
+client = TestClient(backend.app)
+
+
+def load_model(filename):
+    with open(os.path.join(input_models_dir, filename)) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+def test_schedule_jobs(filename):
+    """Test that all five schedules are returned for the example models."""
+    response = client.post("/schedule_jobs", json=load_model(filename))
+    assert response.status_code == 200
+    assert sorted(response.json()) == [f"schedule{i}" for i in range(1, 6)]
+
+
+def test_algorithm_selection():
+    """Test that only the requested algorithms are run, keeping their schedule keys."""
+    model = load_model("example1.json")
+    response = client.post("/schedule_jobs?algorithms=ll_multinode,edf_single_node", json=model)
+    assert response.status_code == 200
+    assert sorted(response.json()) == ["schedule2", "schedule3"]
+    assert response.json()["schedule3"]["name"] == "LL Multi Node"
+    response = client.post("/schedule_jobs?algorithms=rms_multinode", json=model)
+    assert response.status_code == 400
+
+
+def test_platform_cache():
+    """Test that a repeated platform is compiled once and counted as a cache hit."""
+    backend.platform_cache.clear()
+    backend.result_cache.clear()
+    before = backend.platform_cache.stats()
+    model = load_model("example2.json")
+    for communication in ["false", "true"]:
+        response = client.post(f"/schedule_jobs?communication={communication}", json=model)
+        assert response.status_code == 200
+    stats = client.get("/stats").json()["platform_cache"]
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["hits"] == before["hits"] + 1
+    assert stats["entries"] == 1
+
+
+def test_cyclic_application():
+    """Test that a cyclic application is rejected as invalid input."""
+    model = load_model("example1.json")
+    model["application"]["messages"].append({"id": 9, "sender": 0, "receiver": 3, "size": 1})
+    response = client.post("/schedule_jobs", json=model)
+    assert response.status_code == 400 and response.json()["detail"].startswith("Cyclic dependency detected at job")
+
+
+def test_integral_floats():
+    """Test that integral floats are scheduled like integers and values beyond 64 bits are refused."""
+    model = load_model("example2.json")
+    expected = client.post("/schedule_jobs", json=model).json()
+    backend.result_cache.clear()
+    for task in model["application"]["tasks"]:
+        task["wcet"], task["deadline"] = float(task["wcet"]), float(task["deadline"])
+    response = client.post("/schedule_jobs", json=model)
+    assert response.status_code == 200 and response.json() == expected
+    model["application"]["tasks"][0]["wcet"] = 2 ** 70
+    response = client.post("/schedule_jobs", json=model)
+    assert response.status_code == 400 and "Task wcet must be an integer" in response.json()["detail"]
+
+
+def test_invalid_body():
+    """Test that malformed or invalid request bodies are rejected."""
+    for body in (b"{", b"[]", b'{"application": {"tasks": [{"id": 0}], "messages": []}}'):
+        response = client.post("/schedule_jobs", content=body, headers={"Content-Type": "application/json"})
+        assert response.status_code == 400
+    assert "requestBody" in client.get("/openapi.json").json()["paths"]["/schedule_jobs"]["post"]
+
+
+def test_result_cache():
+    """Test that an identical request is answered from the result cache with the same response."""
+    model = load_model("example3.json")
+    first = client.post("/schedule_jobs", json=model)
+    before = client.get("/stats").json()["result_cache"]
+    second = client.post("/schedule_jobs", json=model)
+    after = client.get("/stats").json()["result_cache"]
+    assert second.json() == first.json()
+    assert after["hits"] == before["hits"] + 1
+    ## A repeated body is answered before it is parsed
+    assert [entry.split(";")[0] for entry in second.headers["server-timing"].split(", ")] == ["receive", "total"]
+
+
+def test_result_cache_content_key():
+    """Test that a reformatted request with reordered keys and other message ids is answered from the cache."""
+    model = load_model("example2.json")
+    backend.result_cache.clear()
+    first = client.post("/schedule_jobs", json=model)
+    for message in model["application"]["messages"]:
+        message["id"] = f"renamed-{message['id']}"
+    body = json.dumps({"platform": model["platform"],
+                       "application": {key: [dict(reversed(item.items())) for item in items]
+                                       for key, items in reversed(model["application"].items())}}, indent=2)
+    before = client.get("/stats").json()["result_cache"]
+    second = client.post("/schedule_jobs", content=body, headers={"Content-Type": "application/json"})
+    after = client.get("/stats").json()["result_cache"]
+    assert second.json() == first.json() and after["hits"] == before["hits"] + 1
+    assert "compile" not in second.headers["server-timing"]
+
+
+def test_columnar_response():
+    """Test that the columnar format is negotiated through the Accept header and holds the same schedules."""
+    model = load_model("example1.json")
+    rows = client.post("/schedule_jobs", json=model).json()
+    response = client.post("/schedule_jobs", json=model,
+                           headers={"Accept": "application/vnd.schedule.columnar+json"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.schedule.columnar+json"
+    assert response.headers["vary"] == "Accept"
+    for key, result in response.json().items():
+        columns = result["schedule"]
+        assert list(columns) == backend.columnar_fields
+        assert [dict(zip(columns, entry)) for entry in zip(*columns.values())] == rows[key]["schedule"]
+    response = client.post("/schedule_jobs", json=model, headers={"Accept": "text/html"})
+    assert response.status_code == 406
+
+
+def test_schedule_jobs_stream():
+    """Test that the streamed schedules hold the entries of the /schedule_jobs response."""
+    model = load_model("example1.json")
+    expected = client.post("/schedule_jobs", json=model).json()
+    response = client.post("/schedule_jobs/stream", json=model)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    streamed = {}
+    for line in response.text.splitlines():
+        value = json.loads(line)
+        if "schedule" in value and "task_id" not in value:
+            key = value["schedule"]
+            streamed[key] = {"schedule": [], "name": value["name"]}
+        else:
+            streamed[key]["schedule"].append(value)
+    assert streamed == expected
+    assert client.post("/schedule_jobs/stream", json={"application": {}}).status_code == 400
+
+
+def test_schedule_jobs_stream_error():
+    """Test that an error found while streaming ends the stream with an error line."""
+    model = {
+        "application": {
+            "tasks": [{"id": i, "wcet": 10, "mcet": 5, "deadline": 100} for i in range(2)],
+            "messages": [{"id": 0, "sender": 0, "receiver": 1, "size": 10}],
+        },
+        "platform": {"nodes": [{"id": "a", "type": "compute"}, {"id": "b", "type": "compute"}], "links": []},
+    }
+    response = client.post("/schedule_jobs/stream?communication=true&algorithms=edf_multinode", json=model)
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0] == {"schedule": "schedule5", "name": "EDF Multi Node"}
+    assert "error" in lines[-1]
+
+
+def test_schedule_batch():
+    """Test that every application of a batch gets the schedules of /schedule_jobs or its own error."""
+    model = load_model("example1.json")
+    application = model["application"]
+    cyclic = {"tasks": application["tasks"][:2], "messages": [
+        {"id": 0, "sender": application["tasks"][0]["id"], "receiver": application["tasks"][1]["id"], "size": 1},
+        {"id": 1, "sender": application["tasks"][1]["id"], "receiver": application["tasks"][0]["id"], "size": 1},
+    ]}
+    applications = [application] * 5 + [{"tasks": [{"id": 0}], "messages": []}, cyclic]
+    response = client.post("/schedule_batch?algorithms=edf_multinode,ll_multinode",
+                           json={"platform": model["platform"], "applications": applications})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = sorted((json.loads(line) for line in response.text.splitlines()), key=lambda line: line["index"])
+    assert [line["index"] for line in lines] == list(range(len(applications)))
+    expected = client.post("/schedule_jobs?algorithms=edf_multinode,ll_multinode", json=model).json()
+    assert all(line["schedules"] == expected for line in lines[:5])
+    assert "Invalid Input schema" in lines[5]["error"]
+    assert "Cyclic" in lines[6]["error"]
+    response = client.post("/schedule_batch", json={"platform": {"nodes": []}, "applications": []})
+    assert response.status_code == 400
+
+
+def test_process_pool(monkeypatch):
+    """Test that the process pool execution mode returns the same schedules as inline execution."""
+    model = load_model("example2.json")
+    backend.result_cache.clear()
+    inline = client.post("/schedule_jobs?communication=true", json=model).json()
+    backend.result_cache.clear()
+    monkeypatch.setattr(backend, "EXECUTION_MODE", "process")
+    with TestClient(backend.app) as pooled_client:
+        pooled = pooled_client.post("/schedule_jobs?communication=true", json=model).json()
+    assert pooled == inline
+
+
+def test_payload_logging(caplog):
+    """Test that payloads are only logged at debug level."""
+    model = load_model("example1.json")
+    backend.result_cache.clear()
+    with caplog.at_level(logging.INFO, logger="backend"):
+        client.post("/schedule_jobs", json=model)
+    assert "Received JSON data" not in caplog.text
+    backend.result_cache.clear()
+    with caplog.at_level(logging.DEBUG, logger="backend"):
+        client.post("/schedule_jobs", json=model)
+    assert "Received JSON data" in caplog.text and "Sending JSON data" in caplog.text
+
+
+def test_payload_log_sampling(caplog, monkeypatch):
+    """Test that the body of a request whose payload record is sampled out is not kept."""
+    model = load_model("example1.json")
+    backend.result_cache.clear()
+    monkeypatch.setattr(backend.payload_sampling, "rate", 0)
+    with caplog.at_level(logging.DEBUG, logger="backend"):
+        assert client.post("/schedule_jobs", json=model).status_code == 200
+    assert "Received JSON data" not in caplog.text and "Sending JSON data" not in caplog.text
+    backend.result_cache.clear()
+    monkeypatch.setattr(backend.payload_sampling, "sample", lambda: True)
+    with caplog.at_level(logging.DEBUG, logger="backend"):
+        assert client.post("/schedule_jobs", json=model).status_code == 200
+    assert "Received JSON data" in caplog.text
+
+
+def poll_job(job_id, timeout=10):
+    """Poll a job until it is no longer queued or running."""
+    end = time.monotonic() + timeout
+    while True:
+        response = client.get(f"/jobs/{job_id}")
+        assert response.status_code == 200
+        if response.json()["status"] not in ("queued", "running"):
+            return response.json()
+        assert time.monotonic() < end, "job did not finish"
+        time.sleep(0.01)
+
+
+def test_jobs():
+    """Test that a submitted job is polled until it holds the schedules of /schedule_jobs."""
+    model = load_model("example2.json")
+    backend.result_cache.clear()
+    response = client.post("/jobs?communication=true", json=model)
+    assert response.status_code == 202
+    job = response.json()
+    assert response.headers["location"] == f"/jobs/{job['id']}"
+    done = poll_job(job["id"])
+    assert done["status"] == "done" and done["started_at"] <= done["finished_at"]
+    assert done["result"] == client.post("/schedule_jobs?communication=true", json=model).json()
+
+    ## The schedules are cached by now, so an identical job is done at once
+    cached = client.post("/jobs?communication=true", json=model).json()
+    assert cached["status"] == "done"
+    assert client.get(f"/jobs/{cached['id']}").json()["result"] == done["result"]
+    assert client.delete(f"/jobs/{cached['id']}").json()["status"] == "done"
+    assert client.get("/jobs/unknown").status_code == 404
+    assert client.post("/jobs", content=b"{", headers={"Content-Type": "application/json"}).status_code == 400
+    assert client.get("/stats").json()["jobs"]["done"] >= 2
+
+
+def test_job_cancellation(monkeypatch):
+    """Test that queued jobs are cancelled and submissions beyond the queue bound are refused."""
+    model = load_model("example1.json")
+    backend.result_cache.clear()
+    ## A queue without workers keeps its jobs queued
+    monkeypatch.setattr(backend, "job_queue", JobQueue(workers=0, max_jobs=1, retention=60))
+    job = client.post("/jobs", json=model).json()
+    assert job["status"] == "queued"
+    response = client.post("/jobs", json=model)
+    assert response.status_code == 503 and response.headers["retry-after"] == "1"
+    cancelled = client.delete(f"/jobs/{job['id']}").json()
+    assert cancelled["status"] == "cancelled" and cancelled["error"] == "Cancelled"
+    assert client.post("/jobs", json=model).status_code == 202
+
+
+def test_metrics():
+    """Test that the phases of /schedule_jobs are listed in the Server-Timing header and exposed on /metrics."""
+    model = load_model("example3.json")
+    backend.result_cache.clear()
+    response = client.post("/schedule_jobs?algorithms=edf_multinode", json=model)
+    phases = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+    assert phases == ["receive", "parse", "validate", "compile", "edf_multinode.setup", "edf_multinode.loop",
+                      "output_validation", "serialize", "total"]
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'scheduler_algorithm_seconds_count{algorithm="edf_multinode",phase="loop"}' in response.text
+    assert 'scheduler_model_size_bucket{kind="tasks",le="+Inf"}' in response.text
+
+
+def test_metrics_disabled(monkeypatch):
+    """Test that no timings are taken while metrics are disabled."""
+    monkeypatch.setattr(backend, "METRICS_ENABLED", False)
+    backend.result_cache.clear()
+    response = client.post("/schedule_jobs", json=load_model("example1.json"))
+    assert response.status_code == 200 and "server-timing" not in response.headers
+    assert client.get("/metrics").status_code == 404
+
+
+def test_sessions():
+    """Test that a session is created, edited by deltas and deleted."""
+    model = load_model("example1.json")
+    response = client.post("/sessions?algorithms=edf_single_node,ll_multinode", json=model)
+    assert response.status_code == 201
+    session = response.json()
+    assert response.headers["location"] == f"/sessions/{session['id']}"
+    assert session["schedules"] == client.post("/schedule_jobs?algorithms=edf_single_node,ll_multinode",
+                                               json=model).json()
+
+    task = model["application"]["tasks"][0]
+    response = client.patch(f"/sessions/{session['id']}",
+                            json={"changes": [{"op": "update", "task": {"id": task["id"], "wcet": 1}}]})
+    assert response.status_code == 200
+    changed = response.json()["schedules"]
+    assert sorted(changed) == ["schedule2", "schedule3"]
+    task["wcet"] = 1
+    current = client.get(f"/sessions/{session['id']}").json()["schedules"]
+    assert current == client.post("/schedule_jobs?algorithms=edf_single_node,ll_multinode", json=model).json()
+    for key, value in changed.items():
+        assert current[key]["schedule"][value["from"]:] == value["entries"]
+
+    ## Invalid deltas are refused and leave the session as it was
+    assert client.patch(f"/sessions/{session['id']}", json={"changes": [{"op": "move"}]}).status_code == 400
+    response = client.patch(f"/sessions/{session['id']}", json={"changes": [{"op": "remove", "task": {"id": "x"}}]})
+    assert response.status_code == 400 and response.json()["detail"] == "Unknown task x."
+    response = client.patch(f"/sessions/{session['id']}", json={"changes": [
+        {"op": "update", "task": {"id": task["id"], "wcet": 2.0}},
+        {"op": "update", "task": {"id": task["id"], "deadline": 2 ** 70}}]})
+    assert response.status_code == 400 and "Task deadline must be an integer" in response.json()["detail"]
+    assert client.get(f"/sessions/{session['id']}").json()["schedules"] == current
+    assert client.get("/stats").json()["sessions"]["entries"] >= 1
+
+    assert client.delete(f"/sessions/{session['id']}").status_code == 204
+    assert client.get(f"/sessions/{session['id']}").status_code == 404
+    assert client.delete(f"/sessions/{session['id']}").status_code == 404
+    assert client.post("/sessions", json={"application": {}}).status_code == 400
+    task["wcet"] = 2 ** 64
+    assert client.post("/sessions", json=model).status_code == 400
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+def test_session_models(filename):
+    """Test that sessions accept the example models, whose messages may share ids, like /schedule_jobs."""
+    model = load_model(filename)
+    response = client.post("/sessions", json=model)
+    assert response.status_code == 201
+    assert response.json()["schedules"] == client.post("/schedule_jobs", json=model).json()
+
+
+def test_analyze():
+    """Test the pre-analysis endpoint and the early rejection of /schedule_jobs."""
+    model = load_model("example1.json")
+    response = client.post("/analyze?tasks=true", json=model)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["tasks"] == len(model["application"]["tasks"]) and len(report["slack"]) == report["tasks"]
+    assert not report["multi_node"]["infeasible"]
+
+    backend.result_cache.clear()
+    assert client.post("/schedule_jobs?reject_infeasible=true", json=model).status_code == 200
+    for task in model["application"]["tasks"]:
+        task["deadline"] = 1
+    assert client.post("/schedule_jobs", json=model).status_code == 200
+    response = client.post("/schedule_jobs?reject_infeasible=true", json=model)
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert detail["reasons"] and detail["analysis"]["late_tasks"] == len(model["application"]["tasks"])
+
+
+def test_reject_infeasible_overlapping_jobs():
+    """Test that jobs that overlap on the single node, and so meet their deadlines there, are not rejected."""
+    model = load_model("example1.json")
+    model["application"] = {"tasks": [{"id": i, "wcet": 10, "mcet": 5, "deadline": 15} for i in range(2)],
+                            "messages": []}
+    response = client.post("/schedule_jobs?reject_infeasible=true&algorithms=edf_single_node", json=model)
+    assert response.status_code == 200
+    schedule = response.json()["schedule2"]["schedule"]
+    assert all(entry["end_time"] <= entry["deadline"] for entry in schedule)
+
+
+def test_simulate():
+    """Test the preemptive simulations of the tasks as periodic jobs."""
+    model = load_model("example1.json")
+    response = client.post("/simulate?simulations=edf_preemptive_single_node,ll_preemptive_multinode&horizon=500",
+                           json=model)
+    assert response.status_code == 200
+    result = response.json()
+    assert list(result) == ["edf_preemptive_single_node", "ll_preemptive_multinode"]
+    assert result["edf_preemptive_single_node"]["name"] == "Preemptive EDF Single Node"
+    assert all(entry["end_time"] >= entry["start_time"] for entry in result["ll_preemptive_multinode"]["schedule"])
+
+    assert client.post("/simulate?simulations=fifo", json=model).status_code == 400
+    assert client.post("/simulate?horizon=0", json=model).status_code == 422
+    model["application"]["tasks"][0]["deadline"] = 0
+    response = client.post("/simulate", json=model)
+    assert response.status_code == 400 and "positive deadline" in response.json()["detail"]
@@ -0,0 +1,41 @@
+import os
+import sys
+
+# Adjust path to include the 'src' directory for importing the caches
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from cache import LRUCache, ResultCache, content_hash
+
+
+def test_content_hash():
+    """Test that the hash does not depend on the key order."""
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+
+def test_lru_eviction():
+    """Test that the least recently used entries are evicted to stay within the size bound."""
+    cache = LRUCache(max_bytes=100)
+    cache.put("a", 1, 40)
+    cache.put("b", 2, 40)
+    assert cache.get("a") == 1
+    cache.put("c", 3, 40)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    cache.put("d", 4, 200)
+    assert cache.get("d") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 80
+
+
+def test_result_cache_disk_tier(tmp_path):
+    """Test that responses expire after their time to live and survive a restart on disk."""
+    cache = ResultCache(max_bytes=1000, ttl=60, directory=tmp_path)
+    cache.put("key", b"response")
+    restarted = ResultCache(max_bytes=1000, ttl=60, directory=tmp_path)
+    assert restarted.get("key") == b"response"
+    assert restarted.stats()["disk_hits"] == 1
+
+    expired = ResultCache(max_bytes=1000, ttl=-1)
+    expired.put("key", b"response")
+    assert expired.get("key") is None
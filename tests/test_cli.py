@@ -0,0 +1,124 @@
+import pytest
+import os
+import csv
+import json
+import shutil
+import sys
+
+script_dir = os.path.dirname(__file__)
+input_models_dir = os.path.join(script_dir, "input_models")
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from algorithms import run_algorithm
+import cli
+import modelfile
+
+
+@pytest.fixture
+def models(tmp_path):
+    """Copy of the example models next to an invalid one."""
+    directory = tmp_path / "models"
+    shutil.copytree(input_models_dir, directory)
+    (directory / "invalid.json").write_text('{"application": {}}')
+    return directory
+
+
+def read_jsonl(path):
+    with open(path) as f:
+        return {record["model"]: record for record in map(json.loads, f)}
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_jsonl(models, tmp_path, workers):
+    """Test that every model gets a record holding the schedules of the algorithms and their timings."""
+    output = tmp_path / "results.jsonl"
+    assert cli.main([str(models), "-o", str(output), "--workers", workers]) == 1
+    records = read_jsonl(output)
+    assert len(records) == len(os.listdir(input_models_dir)) + 1
+    assert records[str(models / "invalid.json")]["status"] == "error"
+    record = records[str(models / "example1.json")]
+    with open(models / "example1.json") as f:
+        data = json.load(f)
+    for name, result in record["results"].items():
+        assert result["schedule"] == run_algorithm(name, data["application"], data["platform"])["schedule"]
+        assert result["schedule_seconds"] >= 0 and result["makespan"] > 0
+
+
+def test_invalid_values(models, tmp_path):
+    """Test that integral floats are scheduled and a value beyond 64 bits only fails its own model."""
+    with open(models / "example1.json") as f:
+        data = json.load(f)
+    for task in data["application"]["tasks"]:
+        task["wcet"] = float(task["wcet"])
+    (models / "floats.json").write_text(json.dumps(data))
+    data["application"]["tasks"][0]["deadline"] = 2 ** 70
+    (models / "huge.json").write_text(json.dumps(data))
+    output = tmp_path / "results.jsonl"
+    assert cli.main([str(models), "-o", str(output), "--workers", "1"]) == 1
+    records = read_jsonl(output)
+    expected = records[str(models / "example1.json")]["results"]
+    assert all(result["schedule"] == expected[name]["schedule"]
+               for name, result in records[str(models / "floats.json")]["results"].items())
+    assert records[str(models / "huge.json")]["status"] == "error"
+    assert "Task deadline must be an integer" in records[str(models / "huge.json")]["error"]
+
+
+def test_resume(models, tmp_path):
+    """Test that a resumed run skips the recorded models and replaces a partly written record."""
+    output = tmp_path / "results.jsonl"
+    cli.main([str(models / "example1.json"), str(models / "example2.json"), "-o", str(output), "--workers", "1"])
+    with open(output) as f:
+        first, second = f.read().splitlines()
+    output.write_text(first + "\n" + second[:40])
+    cli.main([str(models / "*.json"), "-o", str(output), "--workers", "1", "--resume"])
+    records = read_jsonl(output)
+    assert len(records) == len(os.listdir(input_models_dir)) + 1
+    assert json.loads(first) == records[str(models / "example1.json")]
+
+
+def test_csv(models, tmp_path):
+    """Test that the CSV output has a row per model and algorithm, and resumes the last model from scratch."""
+    output = tmp_path / "results.csv"
+    arguments = [str(models), "-o", str(output), "--algorithms", "edf_multinode,ll_multinode", "--workers", "1"]
+    cli.main(arguments)
+    with open(output) as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2 * len(os.listdir(input_models_dir)) + 1
+    output.write_text("".join(output.read_text().splitlines(keepends=True)[:-1]))
+    cli.main(arguments + ["--resume"])
+    with open(output) as f:
+        assert len(list(csv.DictReader(f))) == len(rows)
+
+
+def test_csv_resume_multiline(models, tmp_path):
+    """Test that resuming a CSV output keeps the rows whose quoted fields hold newlines."""
+    output = tmp_path / "results.csv"
+    arguments = [str(models), "-o", str(output), "--algorithms", "edf_multinode,ll_multinode", "--workers", "1"]
+    cli.main(arguments)
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    first = rows[0]["model"]
+    for row in rows:
+        if row["model"] == first:
+            row["error"] = "first line\nsecond line"
+    with open(output, "w", newline="") as f:
+        writer = csv.DictWriter(f, cli.CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows[:-1])
+    cli.main(arguments + ["--resume"])
+    with open(output, newline="") as f:
+        resumed = list(csv.DictReader(f))
+    assert len(resumed) == len(rows)
+    assert all(row["error"] == "first line\nsecond line" for row in resumed if row["model"] == first)
+
+
+def test_truncated_model_file(models, tmp_path):
+    """Test that a truncated model file gets an error record while the other models are scheduled."""
+    modelfile.convert(str(models / "example1.json"), str(tmp_path / "example1.bin"))
+    (models / "truncated.bin").write_bytes((tmp_path / "example1.bin").read_bytes()[:40])
+    output = tmp_path / "results.jsonl"
+    assert cli.main([str(models), "-o", str(output), "--workers", "1"]) == 1
+    records = read_jsonl(output)
+    assert len(records) == len(os.listdir(input_models_dir)) + 2
+    assert records[str(models / "truncated.bin")]["status"] == "error"
+    assert str(models / "truncated.bin") in records[str(models / "truncated.bin")]["error"]
+    assert records[str(models / "example1.json")]["status"] == "ok"
@@ -0,0 +1,44 @@
+import json
+import os
+import sys
+
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+import encoding
+from encoding import JSON_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE, dumps, negotiate, to_columnar
+
+
+def test_dumps():
+    """Test that values are encoded as compact JSON, also beyond the integer range of orjson."""
+    value = {"schedule": [{"task_id": "é", "start_time": 0}], "big": 2 ** 70}
+    assert json.loads(dumps(value)) == value
+    assert b" " not in dumps(value)
+
+
+def test_dumps_without_orjson(monkeypatch):
+    """Test the fallback to the json module when orjson is not installed."""
+    monkeypatch.setattr(encoding, "orjson", None)
+    assert dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+
+def test_to_columnar():
+    """Test that a schedule is split into one array per field, keeping the other keys of the result."""
+    result = {"name": "EDF", "schedule": [
+        {"task_id": 0, "node_id": 1, "start_time": 0, "end_time": 2, "deadline": 5},
+        {"task_id": 1, "node_id": 2, "start_time": 2, "end_time": 3, "deadline": 4},
+    ]}
+    columnar = to_columnar(result, ["task_id", "start_time"])
+    assert columnar == {"name": "EDF", "schedule": {"task_id": [0, 1], "start_time": [0, 2]}}
+    assert isinstance(result["schedule"], list)
+
+
+def test_negotiate():
+    """Test content negotiation between the default and the columnar format."""
+    assert negotiate(None) == JSON_MEDIA_TYPE
+    assert negotiate("*/*") == JSON_MEDIA_TYPE
+    assert negotiate(COLUMNAR_MEDIA_TYPE) == COLUMNAR_MEDIA_TYPE
+    assert negotiate(f"application/json;q=0.5, {COLUMNAR_MEDIA_TYPE}") == COLUMNAR_MEDIA_TYPE
+    assert negotiate(f"*/*;q=0.1, {COLUMNAR_MEDIA_TYPE};q=0.9") == COLUMNAR_MEDIA_TYPE
+    assert negotiate("application/*, application/json;q=0") == COLUMNAR_MEDIA_TYPE
+    assert negotiate("text/html, */*;q=0.8") == JSON_MEDIA_TYPE
+    assert negotiate("text/html") is None
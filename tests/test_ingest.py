@@ -0,0 +1,84 @@
+import pytest
+import os
+import json
+import sys
+
+script_dir = os.path.dirname(__file__)
+input_models_dir = os.path.join(script_dir, "input_models")
+src_dir = os.path.abspath(os.path.join(script_dir, "..", "src"))
+sys.path.append(src_dir)
+from jsonschema.exceptions import ValidationError
+from ingest import RequestReader
+from model import compile_application
+
+
+with open(os.path.join(src_dir, "input_schema.json")) as f:
+    reader = RequestReader(json.load(f))
+
+
+def chunked(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_read_request(filename, size):
+    """Test that the incrementally read application matches the compiled parsed body, for any chunk size."""
+    with open(os.path.join(input_models_dir, filename), "rb") as f:
+        body = f.read()
+    data = json.loads(body)
+    request, model = reader.read(chunked(body, size))
+    expected = compile_application(data["application"])
+    assert model.ids == expected.ids
+    assert (model.wcet, model.mcet, model.deadline) == (expected.wcet, expected.mcet, expected.deadline)
+    assert (model.graph.pred, model.size, model.blocked) == (expected.graph.pred, expected.size, expected.blocked)
+    assert request["platform"] == data["platform"]
+    assert request["application"]["tasks"] == request["application"]["messages"] == []
+
+
+def test_integral_floats():
+    """Test that integral floats are stored as integers while the request is read."""
+    body = json.dumps({"application": {"tasks": [{"id": 0, "wcet": 2.0, "mcet": 1.0, "deadline": 10.0}],
+                                       "messages": [{"id": 0, "sender": 0, "receiver": 0, "size": 3.0}]},
+                       "platform": {"nodes": [], "links": []}}).encode()
+    _, model = reader.read(chunked(body, 7))
+    assert (list(model.wcet), list(model.mcet), list(model.deadline), list(model.size)) == ([2], [1], [10], [3])
+    with pytest.raises(ValueError, match="Message size"):
+        reader.read([body.replace(b"3.0", str(2 ** 64).encode())])
+
+
+def test_invalid_item():
+    """Test that an invalid task is reported with its position in the request."""
+    body = b'{"application": {"tasks": [{"id": 0, "wcet": 1, "mcet": 1, "deadline": 9}, {"id": 1, "wcet": "1"}]}}'
+    with pytest.raises(ValidationError) as err:
+        reader.read(chunked(body, 7))
+    assert list(err.value.path)[:3] == ["application", "tasks", 1]
+
+
+@pytest.mark.parametrize("body", [
+    b"",
+    b"[]",
+    b'{"application": {"tasks": [}}',
+    b'{"platform": 1} {}',
+    b'{"platform": 1, "platform": 2}',
+])
+def test_invalid_json(body):
+    """Test that malformed bodies are rejected."""
+    with pytest.raises(ValueError):
+        reader.read([body])
+
+
+def test_missing_sections():
+    """Test that the rest of the request is validated against the input schema once it is read."""
+    with pytest.raises(ValidationError):
+        reader.read([b'{"application": {"tasks": [], "messages": []}}'])
+
+
+@pytest.mark.parametrize("body", [
+    b'{"application": {"tasks": [], "messages": [], "tasks": []}, "platform": {}}',
+    b'{"application": {"tasks": [], "messages": []}, "application": {"tasks": [], "messages": []}}',
+])
+def test_duplicate_keys(body):
+    """Test that a repeated key is rejected instead of keeping the last value like json.loads."""
+    with pytest.raises(ValueError, match="Duplicate key"):
+        reader.read([body])
@@ -0,0 +1,123 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Adjust path to include the 'src' directory for importing the job queue
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from jobs import CANCELLED, DONE, FAILED, FINISHED, QUEUED, TIMED_OUT, JobQueue, QueueFull
+
+
+def wait_for(queue, job, timeout=5):
+    """Poll a job until it is finished."""
+    end = time.monotonic() + timeout
+    while queue.get(job.id).status not in FINISHED:
+        assert time.monotonic() < end, "job did not finish"
+        time.sleep(0.001)
+    return queue.get(job.id)
+
+
+def steps(job, count, started=None, release=None):
+    """Job function doing ``count`` steps, checking its state between them."""
+    if started is not None:
+        started.set()
+    for _ in range(count):
+        if release is not None:
+            release.wait()
+        job.check()
+    return count
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(workers=1, max_jobs=2, retention=60)
+    yield queue
+    queue.shutdown()
+
+
+def test_job_result(queue):
+    """Test that a job runs in a worker thread and keeps its result."""
+    job = wait_for(queue, queue.submit(steps, 3))
+    assert job.status == DONE and job.result == 3
+    assert job.submitted_at <= job.started_at <= job.finished_at
+    assert queue.stats()[DONE] == 1
+
+
+def test_job_errors(queue):
+    """Test that a ValueError fails the job with its message and other errors are not exposed."""
+    def invalid(job):
+        raise ValueError("No route")
+
+    def broken(job):
+        raise KeyError("internal")
+
+    assert wait_for(queue, queue.submit(invalid)).info()["error"] == "No route"
+    job = wait_for(queue, queue.submit(broken))
+    assert job.status == FAILED and job.error == "Internal Server Error"
+
+
+def test_cancel(queue):
+    """Test that a queued job is cancelled at once and a running job at its next check."""
+    started, release = threading.Event(), threading.Event()
+    running = queue.submit(steps, 10, started, release)
+    queued = queue.submit(steps, 1)
+    started.wait(5)
+    assert queue.cancel(queued.id).status == CANCELLED
+    assert queue.cancel(running.id).status not in FINISHED
+    release.set()
+    assert wait_for(queue, running).status == CANCELLED
+    assert queue.cancel("unknown") is None
+
+
+def test_deadline(queue):
+    """Test that a job is stopped once its deadline has passed, also while it is still queued."""
+    started, release = threading.Event(), threading.Event()
+    running = queue.submit(steps, 10, started, release, timeout=0.05)
+    queued = queue.submit(steps, 1, timeout=0.05)
+    started.wait(5)
+    time.sleep(0.1)
+    release.set()
+    assert wait_for(queue, running).status == TIMED_OUT
+    assert wait_for(queue, queued).error == "Deadline exceeded"
+
+
+def test_bounded_queue(queue):
+    """Test that submissions beyond the bound are refused until a job finishes."""
+    started, release = threading.Event(), threading.Event()
+    first = queue.submit(steps, 1, started, release)
+    second = queue.submit(steps, 1)
+    assert queue.stats()[QUEUED] >= 1
+    with pytest.raises(QueueFull):
+        queue.submit(steps, 1)
+    release.set()
+    wait_for(queue, first)
+    wait_for(queue, second)
+    wait_for(queue, queue.submit(steps, 1))
+
+
+def test_retention():
+    """Test that finished jobs are dropped after the retention window."""
+    queue = JobQueue(workers=1, max_jobs=1, retention=0.05)
+    job = queue.store(b"cached")
+    assert queue.get(job.id).result == b"cached"
+    time.sleep(0.1)
+    assert queue.get(job.id) is None
+    assert queue.stats()[DONE] == 0
+
+
+def test_result_bound():
+    """Test that the oldest finished jobs are dropped once their results exceed the bound."""
+    queue = JobQueue(workers=1, max_jobs=1, retention=60, max_result_bytes=10)
+    first, second = queue.store(b"12345"), queue.store(b"12345")
+    assert queue.stats()["result_bytes"] == 10
+    third = queue.store(b"123")
+    assert queue.get(first.id) is None and queue.get(second.id).result == b"12345"
+    stats = queue.stats()
+    assert stats["result_bytes"] == 8 and stats["evictions"] == 1 and stats[DONE] == 2
+    ## The latest finished job is kept even if its result alone exceeds the bound
+    large = queue.store(b"x" * 20)
+    assert queue.get(large.id).result == b"x" * 20 and queue.get(third.id) is None
+    assert queue.stats()["result_bytes"] == 20
@@ -0,0 +1,43 @@
+import os
+import sys
+
+# Adjust path to include the 'src' directory for importing the metrics
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from metrics import NO_TIMINGS, Registry, Timings, ALGORITHM_SECONDS, PHASE_SECONDS
+
+
+def test_histogram_render():
+    """Test that a histogram is rendered with cumulative buckets, sum and count per label value."""
+    registry = Registry()
+    histogram = registry.histogram("test_seconds", "Test histogram.", (0.1, 1), ("phase",))
+    for value in (0.05, 0.1, 0.5, 2):
+        histogram.observe(value, "parse")
+    histogram.observe(1, 'quoted "phase"')
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP test_seconds Test histogram.", "# TYPE test_seconds histogram"]
+    assert 'test_seconds_bucket{phase="parse",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{phase="parse",le="1"} 3' in lines
+    assert 'test_seconds_bucket{phase="parse",le="+Inf"} 4' in lines
+    assert 'test_seconds_sum{phase="parse"} 2.65' in lines
+    assert 'test_seconds_count{phase="parse"} 4' in lines
+    assert 'test_seconds_count{phase="quoted \\"phase\\""} 1' in lines
+
+
+def test_timings():
+    """Test that the phases of a request are summed up, observed and listed in the Server-Timing header."""
+    timings = Timings()
+    with timings.phase("parse"):
+        pass
+    timings.add("parse", 0.5)
+    timings.update({"edf_multinode.setup": 0.25})
+    header = timings.finish()
+    entries = [entry.split(";dur=") for entry in header.split(", ")]
+    assert [name for name, _ in entries] == ["parse", "edf_multinode.setup", "total"]
+    assert float(entries[0][1]) >= 500 and entries[1][1] == "250.000"
+    assert 'algorithm="edf_multinode",phase="setup"' in ALGORITHM_SECONDS.render()
+    assert 'phase="total"' in PHASE_SECONDS.render()
+
+    with NO_TIMINGS.phase("parse"):
+        NO_TIMINGS.add("parse", 1)
+    assert NO_TIMINGS.finish() is None and not NO_TIMINGS.durations
@@ -0,0 +1,88 @@
+import pytest
+import os
+import sys
+from array import array
+
+# Adjust path to include the 'src' directory for importing the model
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from dag import Dag
+from model import compile_application
+
+
+application_model = {
+    "tasks": [
+        {"id": "a", "wcet": 10, "mcet": 5, "deadline": 100},
+        {"id": "b", "wcet": 20, "mcet": 10, "deadline": 200},
+        {"id": "c", "wcet": 30, "mcet": 15, "deadline": 300},
+    ],
+    "messages": [
+        {"id": 0, "sender": "a", "receiver": "c", "size": 1},
+        {"id": 1, "sender": "b", "receiver": "c", "size": 1},
+        {"id": 2, "sender": "a", "receiver": "b", "size": 1},
+        {"id": 3, "sender": "x", "receiver": "b", "size": 1},
+    ],
+}
+
+
+def test_task_index():
+    """Test that task ids are mapped to dense indices with parallel value arrays."""
+    model = compile_application(application_model)
+    assert model.ids == ["a", "b", "c"]
+    assert model.index == {"a": 0, "b": 1, "c": 2}
+    assert list(model.wcet) == [10, 20, 30]
+    assert list(model.deadline) == [100, 200, 300]
+    assert compile_application(model) is model
+
+
+def test_integral_floats():
+    """Test that integral floats are stored as integers and other values are refused with a ValueError."""
+    floats = {
+        "tasks": [dict(task, wcet=float(task["wcet"]), mcet=float(task["mcet"]), deadline=float(task["deadline"]))
+                  for task in application_model["tasks"]],
+        "messages": [dict(message, size=2.0) for message in application_model["messages"]],
+    }
+    model = compile_application(floats)
+    assert list(model.wcet) == [10, 20, 30] and list(model.mcet) == [5, 10, 15]
+    assert list(model.deadline) == [100, 200, 300] and list(model.size) == [2, 2, 2]
+    for task in ({"wcet": 1.5}, {"mcet": 2 ** 70}, {"deadline": "1"}):
+        with pytest.raises(ValueError, match="must be an integer"):
+            compile_application(dict(application_model, tasks=[dict(application_model["tasks"][0], **task)]))
+    with pytest.raises(ValueError, match="Message size"):
+        compile_application(dict(application_model, messages=[dict(application_model["messages"][0], size=0.5)]))
+
+
+def test_adjacency():
+    """Test the CSR predecessor and successor adjacency."""
+    model = compile_application(application_model)
+    assert [list(model.graph.predecessors(i)) for i in range(3)] == [[], [0], [0, 1]]
+    assert [list(model.graph.successors(i)) for i in range(3)] == [[2, 1], [2], []]
+    # The message from the unknown sender keeps task b blocked
+    assert model.indegrees() == [0, 2, 2]
+
+
+def test_topological_order():
+    """Test Kahn's algorithm on the message graph, including cycle detection."""
+    model = compile_application(application_model)
+    assert model.graph.topological_order() == [0, 1, 2]
+    cyclic = Dag(3, array("q", [0, 1, 2]), array("q", [1, 2, 1]))
+    with pytest.raises(ValueError, match="at vertex 1"):
+        cyclic.topological_order()
+    with pytest.raises(ValueError, match="at job b"):
+        cyclic.topological_order(["a", "b", "c"])
+
+
+def test_graph_edits():
+    """Test that added and removed edges and vertices keep both adjacencies consistent."""
+    graph = compile_application(application_model).graph.copy()
+    graph.add_edge(graph.add_vertex(), 2, 4)
+    assert list(graph.predecessors(2)) == [0, 1, 3] and list(graph.successors(3)) == [2]
+    graph.remove_edge(0, 2, 0)
+    assert list(graph.predecessors(2)) == [1, 3] and list(graph.successors(0)) == [1]
+    with pytest.raises(ValueError):
+        graph.remove_edge(0, 2, 1)
+    assert sorted(graph.remove_vertex(1)) == [1, 2]
+    assert [list(graph.predecessors(v)) for v in range(3)] == [[], [2], []]
+    assert [list(graph.successors(v)) for v in range(3)] == [[], [], [1]]
+    assert list(graph.pred_edge) == [4]
+    assert list(compile_application(application_model).graph.predecessors(2)) == [0, 1]
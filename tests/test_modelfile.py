@@ -0,0 +1,62 @@
+import pytest
+import os
+import json
+import sys
+
+script_dir = os.path.dirname(__file__)
+input_models_dir = os.path.join(script_dir, "input_models")
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from algorithms import ALGORITHMS, run_algorithm
+from modelfile import convert, load_model, write_model
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+def test_convert(filename, tmp_path):
+    """Test that every algorithm schedules a converted model exactly like the JSON model."""
+    path = tmp_path / "model.bin"
+    convert(os.path.join(input_models_dir, filename), path)
+    with open(os.path.join(input_models_dir, filename)) as f:
+        data = json.load(f)
+    application, platform = load_model(path)
+    for name in ALGORITHMS:
+        for communication in (False, True):
+            assert (run_algorithm(name, application, platform, communication)
+                    == run_algorithm(name, data["application"], data["platform"], communication))
+
+
+def test_string_ids(tmp_path):
+    """Test that string ids, blocked tasks and node types survive the round trip."""
+    application = {
+        "tasks": [{"id": "a", "wcet": 1, "mcet": 1, "deadline": 5}, {"id": "b", "wcet": 2, "mcet": 1, "deadline": 9}],
+        "messages": [{"id": 0, "sender": "a", "receiver": "b", "size": 3},
+                     {"id": 1, "sender": "x", "receiver": "a", "size": 1}],
+    }
+    platform = {
+        "nodes": [{"id": "r", "type": "router"}, {"id": "c", "type": "compute"}],
+        "links": [{"id": 0, "start_node": "r", "end_node": "c", "link_delay": 2, "bandwidth": 10, "type": "eth"}],
+    }
+    write_model(application, platform, tmp_path / "model.bin")
+    model, topology = load_model(tmp_path / "model.bin")
+    assert model.ids == ["a", "b"] and model.index == {"a": 0, "b": 1}
+    assert model.blocked == (0,) and list(model.size) == [3]
+    assert list(model.graph.successors(0)) == [1]
+    assert topology.node_ids == ["r", "c"] and list(topology.compute) == [1]
+    assert list(topology.link_delay) == [2]
+
+
+def test_not_a_model_file(tmp_path):
+    """Test that other files are rejected."""
+    path = tmp_path / "model.json"
+    path.write_text("{}")
+    with pytest.raises(ValueError):
+        load_model(path)
+
+
+@pytest.mark.parametrize("size", [8, 40, 200, -8])
+def test_truncated_model_file(size, tmp_path):
+    """Test that a truncated model file is rejected with a ValueError naming it."""
+    convert(os.path.join(input_models_dir, "example1.json"), tmp_path / "full.bin")
+    path = tmp_path / "model.bin"
+    path.write_bytes((tmp_path / "full.bin").read_bytes()[:size])
+    with pytest.raises(ValueError, match="model.bin"):
+        load_model(path)
@@ -7,7 +7,10 @@ import sys
 script_dir = os.path.dirname(__file__)
 input_models_dir = os.path.join(script_dir, "input_models")
 sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
-from algorithms import ldf_multinode, edf_multinode, ll_multinode
+from algorithms import ldf_multinode, edf_multinode, ll_multinode, NodeAvailability
+from algorithms import ALGORITHMS, iter_algorithm, run_algorithm
+from metrics import Timings
+from topology import compile_platform
 
 
 
@@ -75,3 +78,107 @@ def test_task_dependencies(filename):
             assert start_time >= max(
                 predecessors_end_times, default=0
             ), "Task starts before predecessor ends"
+
+
+@pytest.mark.parametrize("algo", [ldf_multinode, edf_multinode, ll_multinode])
+def test_cyclic_dependencies(algo):
+    """Test that a dependency cycle is reported instead of looping forever."""
+    application_model = {
+        "tasks": [
+            {"id": i, "wcet": 10, "mcet": 5, "deadline": 100} for i in range(3)
+        ],
+        "messages": [
+            {"id": 0, "sender": 0, "receiver": 1, "size": 1},
+            {"id": 1, "sender": 1, "receiver": 2, "size": 1},
+            {"id": 2, "sender": 2, "receiver": 1, "size": 1},
+        ],
+    }
+    platform_model = {"nodes": [{"id": 0, "type": "compute"}], "links": []}
+    with pytest.raises(ValueError):
+        algo(application_model, platform_model)
+
+
+@pytest.mark.parametrize("filename, order", [
+    ("example1.json", [3, 2, 1, 0]),
+    ("example2.json", [0, 1, 2, 5, 3, 7, 4, 6, 8, 9]),
+    ("example3.json", [1, 3, 2, 4, 5, 6]),
+])
+def test_least_laxity_order(filename, order):
+    """Test that LL places the ready job with the least laxity first."""
+    with open(os.path.join(input_models_dir, filename)) as f:
+        model_data = json.load(f)
+    result = ll_multinode(model_data["application"], model_data["platform"])
+    assert [task["task_id"] for task in result["schedule"]] == order
+
+
+def test_node_availability():
+    """Test earliest-node selection, ties, free-time updates and excluded nodes."""
+    available = NodeAvailability(["r", "a", "b", "c"], compute=[1, 2, 3])
+    assert len(available) == 3 and 0 not in available
+    assert available.earliest() == (0, 1)
+    available.update(1, 30)
+    available.update(2, 20)
+    assert available.earliest() == (0, 3)
+    available.update(3, 40)
+    assert available.earliest() == (20, 2)
+    available.update(1, 10)
+    assert available.earliest() == (10, 1)
+    assert available.node_ids[2] == "b"
+
+
+def test_link_values():
+    """Test that integral floats are accepted as link delays and bandwidths and other values are refused."""
+    platform_model = {"nodes": [{"id": 0, "type": "compute"}, {"id": 1, "type": "compute"}],
+                      "links": [{"id": 0, "start_node": 0, "end_node": 1, "link_delay": 2.0, "bandwidth": 8.0}]}
+    platform = compile_platform(platform_model)
+    assert list(platform.link_delay) == [2] and list(platform.link_bandwidth) == [8]
+    platform_model["links"][0]["bandwidth"] = 2 ** 64
+    with pytest.raises(ValueError, match="Link bandwidth"):
+        compile_platform(platform_model)
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+def test_compute_nodes_only(filename):
+    """Test that jobs are only placed on compute nodes, never on routers."""
+    with open(os.path.join(input_models_dir, filename)) as f:
+        platform_model = json.load(f)["platform"]
+    compute_nodes = {node["id"] for node in platform_model["nodes"] if node["type"] == "compute"}
+    for result, _ in load_and_schedule(filename):
+        assert {task["node_id"] for task in result["schedule"]} <= compute_nodes
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+@pytest.mark.parametrize("algo", [ldf_multinode, edf_multinode, ll_multinode])
+def test_communication_delay(filename, algo):
+    """Test that messages between different nodes delay the receiving task by their transfer time."""
+    with open(os.path.join(input_models_dir, filename)) as f:
+        model_data = json.load(f)
+    platform = compile_platform(model_data["platform"])
+    result = algo(model_data["application"], platform, communication=True)
+    placed = {task["task_id"]: task for task in result["schedule"]}
+    for msg in model_data["application"]["messages"]:
+        sender, receiver = placed[msg["sender"]], placed[msg["receiver"]]
+        transfer = platform.transfer_time(
+            platform.index[sender["node_id"]], platform.index[receiver["node_id"]], msg["size"])
+        assert receiver["start_time"] >= sender["end_time"] + transfer, "Task starts before its message arrives"
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_generator_variants(filename, name):
+    """Test that the generator variant of every algorithm yields the entries of its schedule in order."""
+    with open(os.path.join(input_models_dir, filename)) as f:
+        model_data = json.load(f)
+    entries = iter_algorithm(name, model_data["application"], model_data["platform"], True)
+    assert list(entries) == run_algorithm(name, model_data["application"], model_data["platform"], True)["schedule"]
+
+
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_timed_run(name):
+    """Test that a timed run returns the same result and records the setup and loop phases."""
+    with open(os.path.join(input_models_dir, "example1.json")) as f:
+        model_data = json.load(f)
+    timings = Timings()
+    timed = run_algorithm(name, model_data["application"], model_data["platform"], timings=timings)
+    assert timed == run_algorithm(name, model_data["application"], model_data["platform"])
+    assert list(timings.durations) == [f"{name}.setup", f"{name}.loop"]
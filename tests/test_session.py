@@ -0,0 +1,172 @@
+import json
+import os
+import random
+import sys
+
+import pytest
+
+# Adjust path to include the 'src' directory for importing the session
+script_dir = os.path.dirname(__file__)
+input_models_dir = os.path.join(script_dir, "input_models")
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+import algorithms as alg
+from model import compile_application
+from session import Session
+from topology import compile_platform
+
+selected = {
+    "schedule1": "ldf_single_node",
+    "schedule2": "edf_single_node",
+    "schedule3": "ll_multinode",
+    "schedule4": "ldf_multinode",
+    "schedule5": "edf_multinode",
+}
+
+with open(os.path.join(input_models_dir, "example2.json")) as f:
+    platform = compile_platform(json.load(f)["platform"])
+
+
+def layered_application(tasks, seed=0):
+    """Random application whose messages only go from lower to higher task ids."""
+    rng = random.Random(seed)
+    application = {
+        "tasks": [{"id": i, "wcet": rng.randint(1, 20), "mcet": 1, "deadline": rng.randint(50, 2000)}
+                  for i in range(tasks)],
+        "messages": [],
+    }
+    for receiver in range(8, tasks):
+        for sender in rng.sample(range(receiver - 8, receiver), 2):
+            application["messages"].append(
+                {"id": f"m{receiver}-{sender}", "sender": sender, "receiver": receiver, "size": rng.randint(1, 50)})
+    return application
+
+
+def scratch_schedules(application, communication):
+    """Schedules of the application calculated from scratch."""
+    model = compile_application(application)
+    return {key: alg.run_algorithm(name, model, platform, communication)["schedule"] for key, name in selected.items()}
+
+
+def apply(session, changes):
+    """Apply a delta and rebuild the new schedules from the previous ones and the returned changes."""
+    before = session.schedules()
+    changed = session.apply(changes)
+    schedules = {}
+    for key, value in changed.items():
+        schedules[key] = before[key]["schedule"][:value["from"]] + value["entries"]
+        assert len(schedules[key]) == value["length"]
+    assert schedules == {key: value["schedule"] for key, value in session.schedules().items()}
+    return schedules
+
+
+@pytest.mark.parametrize("communication", [False, True])
+@pytest.mark.parametrize("interval", [1, 16])
+def test_incremental_schedules(communication, interval):
+    """Test that every delta yields the schedules calculated from scratch for the edited application."""
+    application = layered_application(120)
+    session = Session(application, platform, selected, communication, interval)
+    assert {key: value["schedule"] for key, value in session.schedules().items()} == \
+        scratch_schedules(application, communication)
+
+    deltas = [
+        [{"op": "update", "task": {"id": 110, "wcet": 40}}],
+        [{"op": "update", "task": {"id": 60, "deadline": 55}}, {"op": "update", "task": {"id": 3, "mcet": 4}}],
+        [{"op": "add", "task": {"id": "new", "wcet": 5, "mcet": 1, "deadline": 900}},
+         {"op": "add", "message": {"id": "n1", "sender": 100, "receiver": "new", "size": 9}}],
+        [{"op": "update", "message": {"id": application["messages"][-5]["id"], "size": 500}}],
+        [{"op": "remove", "message": {"id": application["messages"][-1]["id"]}}],
+        [{"op": "remove", "task": {"id": 90}}],
+        [{"op": "remove", "task": {"id": 117}}, {"op": "update", "task": {"id": 20, "wcet": 1}}],
+    ]
+    for changes in deltas:
+        for change in changes:
+            kind = "task" if "task" in change else "message"
+            items = application[f"{kind}s"]
+            if change["op"] == "add":
+                items.append(dict(change[kind]))
+            elif change["op"] == "update":
+                next(item for item in items if item["id"] == change[kind]["id"]).update(change[kind])
+            else:
+                items.remove(next(item for item in items if item["id"] == change[kind]["id"]))
+                if kind == "task":
+                    application["messages"] = [message for message in application["messages"] if
+                                               change["task"]["id"] not in (message["sender"], message["receiver"])]
+        assert apply(session, changes) == scratch_schedules(application, communication)
+
+
+def test_late_edit_keeps_prefix():
+    """Test that an edit of a late job keeps the schedules up to the placement it can change."""
+    session = Session(layered_application(200), platform, selected, interval=8)
+    changed = session.apply([{"op": "update", "task": {"id": 199, "wcet": 3}}])
+    for key, value in changed.items():
+        assert value["from"] > 100 and value["length"] == 200
+
+
+def test_failed_delta_is_rolled_back():
+    """Test that a delta closing a cycle or referring to unknown ids leaves the session as it was."""
+    application = layered_application(40)
+    session = Session(application, platform, selected, interval=4)
+    before = session.schedules()
+    cycle = [{"op": "update", "task": {"id": 30, "wcet": 2}},
+             {"op": "add", "message": {"id": "back", "sender": 39, "receiver": 20, "size": 1}}]
+    with pytest.raises(ValueError, match="Cyclic dependency"):
+        session.apply(cycle)
+    with pytest.raises(ValueError, match="Unknown task"):
+        session.apply([{"op": "remove", "task": {"id": 5}}, {"op": "update", "task": {"id": 5, "wcet": 1}}])
+    duplicate = dict(application["messages"][0], receiver=2)
+    with pytest.raises(ValueError, match="not unique"):
+        session.apply([{"op": "add", "message": duplicate}])
+    assert session.schedules() == before
+    assert len(session.model) == 40
+    application["tasks"][30]["wcet"] = 2
+    assert apply(session, cycle[:1]) == scratch_schedules(application, False)
+
+
+def test_integral_floats():
+    """Test that integral floats are taken as integers and other values leave the session as it was."""
+    application = layered_application(30)
+    floats = dict(application, tasks=[dict(task, wcet=float(task["wcet"])) for task in application["tasks"]])
+    session = Session(floats, platform, selected, interval=4)
+    assert session.schedules() == Session(application, platform, selected, interval=4).schedules()
+    before = session.schedules()
+    for changes in ([{"op": "update", "task": {"id": 3, "wcet": 2.0}},
+                     {"op": "update", "task": {"id": 4, "mcet": 0.5}}],
+                    [{"op": "add", "task": {"id": "new", "wcet": 1, "mcet": 1, "deadline": 2 ** 63}}],
+                    [{"op": "update", "message": {"id": application["messages"][0]["id"], "size": "1"}}]):
+        with pytest.raises(ValueError, match="must be an integer"):
+            session.apply(changes)
+        assert session.schedules() == before
+    application["tasks"][3]["wcet"] = 2
+    assert apply(session, [{"op": "update", "task": {"id": 3, "wcet": 2.0}}]) == scratch_schedules(application, False)
+
+
+def test_shared_message_ids():
+    """Test that messages may share an id, which deltas can then neither edit nor reuse."""
+    application = layered_application(40)
+    shared = application["messages"][5]["id"]
+    application["messages"][6]["id"] = shared
+    session = Session(application, platform, selected, interval=4)
+    assert {key: value["schedule"] for key, value in session.schedules().items()} == \
+        scratch_schedules(application, False)
+    with pytest.raises(ValueError, match="shared by several messages"):
+        session.apply([{"op": "update", "message": {"id": shared, "size": 3}}])
+    with pytest.raises(ValueError, match="not unique"):
+        session.apply([{"op": "add", "message": {"id": shared, "sender": 0, "receiver": 39, "size": 1}}])
+    ## Removing the receiver drops the messages, the id stays reserved
+    receiver = application["messages"][5]["receiver"]
+    application["tasks"] = [task for task in application["tasks"] if task["id"] != receiver]
+    application["messages"] = [message for message in application["messages"]
+                               if receiver not in (message["sender"], message["receiver"])]
+    assert apply(session, [{"op": "remove", "task": {"id": receiver}}]) == scratch_schedules(application, False)
+    with pytest.raises(ValueError, match="shared by several messages"):
+        session.apply([{"op": "remove", "message": {"id": shared}}])
+
+
+def test_invalid_session():
+    """Test that duplicate ids and dangling messages are refused."""
+    application = layered_application(10)
+    with pytest.raises(ValueError, match="Task ids"):
+        Session(dict(application, tasks=application["tasks"] * 2), platform, selected)
+    dangling = {"id": "x", "sender": 1, "receiver": 42, "size": 1}
+    with pytest.raises(ValueError, match="does not connect"):
+        Session(dict(application, messages=[dangling]), platform, selected)
@@ -0,0 +1,92 @@
+import os
+import sys
+
+import pytest
+
+# Adjust path to include the 'src' directory for importing the simulation
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+import simulation as sim
+from model import compile_application
+from topology import compile_platform
+
+platform = compile_platform({
+    "nodes": [{"id": "n0", "type": "compute"}, {"id": "n1", "type": "compute"}, {"id": "r", "type": "router"}],
+    "links": [],
+})
+
+## Periods 4, 6 and 12 with a utilization of 5/6, the hyperperiod is 12
+application = {
+    "tasks": [
+        {"id": "a", "wcet": 1, "mcet": 1, "deadline": 4},
+        {"id": "b", "wcet": 2, "mcet": 1, "deadline": 6},
+        {"id": "c", "wcet": 3, "mcet": 1, "deadline": 12},
+    ],
+    "messages": [],
+}
+
+
+def stretches(entries):
+    """Schedule entries as (task, node, start, end, deadline) in the order of their start."""
+    return sorted((entry["task_id"], entry["node_id"], entry["start_time"], entry["end_time"], entry["deadline"])
+                  for entry in entries)
+
+
+def test_edf_preempts_later_deadline():
+    """Test that EDF preempts c for the second job of a and gives ties to the running job."""
+    entries = sim.simulate(compile_application(application), sim.EDF)
+    assert stretches(entries) == [
+        ("a", 0, 0, 1, 4), ("a", 0, 4, 5, 8), ("a", 0, 9, 10, 12),
+        ("b", 0, 1, 3, 6), ("b", 0, 7, 9, 12),
+        ("c", 0, 3, 4, 12), ("c", 0, 5, 7, 12),
+    ]
+
+
+def test_rms_keeps_fixed_priorities():
+    """Test that RMS preempts c whenever a or b are released."""
+    entries = sim.simulate(compile_application(application), sim.RMS)
+    assert [entry for entry in stretches(entries) if entry[0] == "c"] == [
+        ("c", 0, 3, 4, 12), ("c", 0, 5, 6, 12), ("c", 0, 9, 10, 12)]
+
+
+def test_ll_preempts_when_laxity_crosses():
+    """Test that LL switches to a waiting job once its laxity drops below that of the running job."""
+    tasks = {"tasks": [{"id": "x", "wcet": 6, "mcet": 1, "deadline": 10},
+                       {"id": "y", "wcet": 3, "mcet": 1, "deadline": 10}], "messages": []}
+    entries = sim.simulate(compile_application(tasks), sim.LL)
+    ## The laxity of a running job stays put while that of a waiting job drops, so x with laxity 4 runs until y is
+    ## down to 3 at time 4, and y with laxity 3 runs until x is down to 2 at time 6
+    assert stretches(entries) == [("x", 0, 0, 4, 10), ("x", 0, 6, 8, 10), ("y", 0, 4, 6, 10), ("y", 0, 8, 9, 10)]
+
+
+@pytest.mark.parametrize("policy", sim.POLICIES)
+def test_multinode_runs_every_job(policy):
+    """Test that every job runs for its WCET without overlapping stretches on a node."""
+    entries = stretches(sim.simulate(compile_application(application), policy, platform, horizon=48))
+    for task in application["tasks"]:
+        for deadline in range(task["deadline"], 49, task["deadline"]):
+            assert sum(end - start for task_id, _, start, end, due in entries
+                       if task_id == task["id"] and due == deadline) == task["wcet"]
+    for node in ("n0", "n1"):
+        busy = sorted((start, end) for _, node_id, start, end, _ in entries if node_id == node)
+        assert all(first[1] <= second[0] for first, second in zip(busy, busy[1:]))
+
+
+def test_run_simulation():
+    """Test the registry and the result format."""
+    result = sim.run_simulation("edf_preemptive_multinode", application, platform)
+    assert result["name"] == "Preemptive EDF Multi Node" and len(result["schedule"]) >= 6
+    assert {entry["node_id"] for entry in result["schedule"]} <= {"n0", "n1"}
+
+
+def test_invalid_simulation():
+    """Test that deadlines without a period, unknown policies and too many jobs are refused up front."""
+    model = compile_application(application)
+    assert sim.hyperperiod(model) == 12
+    with pytest.raises(ValueError, match="Unknown policy"):
+        sim.simulate(model, "fifo")
+    with pytest.raises(ValueError, match="more than 10"):
+        sim.simulate(model, sim.EDF, horizon=24, max_jobs=10)
+    with pytest.raises(ValueError, match="positive deadline"):
+        sim.simulate(compile_application(dict(application, tasks=[dict(application["tasks"][0], deadline=0)])),
+                     sim.EDF)
@@ -0,0 +1,47 @@
+import pytest
+import os
+import json
+import sys
+
+# Adjust path to include the 'src' directory for importing the validators
+script_dir = os.path.dirname(__file__)
+input_models_dir = os.path.join(script_dir, "input_models")
+src_dir = os.path.abspath(os.path.join(script_dir, "..", "src"))
+sys.path.append(src_dir)
+import jsonschema
+from validation import SchemaValidator, compile_fast_validator
+
+
+with open(os.path.join(src_dir, "input_schema.json")) as f:
+    input_validator = SchemaValidator(json.load(f))
+
+
+def load_model(filename):
+    with open(os.path.join(input_models_dir, filename)) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+def test_fast_path(filename):
+    """Test that the example models pass the fast structural check."""
+    assert input_validator.fast(load_model(filename))
+
+
+def test_fallback():
+    """Test that payloads failing the fast check are decided by jsonschema."""
+    model = load_model("example1.json")
+    model["application"]["tasks"][0]["wcet"] = 20.0
+    assert not input_validator.fast(model)
+    input_validator.validate(model)
+
+    model["application"]["tasks"][0]["wcet"] = True
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        input_validator.validate(model)
+    del model["platform"]["links"]
+    assert not input_validator.is_valid(model)
+
+
+def test_unsupported_keywords():
+    """Test that schemas outside the structural subset are not compiled."""
+    assert compile_fast_validator({"type": "integer", "minimum": 0}) is None
+    assert compile_fast_validator({"type": "array", "items": {"type": "integer"}})([1, 2])